@@ -1,8 +1,31 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
 import time
-import calendar
+import os
+import functools
+import uuid
+
+from cerasol.anomaly import DEFAULT_PARAMS, DEFAULT_THRESHOLD, flagged_days
+from cerasol.costs import (SCENARIO_PARAMS, cost_basis, cost_history, hourly_cost_breakdown, monthly_quantities,
+                           parameter_range, scenario_grid)
+from cerasol.depreciation import FIXED_LIFE, depreciation_table, sensitivity_table
+from cerasol.export import EXPORT_FORMATS, available_formats, export_bytes, export_tables
+from cerasol.incremental import IncrementalIngest
+from cerasol import runtime
+from cerasol.power import available_years, hourly_power_table
+from cerasol.prepare import REQUIRED_COLUMNS, prepare_all
+from cerasol.profiling import StageProfiler
+from cerasol.runenergy import equipment_energy
+from cerasol.refresher import BackgroundRefresher
+from cerasol.schema import rejection_summary
+from cerasol.sheets import SHEET_URLS, FetchPolicy
+from cerasol.sources import make_source
+from cerasol.store import SheetCache, SheetStore
+
+# pandas 2.x에서도 copy-on-write 사용 (pandas 3부터는 항상 사용) — 공유 데이터에서 파생한 표를 고쳐도 원본은 그대로
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 설정 (가장 먼저 실행되어야 함)
@@ -56,168 +79,244 @@ st.title("🏭 공장 운영 관리 시스템")
 # -----------------------------------------------------------------------------
 # 4. 데이터 로드 설정
 # -----------------------------------------------------------------------------
-URL_EQUIPMENT = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=0"
-URL_COOLING = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1052812012" 
-URL_POWER = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1442513579"
-URL_RUNTIME = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1281696201"
+# 로컬 저장소 위치 및 오프라인 모드 (secrets.toml의 data_dir, offline 항목)
+DATA_DIR = st.secrets.get("data_dir", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sheet_cache"))
+OFFLINE = bool(st.secrets.get("offline", False))
 
-@st.cache_data(ttl=600)
-def load_data(url):
-    try:
-        df = pd.read_csv(url, thousands=',')
-        return df
-    except Exception:
-        return None
+# 시트 주소 변경 (secrets.toml의 [sheet_urls] 표, 예: 로컬 테스트 서버) 및 제한 시간/재시도 설정 ([fetch] 표)
+URLS = {**SHEET_URLS, **dict(st.secrets.get("sheet_urls", {}))}
+FETCH_POLICY = FetchPolicy(**dict(st.secrets.get("fetch", {})))
 
-# -----------------------------------------------------------------------------
-# 5. 월별 가동시간 분할 함수
-# -----------------------------------------------------------------------------
-def split_runtime_by_month(start_dt, end_dt, total_hours):
+# 데이터 소스 (secrets.toml의 [source] 표: kind = "sheets" | "csv" | "parquet" | "sqlite", path = ...)
+SOURCE = make_source(dict(st.secrets.get("source", {})), urls=URLS, policy=FETCH_POLICY)
+
+# 단계별 소요 시간 계측 (주소에 ?profile=1 또는 secrets.toml의 profile 항목으로 켬)
+PROFILE = st.query_params.get("profile", "") in ("1", "true") or bool(st.secrets.get("profile", False))
+PROFILE_LOG = st.secrets.get("profile_log", os.path.join(DATA_DIR, "profile.jsonl"))
+st.session_state['session_id'] = st.session_state.get('session_id', uuid.uuid4().hex[:8])
+profiler = StageProfiler(enabled=PROFILE, log_path=PROFILE_LOG, session=st.session_state['session_id'])
+
+@st.cache_resource
+def get_sheet_cache():
     """
-    가동시간을 월별로 분할하는 함수
-    
-    예: 10월 25일 ~ 11월 5일, 총 264시간
-    -> 10월: 144시간 (6일 * 24h)
-    -> 11월: 120시간 (5일 * 24h)
+    서버 전체가 공유하는 시트 캐시
+    - 마지막으로 받은 시트를 로컬 Parquet 파일로 보관 (재시작 후 즉시 표시)
+    - 새로고침 주기는 get_refresher()의 백그라운드 스레드가 관리
     """
-    if pd.isna(start_dt) or pd.isna(end_dt) or total_hours <= 0:
-        return []
-    
-    # 시간을 초 단위로 변환
-    total_seconds = total_hours * 3600
-    
-    # 시작일과 종료일 사이의 전체 초
-    duration_seconds = (end_dt - start_dt).total_seconds()
-    
-    if duration_seconds <= 0:
-        return []
-    
-    # 시간당 배분 비율
-    seconds_per_hour = duration_seconds / total_hours if total_hours > 0 else 0
-    
-    results = []
-    current_date = start_dt
-    
-    while current_date < end_dt:
-        # 현재 월의 마지막 날
-        year = current_date.year
-        month = current_date.month
-        last_day = calendar.monthrange(year, month)[1]
-        month_end = datetime(year, month, last_day, 23, 59, 59)
-        
-        # 이 달에서의 종료 시점
-        period_end = min(end_dt, month_end)
-        
-        # 이 달의 가동 시간 계산 (초 단위)
-        period_seconds = (period_end - current_date).total_seconds()
-        period_hours = period_seconds / seconds_per_hour if seconds_per_hour > 0 else 0
-        
-        if period_hours > 0:
-            results.append({
-                '연': year,
-                '월': month,
-                '가동 시간': period_hours
-            })
-        
-        # 다음 달 1일로 이동
-        if month == 12:
-            current_date = datetime(year + 1, 1, 1, 0, 0, 0)
-        else:
-            current_date = datetime(year, month + 1, 1, 0, 0, 0)
-    
-    return results
+    return SheetCache(SheetStore(DATA_DIR), SOURCE.locations, max_age=600, offline=OFFLINE, fetch=SOURCE.fetch)
+
+# 누적형 로그 증분 수집 여부 (secrets.toml의 incremental 항목, 기본 사용)
+INCREMENTAL = bool(st.secrets.get("incremental", True))
+
+@st.cache_resource
+def get_ingest():
+    """서버 전체가 공유하는 증분 수집기 (냉각수/전력/가동시간)"""
+    return IncrementalIngest()
+
+def prepare_batch(batch, profiler):
+    """새로고침 스레드에서 시트 묶음을 전처리하는 함수"""
+    return prepare_all(batch.frames, ingest=get_ingest() if INCREMENTAL else None, profiler=profiler)
+
+@st.cache_resource
+def get_refresher():
+    """
+    서버 전체가 공유하는 백그라운드 새로고침 스레드
+    - 10분마다 시트를 내려받고 전처리까지 끝낸 뒤 스냅샷을 한 번에 교체
+    - 실패한 시트는 마지막으로 성공한 데이터를 보여주면서 1분 뒤 다시 시도
+    - 모든 세션이 같은 전처리 결과를 공유 (실행마다 복사본을 만들지 않음)
+    - 읽기 전용: 화면에서 가공할 때는 copy-on-write로 파생된 표만 바뀌고 공유 데이터는 그대로
+    """
+    return BackgroundRefresher(get_sheet_cache(), prepare_batch, interval=600, retry_interval=60).start()
+
+refresher = get_refresher()
+with st.spinner("시트 데이터를 불러오는 중..."):
+    with profiler.stage('load', 'snapshot') as rec:
+        snapshot = refresher.current()
+        rec['cache'] = f"v{snapshot.version}"
+batch = snapshot.batch
+data = snapshot.data
+
+# 이 세션에서 처음 보는 스냅샷이면 시트별 수신 시간과 백그라운드 전처리 기록도 추가
+if PROFILE and st.session_state.get('profiled_version') != snapshot.version:
+    st.session_state['profiled_version'] = snapshot.version
+    for name, df in batch.frames.items():
+        profiler.record('load', f'fetch:{name}', batch.latency.get(name, 0.0),
+                        rows=None if df is None else len(df), cache=batch.sources.get(name))
+    for rec in snapshot.timings:
+        profiler.record(rec['tab'], rec['stage'], rec['ms'] / 1000, rec['rows'], rec['cache'])
+    profiler.record('load', 'prepare (background)', snapshot.prepare_seconds)
+
+# 시트별 로드 상태 표시
+REJECTED_PREVIEW_ROWS = 100   # 로드 상태에 보여줄 제외 행 수 (전체 목록은 표 내보내기에 포함)
+
+with st.sidebar:
+    with st.expander("📡 데이터 로드 상태"):
+        if OFFLINE:
+            st.caption("📴 오프라인 모드: 로컬 저장소의 데이터만 사용합니다.")
+        st.caption(f"데이터 소스: {SOURCE.describe()}")
+        st.caption(f"로드 시각: {batch.fetched_at:%Y-%m-%d %H:%M:%S} · 전체 {batch.elapsed * 1000:,.0f} ms")
+        data_age = refresher.data_age()
+        if data_age is not None:
+            st.caption(f"데이터 나이: {data_age / 60:,.0f}분 · 스냅샷 v{snapshot.version}"
+                       + ("" if OFFLINE or refresher.next_refresh_at is None
+                          else f" · 다음 새로고침 {refresher.next_refresh_at:%H:%M:%S}"))
+        if refresher.last_error:
+            st.warning(f"마지막 새로고침 오류 ({refresher.last_error_at:%H:%M:%S}): {refresher.last_error}")
+        if not OFFLINE and st.button("🔄 지금 새로고침", help="다음 주기를 기다리지 않고 백그라운드에서 시트를 다시 받습니다."):
+            refresher.refresh_now()
+        st.dataframe(batch.status_table(), width='stretch', hide_index=True)
+        if len(data.rejected):
+            st.caption(f"⚠️ 스키마 검사에서 제외/빈 값 처리한 행: {data.rejected['행 번호'].count():,}건")
+            st.dataframe(rejection_summary(data.rejected), width='stretch', hide_index=True)
+            # 누적 목록 전체를 보내지 않고 최근(행 번호가 큰) 행만 표시
+            recent = data.rejected.sort_values('행 번호', ascending=False, kind='stable').head(REJECTED_PREVIEW_ROWS)
+            if len(data.rejected) > len(recent):
+                st.caption(f"최근 {len(recent):,}건만 표시합니다. 전체 목록은 '📥 표 내보내기'에 포함됩니다.")
+            st.dataframe(recent, width='stretch', hide_index=True, height=200)
+        if data.ingest_report is not None:
+            st.caption("증분 수집 결과")
+            st.dataframe(data.ingest_report, width='stretch', hide_index=True)
+        st.caption(f"메모리 사용량 (모든 세션 공유): {data.memory['메모리 (MB)'].sum():,.1f} MB")
+        st.dataframe(data.memory, column_config={'메모리 (MB)': st.column_config.NumberColumn(format="%,.2f")},
+                     width='stretch', hide_index=True)
 
 # -----------------------------------------------------------------------------
-# 6. 탭 구성
+# 5. 화면 구성
+# - 선택된 화면 하나만 계산/표시 (st.navigation)
+# - 파라미터 입력이 있는 화면은 fragment로 분리하여 입력 변경 시 해당 화면만 재실행
 # -----------------------------------------------------------------------------
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["💰 시간당 소성비용", "🏭 설비 감가상각", "💧 냉각수 관리", "⚡ 설비 전력", "⏱️ 가동 시간", "⚡ 시간당 전력"])
+PARAM_DEFAULTS = {
+    'monthly_hours': 600,
+    'elec_price': 120.0,
+    'water_price': 800.0,
+    'gas_cost_monthly': 0.0,
+    'maintenance_rate': 3.0,
+    'split_by_month': False,
+}
+
+SPLIT_HELP = "월말을 넘기는 가동을 각 달에 실제로 걸친 시간만큼 나누어 집계합니다. 끄면 가동 시작 월에 전체 가동시간을 반영합니다."
+
+# 다른 화면으로 이동했다 돌아와도 입력값 유지
+for key, value in PARAM_DEFAULTS.items():
+    st.session_state[key] = st.session_state.get(key, value)
+
+# 표 표시: Styler 대신 column_config 숫자 서식 사용
+# - 합계 행은 본문과 분리하여 바로 아래에 고정 표시
+# - 셀 강조(Styler)는 작은 표에만 적용하고, 긴 표는 페이지 단위로 전송
+STYLE_CELL_LIMIT = 1_000   # 셀 강조를 적용할 최대 셀 수
+PAGE_SIZE = 100            # 페이지당 행 수
+EQUIPMENT_PAGE_SIZE = 10   # 설비별 상세 표를 한 번에 보여줄 설비 수
+
+
+def number_formats(df, formats=None):
+    """숫자 컬럼별 column_config (기본: 천 단위 구분 정수, formats로 소수 자릿수/퍼센트 지정)"""
+    formats = formats or {}
+    config = {}
+    for col in df.columns:
+        fmt = formats.get(col, 0)
+        if fmt == '%':
+            config[col] = st.column_config.NumberColumn(format="%.1f%%")
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            config[col] = st.column_config.NumberColumn(format=f"%,.{fmt}f")
+    return config
+
+
+def page_slice(n_rows, page_size, key, label="페이지"):
+    """n_rows가 page_size보다 많으면 페이지 선택 입력을 표시하고 해당 범위(slice) 반환"""
+    if n_rows <= page_size:
+        return slice(0, n_rows)
+    n_pages = -(-n_rows // page_size)
+    page = st.number_input(f"{label} (총 {n_pages}쪽, {n_rows:,}개)", min_value=1, max_value=n_pages,
+                           value=1, step=1, key=key)
+    start = (page - 1) * page_size
+    return slice(start, min(start + page_size, n_rows))
+
+
+def show_table(df, formats=None, total=None, style=None, hide_index=False, key=None):
+    """
+    숫자 서식을 적용한 표 표시
+
+    formats: {컬럼: 소수 자릿수 또는 '%'} — 지정하지 않은 숫자 컬럼은 정수(천 단위 구분)
+    total: 합계 행 (1행 DataFrame) — 본문 아래에 별도 표로 표시
+    style: Styler를 받아 강조를 추가하는 함수 — 셀 수가 STYLE_CELL_LIMIT 이하일 때만 적용
+    key: 지정하면 PAGE_SIZE보다 긴 표를 페이지로 나누어 표시
+    """
+    config = number_formats(df, formats)
+    if key is not None:
+        df = df.iloc[page_slice(len(df), PAGE_SIZE, key)]
+
+    if style is not None and df.size <= STYLE_CELL_LIMIT:
+        st.dataframe(style(df.style), column_config=config, width='stretch', hide_index=hide_index)
+    else:
+        st.dataframe(df, column_config=config, width='stretch', hide_index=hide_index)
+
+    if total is not None:
+        st.dataframe(total, column_config=number_formats(total, formats), width='stretch',
+                     hide_index=hide_index)
+
+
+def show_anomalies(name, unit=''):
+    """
+    일별 사용량 이상일 표시 (월별 합계에서 보이지 않는 하루 단위 급증/급감)
+
+    탐지(z 계산)는 새로고침 때 전처리 단계에서 끝나 있으므로 여기서는 기준으로 거르기만 함
+    """
+    table = data.anomalies.get(name)
+    if table is None or len(table) == 0:
+        return
+    st.subheader("🚨 일별 이상 사용일")
+    threshold = st.slider(
+        "이상 기준 (|z|)", min_value=2.0, max_value=5.0, value=DEFAULT_THRESHOLD, step=0.5, key=f'anomaly_z_{name}',
+        help=f"하루 사용량이 전날까지의 {DEFAULT_PARAMS.span}일 지수가중 평균에서 표준편차의 몇 배 이상 "
+             f"벗어나면 이상일로 표시합니다 (처음 {DEFAULT_PARAMS.min_periods}일은 제외).",
+    )
+    flagged = flagged_days(table, threshold)
+    last_day = table['날짜'].iloc[-1]
+    recent = flagged[flagged['날짜'] > last_day - pd.Timedelta(days=30)]
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("이상일 (전체 기간)", f"{len(flagged):,}일")
+    c2.metric("최근 30일", f"{len(recent):,}일")
+    c3.metric("마지막 이상일", f"{flagged['날짜'].iloc[0]:%Y-%m-%d}" if len(flagged) else "-")
+
+    st.line_chart(table.set_index('날짜')[['값', '기준선']].rename(columns={'값': f'일별 사용량{unit}'}))
+    if len(flagged):
+        flagged['날짜'] = flagged['날짜'].dt.strftime('%Y-%m-%d')
+        show_table(flagged.rename(columns={'값': f'사용량{unit}'}), formats={'z': 1}, hide_index=True,
+                   key=f'anomaly_page_{name}')
+    else:
+        st.success("✅ 기준을 넘는 이상일이 없습니다.")
 
 # =============================================================================
-# [탭 1~4는 이전과 동일하므로 생략...]
+# [화면 1] 시간당 소성비용
 # =============================================================================
-with tab1:
+@st.fragment
+@profiler.view('cost')
+def view_hourly_cost():
     st.markdown("### 💰 전체 공장 시간당 소성 비용 산출")
     st.info("📌 현재 데이터(감가상각, 전력, 냉각수)를 기반으로 시간당 비용을 계산합니다. 가스비는 데이터 입력 후 추가됩니다.")
     
-    st.divider()
-    
-    # 사이드바에 입력값 배치
-    with st.sidebar:
-        st.header("⚙️ 운영 파라미터 설정")
+    # 운영 파라미터 입력 (변경 시 이 화면만 다시 계산)
+    with st.expander("⚙️ 운영 파라미터 설정", expanded=True):
+        col_p1, col_p2, col_p3, col_p4 = st.columns(4)
         
-        st.subheader("📅 가동 시간")
-        monthly_hours = st.number_input("월간 가동시간 (시간)", min_value=1, value=600, step=10, 
-                                        help="예: 25일 × 24시간 = 600시간")
-        
-        st.subheader("💵 단가 설정")
-        elec_price = st.number_input("전력 단가 (원/kWh)", min_value=0.0, value=120.0, step=1.0)
-        water_price = st.number_input("수도 단가 (원/톤)", min_value=0.0, value=800.0, step=10.0)
-        
-        st.subheader("🔥 가스비 (추후 입력)")
-        gas_cost_monthly = st.number_input("월간 가스비 (원)", min_value=0.0, value=0.0, step=10000.0,
-                                          help="가스 데이터 입력 후 사용")
-    
-    # 데이터 로드
-    df_eq = load_data(URL_EQUIPMENT)
-    df_cool = load_data(URL_COOLING)
-    df_power = load_data(URL_POWER)
+        with col_p1:
+            monthly_hours = st.number_input("📅 월간 가동시간 (시간)", min_value=1, step=10, key='monthly_hours',
+                                            help="예: 25일 × 24시간 = 600시간")
+        with col_p2:
+            elec_price = st.number_input("💵 전력 단가 (원/kWh)", min_value=0.0, step=1.0, key='elec_price')
+        with col_p3:
+            water_price = st.number_input("💵 수도 단가 (원/톤)", min_value=0.0, step=10.0, key='water_price')
+        with col_p4:
+            gas_cost_monthly = st.number_input("🔥 월간 가스비 (원)", min_value=0.0, step=10000.0, key='gas_cost_monthly',
+                                               help="가스 데이터 입력 후 사용")
     
-    # 계산 로직
-    cost_breakdown = {}
-    
-    # ① 감가상각비 (시간당)
-    if df_eq is not None:
-        req_cols_eq = ['설비코드', '설비명', '구입일자', '취득원가']
-        if all(col in df_eq.columns for col in req_cols_eq):
-            df_eq['구입일자'] = pd.to_datetime(df_eq['구입일자'], errors='coerce')
-            today = datetime.now()
-            FIXED_LIFE = 10
-            
-            def calc_yearly_dep(row):
-                if pd.isna(row['구입일자']): return 0
-                return row['취득원가'] / FIXED_LIFE
-            
-            df_eq['연간적립액'] = df_eq.apply(calc_yearly_dep, axis=1)
-            total_yearly_dep = df_eq['연간적립액'].sum()
-            monthly_dep = total_yearly_dep / 12
-            hourly_dep = monthly_dep / monthly_hours
-            cost_breakdown['감가상각비'] = hourly_dep
-    
-    # ② 전력비 (시간당)
-    if df_power is not None:
-        if '날짜' in df_power.columns and '사용량' in df_power.columns:
-            df_power['날짜'] = pd.to_datetime(df_power['날짜'], errors='coerce')
-            df_power = df_power.dropna(subset=['날짜'])
-            df_power['실제전력소비량'] = df_power['사용량'] * 80
-            
-            # 최근 월 데이터 사용
-            df_power['연월'] = df_power['날짜'].dt.to_period('M')
-            latest_month = df_power['연월'].max()
-            monthly_power = df_power[df_power['연월'] == latest_month]['실제전력소비량'].sum()
-            
-            monthly_power_cost = monthly_power * elec_price
-            hourly_power_cost = monthly_power_cost / monthly_hours
-            cost_breakdown['전력비'] = hourly_power_cost
-    
-    # ③ 냉각수비 (시간당)
-    if df_cool is not None:
-        if '날짜' in df_cool.columns and '사용량' in df_cool.columns:
-            df_cool['날짜'] = pd.to_datetime(df_cool['날짜'], errors='coerce')
-            df_cool = df_cool.dropna(subset=['날짜'])
-            
-            # 최근 월 데이터 사용
-            df_cool['연월'] = df_cool['날짜'].dt.to_period('M')
-            latest_month_cool = df_cool['연월'].max()
-            monthly_water = df_cool[df_cool['연월'] == latest_month_cool]['사용량'].sum()
-            
-            monthly_water_cost = monthly_water * water_price
-            hourly_water_cost = monthly_water_cost / monthly_hours
-            cost_breakdown['냉각수비'] = hourly_water_cost
+    st.divider()
     
-    # ④ 가스비 (시간당)
-    hourly_gas_cost = gas_cost_monthly / monthly_hours
-    if gas_cost_monthly > 0:
-        cost_breakdown['가스비'] = hourly_gas_cost
+    # 계산 로직 (감가상각비, 최근 월 전력비/냉각수비, 가스비)
+    with profiler.stage('cost', 'compute'):
+        basis = cost_basis(data, st.session_state['maintenance_rate'])
+        cost_breakdown = hourly_cost_breakdown(basis, monthly_hours, elec_price, water_price, gas_cost_monthly)
     
     # 총 시간당 비용
     total_hourly_cost = sum(cost_breakdown.values())
@@ -301,61 +400,137 @@ with tab1:
             '비율 (%)': "100.0%"
         })
         
-        st.dataframe(pd.DataFrame(detail_data), use_container_width=True, hide_index=True)
+        st.dataframe(pd.DataFrame(detail_data), width='stretch', hide_index=True)
+    
+    # 월별 시간당 비용 추이 (각 월의 실제 가동시간 기준)
+    st.markdown("---")
+    st.subheader("📈 월별 시간당 비용 추이")
+    st.caption("🔹 각 월의 전력/냉각수 사용량을 그 달 설비 가동시간 합계로 나눈 실제 시간당 비용입니다. "
+               "감가상각비는 그 달 말일에 보유 중이고 내용연수가 남은 설비 기준, 가스비는 월간 금액을 그대로 적용하며, "
+               "가동 기록이 없는 달은 제외합니다.")
+    if data.monthly.get('runtime') is None:
+        st.info("가동시간 데이터가 있어야 월별 추이를 계산할 수 있습니다.")
+    else:
+        quantities = load_cost_quantities(snapshot.version, st.session_state['split_by_month'])
+        history = cost_history(quantities, data.equipment, elec_price, water_price, gas_cost_monthly)
+        history = history.dropna(subset=['합계'])
+        history.index = history.index.strftime('%Y-%m')
+        
+        st.bar_chart(history.drop(columns=['합계', '월간가동시간']))
+        show_table(history.rename_axis('연월').reset_index(), hide_index=True, key='page_cost_history')
+    
+    # 시나리오 비교 (파라미터 범위의 모든 조합을 한 번에 계산)
+    st.markdown("---")
+    st.subheader("🧮 시나리오 비교")
+    if st.toggle("여러 조건을 한 번에 비교", key='scenario_mode',
+                 help="가동시간과 단가의 범위를 지정하면 모든 조합의 시간당 비용을 한 번에 계산합니다."):
+        view_scenarios(basis, monthly_hours, elec_price, water_price, gas_cost_monthly)
     
     # 안내 메시지
-    st.info("💡 **팁**: 왼쪽 사이드바에서 가동시간과 단가를 조정하여 시나리오별 비용을 시뮬레이션할 수 있습니다.")
+    st.info("💡 **팁**: 상단 운영 파라미터에서 가동시간과 단가를 조정하여 시나리오별 비용을 시뮬레이션할 수 있습니다.")
     
     if gas_cost_monthly == 0:
         st.warning("⚠️ 가스비 데이터가 입력되지 않았습니다. 가스 사용량 데이터 입력 후 더 정확한 비용을 산출할 수 있습니다.")
 
-with tab2:
-    st.markdown("### 설비별 감가상각 및 재구입 비용")
+@st.cache_data(max_entries=4)
+def load_cost_quantities(version, split_by_month):
+    """
+    스냅샷(version)별 월별 전력량/냉각수/가동시간
+    월별 집계는 증분 수집으로 유지되므로 새 달이 추가되어도 추가된 행만 반영된 집계에서 계산
+    """
+    return monthly_quantities(data.monthly.get('power'), data.monthly.get('cooling'),
+                              data.monthly['runtime_split' if split_by_month else 'runtime'])
+
+MAX_SCENARIOS = 500_000   # 한 번에 계산할 최대 조합 수
+
+def view_scenarios(basis, monthly_hours, elec_price, water_price, gas_cost_monthly):
+    """시나리오 비교: 파라미터별 범위 입력 -> 조합 전체 계산 -> 히트맵 + 정렬 가능한 표"""
+    # 파라미터별 (최소, 최대, 간격) 기본값: 현재 입력값 주변
+    ranges = {
+        '월간가동시간': ("📅 월간 가동시간 (시간)", max(monthly_hours - 200, 1), monthly_hours + 100, 10),
+        '전력단가': ("💵 전력 단가 (원/kWh)", max(elec_price - 40, 0.0), elec_price + 40, 5.0),
+        '수도단가': ("💵 수도 단가 (원/톤)", max(water_price - 200, 0.0), water_price + 200, 100.0),
+        '월간가스비': ("🔥 월간 가스비 (원)", gas_cost_monthly, gas_cost_monthly + 1_000_000, 250_000.0),
+    }
+    values = {}
+    for param, (label, low, high, step) in ranges.items():
+        col_l, col_min, col_max, col_step = st.columns([2, 1, 1, 1])
+        col_l.markdown(f"**{label}**")
+        low = col_min.number_input("최소", value=float(low), min_value=0.0, key=f'scenario_{param}_min')
+        high = col_max.number_input("최대", value=float(high), min_value=0.0, key=f'scenario_{param}_max')
+        step = col_step.number_input("간격", value=float(step), min_value=0.0, key=f'scenario_{param}_step')
+        values[param] = parameter_range(low, high, step)
+    values['월간가동시간'] = values['월간가동시간'][values['월간가동시간'] > 0]
     
-    # 사이드바에 유지보수 비율 설정
-    with st.sidebar:
-        st.markdown("---")
-        st.subheader("🔧 유지보수 충당금 설정")
-        maintenance_rate = st.slider(
-            "취득원가 대비 연간 유지보수 비율 (%)", 
-            min_value=0.0, 
-            max_value=10.0, 
-            value=3.0, 
-            step=0.5,
-            help="일반적으로 취득원가의 2-5%를 유지보수 비용으로 책정합니다."
-        )
+    n_scenarios = int(np.prod([len(v) for v in values.values()]))
+    if n_scenarios == 0:
+        st.warning("⚠️ 월간 가동시간 범위에 0보다 큰 값이 필요합니다.")
+        return
+    if n_scenarios > MAX_SCENARIOS:
+        st.error(f"❌ 조합이 {n_scenarios:,}개로 너무 많습니다. 간격을 늘려 {MAX_SCENARIOS:,}개 이하로 줄여 주세요.")
+        return
+    
+    with profiler.stage('cost', 'scenario_grid') as rec:
+        grid = scenario_grid(basis, *(values[param] for param in SCENARIO_PARAMS))
+        rec['rows'] = len(grid)
+    st.caption(f"🔹 {n_scenarios:,}개 조합 · 단위: 원/시간")
+    
+    # 히트맵: 가동시간 × 전력 단가 (수도 단가와 가스비는 선택한 값으로 고정)
+    st.markdown("**🗺️ 총 시간당 비용 히트맵 (가동시간 × 전력 단가)**")
+    col_w, col_g = st.columns(2)
+    water_fixed = col_w.select_slider("수도 단가 고정값", options=values['수도단가'].tolist(),
+                                      format_func=lambda v: f"{v:,.0f} 원/톤", key='scenario_water_fixed')
+    gas_fixed = col_g.select_slider("월간 가스비 고정값", options=values['월간가스비'].tolist(),
+                                    format_func=lambda v: f"{v:,.0f} 원", key='scenario_gas_fixed')
+    heat = grid[(grid['수도단가'] == water_fixed) & (grid['월간가스비'] == gas_fixed)]
+    st.vega_lite_chart(heat[['월간가동시간', '전력단가', '합계']], {
+        'mark': 'rect',
+        'encoding': {
+            'x': {'field': '월간가동시간', 'type': 'ordinal', 'title': '월간 가동시간 (h)'},
+            'y': {'field': '전력단가', 'type': 'ordinal', 'title': '전력 단가 (원/kWh)', 'sort': 'descending'},
+            'color': {'field': '합계', 'type': 'quantitative', 'title': '원/시간', 'scale': {'scheme': 'orangered'}},
+            'tooltip': [{'field': c, 'type': 'quantitative', 'format': ',.0f'}
+                        for c in ['월간가동시간', '전력단가', '합계']],
+        },
+    }, width='stretch')
+    
+    # 전체 조합 표 (정렬 기준 선택 후 페이지 단위 표시)
+    st.markdown("**📋 조합별 비용 구성**")
+    col_s, col_o = st.columns([2, 1])
+    sort_col = col_s.selectbox("정렬 기준", grid.columns.tolist(), index=len(grid.columns) - 1, key='scenario_sort')
+    ascending = col_o.toggle("오름차순", value=True, key='scenario_ascending')
+    show_table(grid.sort_values(sort_col, ascending=ascending, kind='stable'), hide_index=True, key='page_scenarios')
+
+# =============================================================================
+# [화면 2] 설비 감가상각
+# =============================================================================
+@st.fragment
+@profiler.view('depreciation')
+def view_depreciation():
+    st.markdown("### 설비별 감가상각 및 재구입 비용")
     
-    df_eq = load_data(URL_EQUIPMENT)
+    # 유지보수 비율 설정 (변경 시 이 화면만 다시 계산)
+    maintenance_rate = st.slider(
+        "🔧 취득원가 대비 연간 유지보수 비율 (%)", 
+        min_value=0.0, 
+        max_value=10.0, 
+        step=0.5,
+        key='maintenance_rate',
+        help="일반적으로 취득원가의 2-5%를 유지보수 비용으로 책정합니다."
+    )
+    # 이 화면만 다시 실행되어도 내보내기 파일에 바뀐 비율이 반영되도록 기록
+    st.session_state['export_inputs']['maintenance_rate'] = maintenance_rate
     
-    if df_eq is None:
+    if not data.loaded['equipment']:
         st.error("설비 데이터를 불러올 수 없습니다.")
     else:
-        req_cols_eq = ['설비코드', '설비명', '구입일자', '취득원가']
-        if not all(col in df_eq.columns for col in req_cols_eq):
-            st.error(f"필수 컬럼 누락: {req_cols_eq}")
+        if data.missing['equipment']:
+            st.error(f"필수 컬럼 누락: {REQUIRED_COLUMNS['equipment']}")
         else:
-            df_eq['구입일자'] = pd.to_datetime(df_eq['구입일자'], errors='coerce')
-            today = datetime.now()
-            end_of_year = datetime(today.year, 12, 31)
-            FIXED_LIFE = 10
-            
-            def calc_metrics(row):
-                if pd.isna(row['구입일자']): return pd.Series([0, 0, 0, 0, 0])
-                cost = row['취득원가']
-                dep_yearly = cost / FIXED_LIFE
-                dep_monthly = dep_yearly / 12
-                days_passed = (today - row['구입일자']).days
-                curr_val = max(cost - (dep_yearly * (days_passed / 365.0)), 0)
-                days_eoy = (end_of_year - row['구입일자']).days
-                eoy_val = max(cost - (dep_yearly * (days_eoy / 365.0)), 0)
-                
-                # 유지보수 충당금 계산
-                maintenance_yearly = cost * (maintenance_rate / 100)
-                maintenance_monthly = maintenance_yearly / 12
-                
-                return pd.Series([curr_val, eoy_val, dep_yearly, dep_monthly, maintenance_monthly])
-
-            df_eq[['현재잔액', '올해말잔가', '연간적립액', '월간감가상각비', '월간유지보수충당금']] = df_eq.apply(calc_metrics, axis=1)
+            # 설비 전체 감가상각 / 유지보수 지표 (컬럼 단위 일괄 계산)
+            with profiler.stage('depreciation', 'depreciation_table') as rec:
+                df_eq = depreciation_table(data.equipment, maintenance_rate)
+                rec['rows'] = len(df_eq)
             
             # 상단 KPI
             c1, c2, c3, c4 = st.columns(4)
@@ -381,7 +556,7 @@ with tab2:
                     '항목': ['감가상각 적립액', '유지보수 충당금', '합계'],
                     '금액': [f"{annual_dep:,.0f} 원", f"{annual_maint:,.0f} 원", f"{annual_total:,.0f} 원"]
                 })
-                st.dataframe(summary_annual, use_container_width=True, hide_index=True)
+                st.dataframe(summary_annual, width='stretch', hide_index=True)
             
             with col_sum2:
                 st.markdown("**📆 월간 소요 비용**")
@@ -393,7 +568,7 @@ with tab2:
                     '항목': ['감가상각비', '유지보수 충당금', '합계'],
                     '금액': [f"{monthly_dep:,.0f} 원", f"{monthly_maint:,.0f} 원", f"{monthly_total:,.0f} 원"]
                 })
-                st.dataframe(summary_monthly, use_container_width=True, hide_index=True)
+                st.dataframe(summary_monthly, width='stretch', hide_index=True)
             
             st.divider()
             
@@ -402,7 +577,7 @@ with tab2:
             show_df = df_eq.copy()
             show_df['구입일자'] = show_df['구입일자'].dt.strftime('%Y-%m-%d')
             
-            # 합계 행 추가
+            # 합계 행 (본문 아래에 별도 표시)
             total_row = pd.DataFrame({
                 '설비명': ['✅ 합계'],
                 '구입일자': [''],
@@ -414,38 +589,48 @@ with tab2:
                 '연간적립액': [df_eq['연간적립액'].sum()]
             })
             
-            display_df = pd.concat([
-                show_df[['설비명', '구입일자', '취득원가', '현재잔액', '올해말잔가', 
-                        '월간감가상각비', '월간유지보수충당금', '연간적립액']], 
-                total_row
-            ], ignore_index=True)
+            display_df = show_df[['설비명', '구입일자', '취득원가', '현재잔액', '올해말잔가', 
+                                  '월간감가상각비', '월간유지보수충당금', '연간적립액']]
+            
+            show_table(display_df, total=total_row, hide_index=True, key='page_depreciation')
+            
+            st.info(f"💡 **유지보수 충당금**: 취득원가의 {maintenance_rate}%를 연간 유지보수 비용으로 책정하였습니다. 상단 슬라이더에서 비율을 조정할 수 있습니다.")
+            
+            st.divider()
             
-            st.dataframe(
-                display_df.style.format(
-                    "{:,.0f}", 
-                    subset=['취득원가', '현재잔액', '올해말잔가', '월간감가상각비', '월간유지보수충당금', '연간적립액']
-                ).apply(lambda x: ['background-color: #E8F4F8' if x.name == len(display_df)-1 else '' for i in x], axis=1),
-                use_container_width=True, hide_index=True
-            )
+            # 유지보수 비율 × 내용연수 민감도 (전체 조합을 한 번에 계산)
+            st.subheader("📐 월간 비용 민감도 분석")
+            st.caption(f"🔹 행: 유지보수 비율 / 열: 내용연수 (단위: 원/월, 감가상각비 + 유지보수 충당금) · 강조 행: 현재 비율, 현재 내용연수 {FIXED_LIFE}년")
             
-            st.info(f"💡 **유지보수 충당금**: 취득원가의 {maintenance_rate}%를 연간 유지보수 비용으로 책정하였습니다. 사이드바에서 비율을 조정할 수 있습니다.")
+            with profiler.stage('depreciation', 'sensitivity_table') as rec:
+                sensitivity = sensitivity_table(data.equipment, np.arange(0.0, 10.5, 0.5), np.arange(5, 21))
+                rec['rows'] = len(sensitivity)
+            pivot_sens = sensitivity.pivot(index='유지보수비율', columns='내용연수', values='월간합계')
+            pivot_sens.index = [f"{r:.1f}%" for r in pivot_sens.index]
+            pivot_sens.columns = [f"{int(l)}년" for l in pivot_sens.columns]
+            
+            show_table(pivot_sens, style=lambda styler: styler.apply(
+                lambda x: ['background-color: #E8F4F8; font-weight: bold'
+                           if x.name == f"{maintenance_rate:.1f}%" else '' for i in x],
+                axis=1
+            ))
 
-with tab3:
+# =============================================================================
+# [화면 3] 냉각수 관리
+# =============================================================================
+@profiler.view('cooling')
+def view_cooling():
     st.markdown("### 📊 연도별 냉각수 사용량 추이")
-    df_cool = load_data(URL_COOLING)
-    
-    if df_cool is None:
+    if not data.loaded['cooling']:
         st.info("데이터 로드 실패. 링크와 GID를 확인하세요.")
     else:
-        if '날짜' not in df_cool.columns or '사용량' not in df_cool.columns:
+        if data.missing['cooling']:
              st.error("컬럼 오류: '날짜', '사용량' 컬럼이 필요합니다.")
         else:
-            df_cool['날짜'] = pd.to_datetime(df_cool['날짜'], errors='coerce')
-            df_cool = df_cool.dropna(subset=['날짜'])
-            df_cool['연도'] = df_cool['날짜'].dt.year
-            df_cool['월'] = df_cool['날짜'].dt.month
-            
-            pivot_cool = df_cool.pivot_table(index='월', columns='연도', values='사용량', aggfunc='sum')
+            # 연/월별 집계 (증분 수집으로 유지)
+            with profiler.stage('cooling', 'pivot') as rec:
+                pivot_cool = data.monthly['cooling'].pivot_table(index='월', columns='연', values='사용량', aggfunc='sum')
+                rec['rows'] = len(data.monthly['cooling'])
             pivot_cool = pivot_cool.reindex(range(1, 13), fill_value=0)
             
             years = pivot_cool.columns.tolist()
@@ -471,27 +656,29 @@ with tab3:
             table_cool.columns = new_cols
             table_cool.index = [f"{y}년" for y in table_cool.index]
             
-            st.dataframe(table_cool.style.format("{:,.0f}").highlight_max(axis=0, color='#FFDDC1'), use_container_width=True)
+            show_table(table_cool, style=lambda styler: styler.highlight_max(axis=0, color='#FFDDC1'))
+
+            st.markdown("---")
+            show_anomalies('cooling')
 
-with tab4:
+# =============================================================================
+# [화면 4] 설비 전력
+# =============================================================================
+@profiler.view('power')
+def view_power():
     st.markdown("### ⚡ 연도별 전력 사용량 추이")
     st.info("💡 표시된 값은 기계 출력치에 단위값 80을 곱한 실제 전력소비량입니다.")
     
-    df_power = load_data(URL_POWER)
-    
-    if df_power is None:
+    if not data.loaded['power']:
         st.info("설비 전력 데이터를 불러올 수 없습니다. 링크와 GID를 확인하세요.")
     else:
-        if '날짜' not in df_power.columns or '사용량' not in df_power.columns:
+        if data.missing['power']:
              st.error("컬럼 오류: '날짜', '사용량' 컬럼이 있어야 합니다.")
         else:
-            df_power['날짜'] = pd.to_datetime(df_power['날짜'], errors='coerce')
-            df_power = df_power.dropna(subset=['날짜'])
-            df_power['실제전력소비량'] = df_power['사용량'] * 80
-            df_power['연도'] = df_power['날짜'].dt.year
-            df_power['월'] = df_power['날짜'].dt.month
-            
-            pivot_power = df_power.pivot_table(index='월', columns='연도', values='실제전력소비량', aggfunc='sum')
+            # 연/월별 집계 (증분 수집으로 유지)
+            with profiler.stage('power', 'pivot') as rec:
+                pivot_power = data.monthly['power'].pivot_table(index='월', columns='연', values='실제전력소비량', aggfunc='sum')
+                rec['rows'] = len(data.monthly['power'])
             pivot_power = pivot_power.reindex(range(1, 13), fill_value=0)
             
             years_p = pivot_power.columns.tolist()
@@ -517,111 +704,50 @@ with tab4:
             table_power.columns = new_cols_p
             table_power.index = [f"{y}년" for y in table_power.index]
             
-            st.dataframe(
-                table_power.style.format("{:,.0f}").highlight_max(axis=0, color='#D4F1F4'), 
-                use_container_width=True
-            )
+            show_table(table_power, style=lambda styler: styler.highlight_max(axis=0, color='#D4F1F4'))
+
+            st.markdown("---")
+            show_anomalies('power', ' (kWh)')
 
 # =============================================================================
-# [탭 5] 가동 시간 관리 - 수정 버전
+# [화면 5] 가동 시간 관리
 # - 원본 데이터 확인과 날짜 파싱 결과 확인을 맨 아래로 이동
 # - 설비별 월별 가동시간에 연도 필터 추가
 # =============================================================================
 
-with tab5:
+@profiler.view('runtime')
+def view_runtime():
     st.markdown("### ⏱️ 설비별 가동 시간 관리")
     st.info("📌 설비명, 설비코드, 가동시간을 기준으로 월별/연도별 분석합니다.")
     
-    df_runtime = load_data(URL_RUNTIME)
-    
-    if df_runtime is None:
+    if not data.loaded['runtime']:
         st.warning("⚠️ 가동시간 데이터를 불러올 수 없습니다.")
     else:
-        # 컬럼명 공백 제거
-        df_runtime.columns = df_runtime.columns.str.strip()
-        
-        # 필수 컬럼 확인
-        required_cols = ['설비명', '설비코드', '가동 시작 일시', '가동 시간']
-        missing_cols = [col for col in required_cols if col not in df_runtime.columns]
+        missing_cols = data.missing['runtime']
         
         if missing_cols:
             st.error(f"❌ 필수 컬럼 누락: {', '.join(missing_cols)}")
-            st.info(f"현재 컬럼: {', '.join(df_runtime.columns.tolist())}")
+            st.info(f"현재 컬럼: {', '.join(data.columns['runtime'])}")
         else:
-            # 한국어 날짜 파싱 함수
-            def parse_korean_datetime(date_str):
-                """
-                '2023. 6. 28 오후 4:00:00' 형식의 한국어 날짜를 파싱
-                """
-                if pd.isna(date_str):
-                    return pd.NaT
-                
-                try:
-                    date_str = str(date_str).strip()
-                    
-                    # 오전/오후 처리
-                    is_pm = '오후' in date_str
-                    date_str = date_str.replace('오전', '').replace('오후', '').strip()
-                    
-                    # "2023. 6. 28  4:00:00" 형태로 변환됨
-                    parts = date_str.split()
-                    
-                    # 날짜 부분 파싱 (2023. 6. 28)
-                    date_parts = ' '.join(parts[:-1])  # "2023. 6. 28"
-                    time_part = parts[-1]  # "4:00:00"
-                    
-                    # 날짜에서 숫자 추출
-                    date_nums = date_parts.replace('.', ' ').split()
-                    year = int(date_nums[0])
-                    month = int(date_nums[1])
-                    day = int(date_nums[2])
-                    
-                    # 시간 파싱
-                    time_parts = time_part.split(':')
-                    hour = int(time_parts[0])
-                    minute = int(time_parts[1])
-                    second = int(time_parts[2]) if len(time_parts) > 2 else 0
-                    
-                    # 오후 처리 (12시 제외)
-                    if is_pm and hour != 12:
-                        hour += 12
-                    elif not is_pm and hour == 12:
-                        hour = 0
-                    
-                    return datetime(year, month, day, hour, minute, second)
-                
-                except Exception as e:
-                    return pd.NaT
-            
-            # 날짜 파싱 적용
-            df_runtime['가동시작_parsed'] = df_runtime['가동 시작 일시'].apply(parse_korean_datetime)
-            
-            # 연, 월 추출
-            df_runtime['연'] = df_runtime['가동시작_parsed'].dt.year
-            df_runtime['월'] = df_runtime['가동시작_parsed'].dt.month
-            
-            # 가동 시간 숫자 변환
-            df_runtime['가동 시간'] = pd.to_numeric(df_runtime['가동 시간'], errors='coerce').fillna(0)
+            # 파싱된 전체 기록 / 유효 기록 (전처리 단계에서 생성)
+            df_runtime = data.runtime
+            df_valid = data.runtime_valid
             
-            # 유효 데이터 필터링
-            df_valid = df_runtime.dropna(subset=['연', '월'])
-            df_valid = df_valid[df_valid['가동 시간'] > 0]
-            
-            # 연/월을 정수로 변환
-            df_valid['연'] = df_valid['연'].astype(int)
-            df_valid['월'] = df_valid['월'].astype(int)
+            # 설비 × 연 × 월 집계 큐브 (데이터 버전마다 한 번 생성, 아래 모든 표/차트는 큐브에서 조회)
+            split_by_month = st.toggle("📆 월 경계 분할", key='split_by_month', help=SPLIT_HELP)
+            cube = data.monthly['runtime_split' if split_by_month else 'runtime']
             
             if len(df_valid) == 0:
                 st.warning("⚠️ 유효한 가동시간 데이터가 없습니다.")
             else:
-                st.success(f"✅ {len(df_valid)}개의 유효 데이터를 분석합니다.")
+                st.success(f"✅ {int(cube['가동횟수'].sum())}개의 유효 데이터를 분석합니다.")
                 
                 st.divider()
                 
                 # ========== 1. 연도별 총 가동시간 KPI ==========
                 st.subheader("📊 연도별 총 가동시간")
                 
-                yearly_totals = df_valid.groupby('연')['가동 시간'].sum().sort_index()
+                yearly_totals = runtime.yearly_totals(cube)
                 years_list = yearly_totals.index.tolist()
                 
                 if years_list:
@@ -639,20 +765,8 @@ with tab5:
                 st.subheader("📅 연도별 월간 가동시간 총계")
                 st.caption("🔹 행: 연도 / 열: 월")
                 
-                # 피벗 테이블: 연도(행) x 월(열)
-                pivot_runtime = df_valid.pivot_table(
-                    index='연',
-                    columns='월',
-                    values='가동 시간',
-                    aggfunc='sum',
-                    fill_value=0
-                )
-                
-                # 1~12월 모두 표시
-                for month in range(1, 13):
-                    if month not in pivot_runtime.columns:
-                        pivot_runtime[month] = 0
-                pivot_runtime = pivot_runtime[sorted(pivot_runtime.columns)]
+                # 피벗 테이블: 연도(행) x 월(열, 1~12월 모두 표시)
+                pivot_runtime = runtime.year_month_table(cube)
                 
                 # 합계 컬럼 추가
                 pivot_runtime['합계'] = pivot_runtime.sum(axis=1)
@@ -664,21 +778,11 @@ with tab5:
                 # 인덱스명 변경 (2024 → 2024년)
                 pivot_runtime.index = [f"{int(y)}년" for y in pivot_runtime.index]
                 
-                # 합계 행 추가
+                # 합계 행 (본문 아래에 별도 표시)
                 total_row = pivot_runtime.sum(axis=0).to_frame().T
                 total_row.index = ['✅ 전체 합계']
                 
-                display_table = pd.concat([pivot_runtime, total_row], axis=0)
-                
-                # 스타일링 및 표시
-                st.dataframe(
-                    display_table.style.format("{:,.0f}").apply(
-                        lambda x: ['background-color: #E8F4F8; font-weight: bold' 
-                                   if x.name == '✅ 전체 합계' else '' for i in x],
-                        axis=1
-                    ),
-                    use_container_width=True
-                )
+                show_table(pivot_runtime, total=total_row)
                 
                 st.divider()
                 
@@ -695,15 +799,14 @@ with tab5:
                 st.subheader("🔧 설비별 총 가동시간")
                 
                 # 설비별 합계
-                equipment_totals = df_valid.groupby(['설비코드', '설비명'])['가동 시간'].sum().reset_index()
-                equipment_totals = equipment_totals.sort_values('가동 시간', ascending=False)
+                equipment_totals = runtime.equipment_totals(cube).rename(columns={'가동시간': '가동 시간'})
                 equipment_totals['순위'] = range(1, len(equipment_totals) + 1)
                 
                 # 표시용 데이터
                 display_eq = equipment_totals[['순위', '설비코드', '설비명', '가동 시간']].copy()
                 display_eq['비율 (%)'] = (display_eq['가동 시간'] / display_eq['가동 시간'].sum() * 100)
                 
-                # 합계 행 추가
+                # 합계 행 (본문 아래에 별도 표시)
                 total_eq = pd.DataFrame({
                     '순위': [''],
                     '설비코드': [''],
@@ -711,20 +814,9 @@ with tab5:
                     '가동 시간': [display_eq['가동 시간'].sum()],
                     '비율 (%)': [100.0]
                 })
-                display_eq = pd.concat([display_eq, total_eq], ignore_index=True)
-                
-                st.dataframe(
-                    display_eq.style.format({
-                        '가동 시간': '{:,.0f}',
-                        '비율 (%)': '{:.1f}%'
-                    }).apply(
-                        lambda x: ['background-color: #E8F4F8; font-weight: bold' 
-                                   if x.name == len(display_eq)-1 else '' for i in x],
-                        axis=1
-                    ),
-                    use_container_width=True,
-                    hide_index=True
-                )
+                
+                show_table(display_eq, formats={'비율 (%)': '%'}, total=total_eq, hide_index=True,
+                           key='page_runtime_equipment')
                 
                 st.divider()
                 
@@ -732,13 +824,7 @@ with tab5:
                 st.subheader("🏭 설비별 연도별 가동시간")
                 
                 # 설비별, 연도별 피벗
-                pivot_eq_year = df_valid.pivot_table(
-                    index=['설비코드', '설비명'],
-                    columns='연',
-                    values='가동 시간',
-                    aggfunc='sum',
-                    fill_value=0
-                )
+                pivot_eq_year = runtime.equipment_year_table(cube)
                 
                 # 합계 컬럼 추가
                 pivot_eq_year['합계'] = pivot_eq_year.sum(axis=1)
@@ -749,25 +835,14 @@ with tab5:
                 # 인덱스 리셋
                 pivot_eq_year = pivot_eq_year.reset_index()
                 
-                # 합계 행 추가
+                # 합계 행 (본문 아래에 별도 표시)
                 numeric_cols = [col for col in pivot_eq_year.columns if col not in ['설비코드', '설비명']]
                 total_values = {'설비코드': '', '설비명': '✅ 전체 합계'}
                 for col in numeric_cols:
                     total_values[col] = pivot_eq_year[col].sum()
                 
-                pivot_eq_year = pd.concat([pivot_eq_year, pd.DataFrame([total_values])], ignore_index=True)
-                
-                st.dataframe(
-                    pivot_eq_year.style.format(
-                        {col: '{:,.0f}' for col in numeric_cols}
-                    ).apply(
-                        lambda x: ['background-color: #E8F4F8; font-weight: bold' 
-                                   if x.name == len(pivot_eq_year)-1 else '' for i in x],
-                        axis=1
-                    ),
-                    use_container_width=True,
-                    hide_index=True
-                )
+                show_table(pivot_eq_year, total=pd.DataFrame([total_values]), hide_index=True,
+                           key='page_runtime_equipment_year')
                 
                 st.divider()
                 
@@ -775,8 +850,11 @@ with tab5:
                 st.subheader("📆 설비별 월별 가동시간 상세")
                 st.caption("🔹 각 설비별로 연도(행) × 월(열) 가동시간을 표시합니다.")
                 
-                # 설비 목록
-                equipment_list = df_valid.groupby(['설비코드', '설비명'])['가동 시간'].sum().reset_index()
+                # 설비 목록 및 설비별 연도 × 월 표 (큐브에서 한 번에 생성)
+                equipment_list = equipment_totals[['설비코드', '설비명', '가동 시간']].copy()
+                with profiler.stage('runtime', 'equipment_month_tables') as rec:
+                    month_tables = runtime.equipment_month_tables(cube)
+                    rec['rows'] = len(cube)
                 
                 # 지정된 순서로 정렬: 고온진공소결로, 소형진공소결로, 탈지로1, 탈지로2
                 desired_order = ['고온진공소결로', '소형진공소결로', '탈지로1', '탈지로2']
@@ -785,32 +863,22 @@ with tab5:
                 )
                 equipment_list = equipment_list.sort_values('순서')
                 
+                # 설비가 많으면 EQUIPMENT_PAGE_SIZE대씩 나누어 표시
+                equipment_page = equipment_list.iloc[
+                    page_slice(len(equipment_list), EQUIPMENT_PAGE_SIZE, 'page_runtime_detail', label="설비 페이지")
+                ]
+                
                 # 설비별로 개별 표 생성
-                for idx, eq_row in equipment_list.iterrows():
+                for idx, eq_row in equipment_page.iterrows():
                     eq_code = eq_row['설비코드']
                     eq_name = eq_row['설비명']
                     eq_total = eq_row['가동 시간']
                     
-                    # 해당 설비 데이터 필터링
-                    df_eq = df_valid[(df_valid['설비코드'] == eq_code) & (df_valid['설비명'] == eq_name)]
-                    
                     # 설비별 섹션 헤더
                     st.markdown(f"#### 🔧 {eq_name} (총 {eq_total:,.0f}시간)")
                     
-                    # 피벗 테이블: 연도(행) x 월(열)
-                    pivot_eq = df_eq.pivot_table(
-                        index='연',
-                        columns='월',
-                        values='가동 시간',
-                        aggfunc='sum',
-                        fill_value=0
-                    )
-                    
-                    # 1~12월 모두 표시
-                    for month in range(1, 13):
-                        if month not in pivot_eq.columns:
-                            pivot_eq[month] = 0
-                    pivot_eq = pivot_eq[sorted(pivot_eq.columns)]
+                    # 피벗 테이블: 연도(행) x 월(열) — 큐브 표에서 해당 설비만 잘라냄
+                    pivot_eq = month_tables.loc[(eq_code, eq_name)].copy()
                     
                     # 합계 컬럼 추가
                     pivot_eq['합계'] = pivot_eq.sum(axis=1)
@@ -821,20 +889,11 @@ with tab5:
                     # 인덱스명 변경 (2024 → 2024년)
                     pivot_eq.index = [f"{int(y)}년" for y in pivot_eq.index]
                     
-                    # 합계 행 추가
+                    # 합계 행 (본문 아래에 별도 표시)
                     total_row_eq = pivot_eq.sum(axis=0).to_frame().T
                     total_row_eq.index = ['합계']
-                    pivot_eq_display = pd.concat([pivot_eq, total_row_eq], axis=0)
                     
-                    # 스타일링 및 표시
-                    st.dataframe(
-                        pivot_eq_display.style.format("{:,.0f}").apply(
-                            lambda x: ['background-color: #E8F4F8; font-weight: bold' 
-                                       if x.name == '합계' else '' for i in x],
-                            axis=1
-                        ),
-                        use_container_width=True
-                    )
+                    show_table(pivot_eq, total=total_row_eq)
                     
                     st.markdown("---")
                 
@@ -846,13 +905,13 @@ with tab5:
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    st.metric("총 설비 수", f"{df_valid['설비명'].nunique()}개")
+                    st.metric("총 설비 수", f"{cube['설비명'].nunique()}개")
                 
                 with col2:
-                    st.metric("총 가동시간", f"{df_valid['가동 시간'].sum():,.0f} 시간")
+                    st.metric("총 가동시간", f"{cube['가동시간'].sum():,.0f} 시간")
                 
                 with col3:
-                    avg_monthly = df_valid.groupby(['연', '월'])['가동 시간'].sum().mean()
+                    avg_monthly = runtime.monthly_totals(cube).mean()
                     st.metric("월평균 가동시간", f"{avg_monthly:,.0f} 시간")
                 
                 with col4:
@@ -875,98 +934,79 @@ with tab5:
                     st.dataframe(df_valid[['설비명', '설비코드', '가동 시작 일시', '연', '월', '가동 시간']].head(10))
 
 # =============================================================================
-# [탭 6] 월별 시간당 전력 사용량 분석
+# [화면 6] 월별 시간당 전력 사용량 분석
 # 계산: 월간 전력량 ÷ 월간 가동시간 = 시간당 전력 사용량 (kWh/h)
-# 대상: 2023년, 2024년, 2025년
+# 대상: 데이터에 있는 연도 중 화면에서 선택한 기간
 # =============================================================================
 
-with tab6:
+def view_run_energy(years):
+    """소성 회차별 전력량: 일별 전력 기록을 겹친 가동시간 비율로 각 회차에 배분"""
+    st.subheader("🔥 소성 회차별 전력량")
+    # 구간 조인은 새로고침 때 전처리 단계에서 한 번 (모든 세션이 같은 결과를 공유)
+    result = data.run_energy
+    if result is None:
+        st.info("전력과 가동시간 데이터가 모두 있어야 회차별 전력량을 계산할 수 있습니다.")
+        return
+    st.caption("🔹 하루 전력량을 그날 걸쳐 있던 가동 회차에 겹친 가동시간 비율로 나누어 배분합니다. "
+               + ("전력 기록의 설비코드가 같은 가동에만 배분합니다." if result.by_equipment
+                  else "전력은 공장 전체 계량이므로 같은 날 여러 설비가 가동하면 가동시간 비율로 나눕니다."))
+    
+    runs = result.runs[result.runs['가동 시작'].dt.year.isin(list(years))]
+    measured = runs[runs['측정 구간 수'] > 0]
+    if len(measured) == 0:
+        st.info("선택한 기간에 전력 기록과 겹치는 가동 회차가 없습니다.")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("분석 회차", f"{len(measured):,}회", help=f"전력 기록이 없는 회차 {len(runs) - len(measured):,}회 제외")
+    col2.metric("회차당 평균 전력량", f"{measured['전력량'].mean():,.0f} kWh")
+    col3.metric("회차 기준 시간당 전력", f"{measured['전력량'].sum() / measured['가동 시간'].sum():,.1f} kWh/h")
+    col4.metric("미배분 전력량 (전체 기간)", f"{result.unattributed_kwh:,.0f} kWh",
+                help=f"가동이 없던 날의 전력량 · 전체 {result.total_kwh:,.0f} kWh 중 "
+                     f"{result.unattributed_kwh / result.total_kwh:.1%}" if result.total_kwh else None)
+    
+    st.write("**설비별 요약**")
+    show_table(equipment_energy(measured), formats={'회차당전력량': 0, '시간당전력': 1}, hide_index=True)
+    
+    st.write("**회차별 상세** (최근 가동부터)")
+    detail = runs.sort_values('가동 시작', ascending=False, ignore_index=True)
+    detail['가동 시작'] = detail['가동 시작'].dt.strftime('%Y-%m-%d %H:%M')
+    detail['가동 종료'] = detail['가동 종료'].dt.strftime('%Y-%m-%d %H:%M')
+    detail = detail.rename(columns={'가동 시간': '가동 시간 (h)', '전력량': '전력량 (kWh)', '시간당전력': '시간당 전력 (kWh/h)'})
+    show_table(detail, formats={'시간당 전력 (kWh/h)': 1}, hide_index=True, key='page_run_energy')
+
+@profiler.view('hourly-power')
+def view_hourly_power():
     st.markdown("### ⚡ 월별 시간당 전력 사용량 분석")
     st.info("📌 **계산식**: 시간당 전력 사용량 = 월간 전력량(kWh) ÷ 월간 가동시간(h)")
     
-    # 데이터 로드
-    df_power = load_data(URL_POWER)
-    df_runtime = load_data(URL_RUNTIME)
-    
-    if df_power is None or df_runtime is None:
+    if not data.loaded['power'] or not data.loaded['runtime']:
         st.error("⚠️ 전력 또는 가동시간 데이터를 불러올 수 없습니다.")
     else:
-        # ========== 1. 전력 데이터 처리 ==========
-        df_power.columns = df_power.columns.str.strip()
-        
-        if '날짜' not in df_power.columns or '사용량' not in df_power.columns:
+        if data.missing['power']:
             st.error("❌ 전력 데이터에 '날짜', '사용량' 컬럼이 필요합니다.")
+        elif data.missing['runtime']:
+            st.error(f"❌ 가동시간 데이터 필수 컬럼 누락: {', '.join(data.missing['runtime'])}")
         else:
-            df_power['날짜'] = pd.to_datetime(df_power['날짜'], errors='coerce')
-            df_power = df_power.dropna(subset=['날짜'])
-            df_power['실제전력소비량'] = df_power['사용량'] * 80  # 단위 변환
-            df_power['연'] = df_power['날짜'].dt.year
-            df_power['월'] = df_power['날짜'].dt.month
-            
-            # 2023, 2024, 2025년 필터링
-            df_power = df_power[df_power['연'].isin([2023, 2024, 2025])]
-            
-            # 월별 전력량 집계
-            power_monthly = df_power.groupby(['연', '월'])['실제전력소비량'].sum().reset_index()
-            power_monthly.columns = ['연', '월', '월간전력량']
-            
-            # ========== 2. 가동시간 데이터 처리 ==========
-            df_runtime.columns = df_runtime.columns.str.strip()
+            # 월 경계 분할 선택 (설비별 월별 가동시간 집계)
+            split_by_month = st.toggle("📆 월 경계 분할", key='split_by_month', help=SPLIT_HELP)
+            runtime_cube = data.monthly['runtime_split' if split_by_month else 'runtime']
             
-            # 한국어 날짜 파싱 함수
-            def parse_korean_datetime(date_str):
-                if pd.isna(date_str):
-                    return pd.NaT
-                try:
-                    date_str = str(date_str).strip()
-                    is_pm = '오후' in date_str
-                    date_str = date_str.replace('오전', '').replace('오후', '').strip()
-                    parts = date_str.split()
-                    date_parts = ' '.join(parts[:-1])
-                    time_part = parts[-1]
-                    date_nums = date_parts.replace('.', ' ').split()
-                    year = int(date_nums[0])
-                    month = int(date_nums[1])
-                    day = int(date_nums[2])
-                    time_parts = time_part.split(':')
-                    hour = int(time_parts[0])
-                    if is_pm and hour != 12:
-                        hour += 12
-                    elif not is_pm and hour == 12:
-                        hour = 0
-                    return datetime(year, month, day, hour)
-                except:
-                    return pd.NaT
-            
-            # 날짜 파싱 및 연/월 추출
-            df_runtime['가동시작_parsed'] = df_runtime['가동 시작 일시'].apply(parse_korean_datetime)
-            df_runtime['연'] = df_runtime['가동시작_parsed'].dt.year
-            df_runtime['월'] = df_runtime['가동시작_parsed'].dt.month
-            df_runtime['가동 시간'] = pd.to_numeric(df_runtime['가동 시간'], errors='coerce').fillna(0)
-            
-            # 유효 데이터 필터링
-            df_runtime = df_runtime.dropna(subset=['연', '월'])
-            df_runtime = df_runtime[df_runtime['가동 시간'] > 0]
-            df_runtime['연'] = df_runtime['연'].astype(int)
-            df_runtime['월'] = df_runtime['월'].astype(int)
-            
-            # 2023, 2024, 2025년 필터링
-            df_runtime = df_runtime[df_runtime['연'].isin([2023, 2024, 2025])]
-            
-            # 월별 가동시간 집계
-            runtime_monthly = df_runtime.groupby(['연', '월'])['가동 시간'].sum().reset_index()
-            runtime_monthly.columns = ['연', '월', '월간가동시간']
+            # 분석 기간 선택 (데이터에 있는 연도 범위)
+            years_all = available_years(data.monthly['power'], runtime_cube)
+            if len(years_all) > 1:
+                year_from, year_to = st.select_slider("📅 분석 기간", options=years_all,
+                                                      value=(years_all[0], years_all[-1]),
+                                                      format_func=lambda y: f"{y}년", key='hourly_power_years')
+            else:
+                year_from = year_to = years_all[0] if years_all else None
+            years = range(year_from, year_to + 1) if years_all else []
+            period_label = f"{year_from}-{year_to}년" if year_from != year_to else f"{year_from}년"
             
-            # ========== 3. 데이터 병합 및 시간당 전력 계산 ==========
-            df_merged = pd.merge(power_monthly, runtime_monthly, on=['연', '월'], how='outer')
-            df_merged = df_merged.fillna(0)
-            
-            # 시간당 전력 사용량 계산
-            df_merged['시간당전력'] = df_merged.apply(
-                lambda row: row['월간전력량'] / row['월간가동시간'] 
-                if row['월간가동시간'] > 0 else 0, 
-                axis=1
-            )
+            # 월별 전력량 / 가동시간 병합 및 시간당 전력 계산
+            with profiler.stage('hourly-power', 'merge') as rec:
+                power_monthly, runtime_monthly, df_merged = hourly_power_table(data.monthly['power'], runtime_cube, years)
+                rec['rows'] = len(df_merged)
             
             # 디버깅 정보
             with st.expander("🔍 데이터 처리 결과 확인"):
@@ -978,10 +1018,10 @@ with tab6:
                     st.write("**가동시간 데이터 (월별 집계)**")
                     st.dataframe(runtime_monthly)
                 st.write("**병합 결과**")
-                st.dataframe(df_merged)
+                st.dataframe(df_merged.reset_index(drop=True))
             
             if len(df_merged) == 0:
-                st.warning("⚠️ 2023-2025년 데이터가 없습니다.")
+                st.warning(f"⚠️ {period_label} 데이터가 없습니다.")
             else:
                 st.success(f"✅ {len(df_merged)}개월 데이터를 분석합니다.")
                 
@@ -1018,7 +1058,7 @@ with tab6:
                         st.metric(
                             "전체 평균",
                             f"{overall_avg:,.1f} kWh/h",
-                            help="2023-2025년 전체 평균"
+                            help=f"{period_label} 전체 평균"
                         )
                 
                 st.divider()
@@ -1037,10 +1077,7 @@ with tab6:
                 )
                 
                 # 1~12월 모두 표시
-                for month in range(1, 13):
-                    if month not in pivot_hourly.columns:
-                        pivot_hourly[month] = 0
-                pivot_hourly = pivot_hourly[sorted(pivot_hourly.columns)]
+                pivot_hourly = pivot_hourly.reindex(columns=range(1, 13), fill_value=0)
                 
                 # 연평균 컬럼 추가
                 pivot_hourly['평균'] = pivot_hourly.replace(0, pd.NA).mean(axis=1, skipna=True).fillna(0)
@@ -1063,10 +1100,8 @@ with tab6:
                     else:
                         return 'background-color: #d4edda'
                 
-                st.dataframe(
-                    pivot_hourly.style.format("{:,.1f}").applymap(highlight_values),
-                    use_container_width=True
-                )
+                show_table(pivot_hourly, formats={col: 1 for col in pivot_hourly.columns},
+                           style=lambda styler: styler.map(highlight_values))
                 
                 st.caption("🔴 500 이상 | 🟡 300~500 | 🟢 300 미만 | ⚪ 데이터 없음")
                 
@@ -1077,13 +1112,12 @@ with tab6:
                 
                 # 표시용 데이터 준비
                 display_detail = df_merged.copy()
-                display_detail = display_detail.sort_values(['연', '월'])
-                display_detail['연월'] = display_detail.apply(lambda x: f"{int(x['연'])}년 {int(x['월'])}월", axis=1)
+                display_detail['연월'] = display_detail['연'].astype(str) + '년 ' + display_detail['월'].astype(str) + '월'
                 
                 display_detail = display_detail[['연월', '월간전력량', '월간가동시간', '시간당전력']]
                 display_detail.columns = ['연월', '월간 전력량 (kWh)', '월간 가동시간 (h)', '시간당 전력 (kWh/h)']
                 
-                # 합계 행 추가
+                # 합계 행 (본문 아래에 별도 표시)
                 total_row = pd.DataFrame({
                     '연월': ['✅ 합계/평균'],
                     '월간 전력량 (kWh)': [df_merged['월간전력량'].sum()],
@@ -1092,21 +1126,8 @@ with tab6:
                                           if df_merged['월간가동시간'].sum() > 0 else 0]
                 })
                 
-                display_detail = pd.concat([display_detail, total_row], ignore_index=True)
-                
-                st.dataframe(
-                    display_detail.style.format({
-                        '월간 전력량 (kWh)': '{:,.0f}',
-                        '월간 가동시간 (h)': '{:,.0f}',
-                        '시간당 전력 (kWh/h)': '{:,.1f}'
-                    }).apply(
-                        lambda x: ['background-color: #E8F4F8; font-weight: bold' 
-                                   if x.name == len(display_detail)-1 else '' for i in x],
-                        axis=1
-                    ),
-                    use_container_width=True,
-                    hide_index=True
-                )
+                show_table(display_detail, formats={'시간당 전력 (kWh/h)': 1}, total=total_row, hide_index=True,
+                           key='page_hourly_power_detail')
                 
                 st.divider()
                 
@@ -1115,8 +1136,7 @@ with tab6:
                 
                 # 차트 데이터 준비
                 chart_df = df_merged[df_merged['시간당전력'] > 0].copy()
-                chart_df['연월'] = chart_df.apply(lambda x: f"{int(x['연'])}-{int(x['월']):02d}", axis=1)
-                chart_df = chart_df.sort_values('연월')
+                chart_df['연월'] = chart_df.index.strftime('%Y-%m')
                 
                 # 탭으로 차트 구분
                 chart_tab1, chart_tab2, chart_tab3 = st.tabs(["시간당 전력", "전력량 vs 가동시간", "연도별 비교"])
@@ -1193,3 +1213,58 @@ with tab6:
                     )
                 
                 st.info("💡 **분석 팁**: 시간당 전력 사용량이 높은 달은 설비 효율 점검이 필요할 수 있습니다.")
+                
+                st.divider()
+                
+                # ========== 9. 회차별 전력량 ==========
+                view_run_energy(years)
+
+# 표 일괄 내보내기
+# - 내려받기 버튼을 누를 때만 파일을 만듦 (화면 재실행과 별도 스레드에서 생성)
+# - 현재 스냅샷의 집계 결과와 파일을 만드는 시점의 화면 입력값(유지보수 비율, 월 경계 분할)을 사용
+#   유지보수 비율 슬라이더는 감가상각 화면 fragment 안에 있어 바꿔도 사이드바가 다시 실행되지 않으므로,
+#   입력값은 버튼에 고정하지 않고 세션별 export_inputs에 두었다가 생성할 때 읽음
+#   (생성 스레드에는 실행 컨텍스트가 없어 st.session_state를 직접 읽을 수 없음)
+export_inputs = st.session_state.setdefault('export_inputs', {})
+export_inputs.update(maintenance_rate=st.session_state['maintenance_rate'],
+                     split_by_month=st.session_state['split_by_month'])
+
+def export_file(data, fmt, inputs):
+    return export_bytes(export_tables(data, inputs['maintenance_rate'], inputs['split_by_month']), fmt)
+
+with st.sidebar:
+    with st.expander("📥 표 내보내기"):
+        export_format = st.selectbox("파일 형식", available_formats(), key='export_format',
+                                     format_func=lambda fmt: EXPORT_FORMATS[fmt][0])
+        _, export_ext, export_mime = EXPORT_FORMATS[export_format]
+        st.caption("설비별 상세 내역, 가동시간 피벗, 월별 시간당 전력, 회차별 전력량 표를 한 파일로 받습니다. "
+                   "(내려받을 때의 유지보수 비율 · 월 경계 분할 설정 기준)")
+        st.download_button(
+            "📥 내려받기",
+            data=functools.partial(export_file, data, export_format, export_inputs),
+            file_name=f"cerasol_{batch.fetched_at:%Y%m%d_%H%M}.{export_ext}",
+            mime=export_mime,
+            on_click='ignore',
+        )
+
+# -----------------------------------------------------------------------------
+# 6. 화면 전환 (선택된 화면만 실행)
+# -----------------------------------------------------------------------------
+pages = [
+    st.Page(view_hourly_cost, title="시간당 소성비용", icon="💰", url_path="cost", default=True),
+    st.Page(view_depreciation, title="설비 감가상각", icon="🏭", url_path="depreciation"),
+    st.Page(view_cooling, title="냉각수 관리", icon="💧", url_path="cooling"),
+    st.Page(view_power, title="설비 전력", icon="⚡", url_path="power"),
+    st.Page(view_runtime, title="가동 시간", icon="⏱️", url_path="runtime"),
+    st.Page(view_hourly_power, title="시간당 전력", icon="⚡", url_path="hourly-power"),
+]
+
+st.navigation(pages, position="top").run()
+
+# 계측 결과 (이번 실행의 단계별 소요 시간)
+if PROFILE:
+    profiler.flush()
+    with st.sidebar:
+        with st.expander("⏱️ 단계별 소요 시간", expanded=True):
+            st.caption(f"실행 {profiler.run_id} · 로그: {PROFILE_LOG}")
+            st.dataframe(profiler.table(), width='stretch', hide_index=True)
@@ -0,0 +1,182 @@
+"""
+탭별 계산 파이프라인 벤치마크
+
+사용법: python -m bench.bench_pipeline [--sizes 10000 100000 1000000] [--out bench_report.json]
+
+합성 시트(bench.synthetic)를 행 수별로 만들어 CSV 읽기부터 전처리, 월별 집계,
+탭별 피벗/병합, 표 표시까지 단계별 소요 시간을 측정하고 JSON 보고서로 저장합니다.
+표시 단계는 화면의 show_table 경로와 같이 숫자 컬럼 column_config를 만들고 표를 st.dataframe이
+전송하는 Arrow 바이트로 직렬화하는 비용을 측정합니다.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+from bench.synthetic import make_frames
+from cerasol import runtime
+from cerasol.anomaly import anomaly_table
+from cerasol.costs import cost_basis, hourly_cost_breakdown
+from cerasol.depreciation import depreciation_table, sensitivity_table
+from cerasol.power import hourly_power_table
+from cerasol.prepare import (PreparedData, monthly_aggregates, prepare_daily_usage, prepare_equipment,
+                             prepare_power, prepare_runtime)
+from cerasol.runenergy import run_energy
+from cerasol.schema import apply_schema, normalize_columns
+from cerasol.sheets import read_sheet
+
+
+
+class StageTimer:
+    """단계별 소요 시간과 결과 행 수 기록"""
+
+    def __init__(self, n_rows):
+        self.n_rows = n_rows
+        self.records = []
+
+    def run(self, tab, stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        seconds = time.perf_counter() - start
+        rows = len(result) if hasattr(result, '__len__') and not isinstance(result, (str, dict, tuple)) else None
+        self.records.append({'rows': self.n_rows, 'tab': tab, 'stage': stage,
+                             'seconds': round(seconds, 6), 'output_rows': rows})
+        return result
+
+
+def _to_csv_buffers(frames):
+    return {name: df.to_csv(index=False) for name, df in frames.items()}
+
+
+def _month_table(pivot):
+    """월(행) × 연(열) 피벗 -> 연(행) × 월(열) + 합계 (탭3/탭4 상세 비교표)"""
+    table = pivot.T
+    table['합계'] = table.sum(axis=1)
+    table.columns = [c if c == '합계' else f"{c}월" for c in table.columns]
+    table.index = [f"{y}년" for y in table.index]
+    return table
+
+
+def _display(table, decimals=0):
+    """show_table 경로: 숫자 컬럼 column_config + st.dataframe 전송용 Arrow 직렬화 (반환: 바이트 수)"""
+    config = {col: st.column_config.NumberColumn(format=f"%,.{decimals}f")
+              for col in table.columns if pd.api.types.is_numeric_dtype(table[col])}
+    return len(convert_pandas_df_to_arrow_bytes(table)) + len(json.dumps(config, default=str))
+
+
+def _runtime_tables(cube):
+    """탭5 표 묶음: 연도 × 월, 설비별 합계, 설비 × 연도, 설비별 연도 × 월"""
+    return (runtime.year_month_table(cube), runtime.equipment_totals(cube),
+            runtime.equipment_year_table(cube), runtime.equipment_month_tables(cube))
+
+
+def _display_equipment_tables(month_tables):
+    """설비마다 연도 × 월 표에 합계 행/열을 붙여 표시 (탭5 설비별 상세)"""
+    for key in month_tables.index.droplevel('연').unique():
+        table = month_tables.loc[key].copy()
+        table['합계'] = table.sum(axis=1)
+        table.loc['합계'] = table.sum(axis=0)
+        _display(table)
+    return month_tables
+
+
+def bench_size(n_rows, seed=0):
+    timer = StageTimer(n_rows)
+    frames = make_frames(n_rows, seed)
+    buffers = _to_csv_buffers(frames)
+
+    # 데이터 로드: CSV 읽기 -> 스키마 적용(파싱) -> 전처리 -> 월별 집계
+    raw = {name: normalize_columns(timer.run('load', f'read_csv:{name}', read_sheet, io.StringIO(text)))
+           for name, text in buffers.items()}
+    typed = {name: timer.run('load', f'schema:{name}', apply_schema, name, frame)[0]
+             for name, frame in raw.items()}
+
+    data = PreparedData()
+    data.equipment = timer.run('load', 'prepare:equipment', prepare_equipment, typed['equipment'])
+    data.cooling = timer.run('load', 'prepare:cooling', prepare_daily_usage, typed['cooling'])
+    data.power = timer.run('load', 'prepare:power', prepare_power, typed['power'])
+    data.runtime, data.runtime_valid = timer.run('load', 'prepare:runtime', prepare_runtime, typed['runtime'])
+    data.monthly.update(timer.run('load', 'aggregate:cooling', monthly_aggregates, 'cooling', data.cooling))
+    data.monthly.update(timer.run('load', 'aggregate:power', monthly_aggregates, 'power', data.power))
+    data.monthly.update(timer.run('load', 'aggregate:runtime', monthly_aggregates, 'runtime',
+                                  data.runtime, data.runtime_valid))
+
+    data.anomalies['cooling'] = timer.run('load', 'anomaly:cooling', anomaly_table, 'cooling', data.cooling)
+    data.anomalies['power'] = timer.run('load', 'anomaly:power', anomaly_table, 'power', data.power)
+    data.run_energy = timer.run('load', 'run_energy', run_energy, data.power, data.runtime_valid)
+
+    # 탭1: 시간당 비용
+    basis = timer.run('cost', 'cost_basis', cost_basis, data, 3.0)
+    timer.run('cost', 'breakdown', hourly_cost_breakdown, basis, 600, 120.0, 800.0, 0.0)
+
+    # 탭2: 감가상각 + 민감도
+    df_eq = timer.run('depreciation', 'depreciation_table', depreciation_table, data.equipment, 3.0)
+    sens = timer.run('depreciation', 'sensitivity_table', sensitivity_table, data.equipment,
+                     np.arange(0.0, 10.5, 0.5), np.arange(5, 21))
+    pivot_sens = timer.run('depreciation', 'pivot', lambda: sens.pivot(
+        index='유지보수비율', columns='내용연수', values='월간합계'))
+    timer.run('depreciation', 'display', _display, df_eq)
+    timer.run('depreciation', 'display:sensitivity', _display, pivot_sens)
+
+    # 탭3/탭4: 냉각수 / 전력 피벗
+    for tab, name, value in [('cooling', 'cooling', '사용량'), ('power', 'power', '실제전력소비량')]:
+        pivot = timer.run(tab, 'pivot', lambda: data.monthly[name].pivot_table(
+            index='월', columns='연', values=value, aggfunc='sum').reindex(range(1, 13), fill_value=0))
+        table = _month_table(pivot)
+        timer.run(tab, 'display', _display, table)
+
+    # 탭5: 가동시간 큐브 조회 + 설비별 표
+    for cube_name in ['runtime', 'runtime_split']:
+        cube = data.monthly[cube_name]
+        tables = timer.run('runtime', f'pivot:{cube_name}', _runtime_tables, cube)
+        timer.run('runtime', f'display:{cube_name}', _display_equipment_tables, tables[3])
+
+    # 탭6: 시간당 전력 병합
+    _, _, merged = timer.run('hourly_power', 'merge', hourly_power_table, data.monthly['power'], data.monthly['runtime'])
+    timer.run('hourly_power', 'display', _display, merged, 1)
+
+    return timer.records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench.bench_pipeline', description='탭별 계산 파이프라인 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='시트별 행 수 (예: 10000 100000 1000000 10000000)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='bench_report.json', help='JSON 보고서 경로')
+    args = parser.parse_args(argv)
+
+    results = []
+    for n_rows in args.sizes:
+        start = time.perf_counter()
+        records = bench_size(n_rows, args.seed)
+        results.extend(records)
+
+        by_tab = pd.DataFrame(records).groupby('tab', sort=False)['seconds'].sum()
+        summary = ' | '.join(f"{tab} {sec:7.3f}s" for tab, sec in by_tab.items())
+        print(f"{n_rows:>12,} 행 | 전체 {time.perf_counter() - start:8.2f} s | {summary}")
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'sizes': args.sizes,
+        'results': results,
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"보고서: {args.out} ({len(results)}개 측정)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
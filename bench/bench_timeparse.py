@@ -0,0 +1,58 @@
+"""
+한국어 날짜 파서 벤치마크
+
+사용법: python -m bench.bench_timeparse [행 수 ...]
+
+가동 시작 일시 형식의 합성 데이터(초 단위, 값 대부분이 고유)를 CSV로 쓴 뒤 read_csv로
+읽은 컬럼(str 자료형)과 object 자료형 컬럼에 대해 벡터화 파서의 소요 시간을 측정하고,
+행 단위 파서(탭5 기준 구현)와 결과가 모든 행에서 동일한지 확인합니다.
+"""
+import io
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench.synthetic import make_korean_timestamps
+from cerasol.timeparse import parse_korean_datetime, parse_korean_datetimes
+
+
+def _timed(values):
+    start = time.perf_counter()
+    parsed = parse_korean_datetimes(values)
+    return parsed, time.perf_counter() - start
+
+
+def run(n_rows):
+    # 시트 CSV 내보내기와 같은 경로로 읽은 컬럼
+    text = make_korean_timestamps(n_rows).to_frame().to_csv(index=False)
+    values = pd.read_csv(io.StringIO(text))['가동 시작 일시']
+
+    parsed, str_sec = _timed(values)
+    parsed_object, object_sec = _timed(values.astype(object))
+
+    # 행 단위 파서는 문자열마다 결정적이므로 고유값 기준으로 전체 행을 비교
+    uniques = values.drop_duplicates()
+    reference = pd.Series(
+        pd.to_datetime(uniques.map(parse_korean_datetime)).to_numpy(), index=uniques.to_numpy()
+    )
+    expected = reference.reindex(values.to_numpy()).to_numpy()
+    identical = bool(np.array_equal(parsed.to_numpy(), expected)
+                     and np.array_equal(parsed_object.to_numpy(), expected))
+
+    # 행 단위 apply 속도는 표본으로 추정
+    sample = values.iloc[:min(n_rows, 50_000)]
+    start = time.perf_counter()
+    sample.apply(parse_korean_datetime)
+    apply_sec = (time.perf_counter() - start) * n_rows / len(sample)
+
+    print(f"{n_rows:>12,} 행 | 벡터화 str {str_sec:7.3f} s · object {object_sec:7.3f} s "
+          f"| apply(추정) {apply_sec:8.2f} s | 고유값 {len(uniques):,} | 결과 동일: {identical}")
+    return identical
+
+
+if __name__ == '__main__':
+    sizes = [int(x) for x in sys.argv[1:]] or [100_000, 1_000_000, 5_000_000]
+    ok = all(run(n) for n in sizes)
+    sys.exit(0 if ok else 1)
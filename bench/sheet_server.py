@@ -0,0 +1,103 @@
+"""
+개발용 로컬 시트 서버 (구글 시트 CSV 내보내기 대역)
+
+사용법: python -m bench.sheet_server --dir DIR [--port 8765] [--delay 0] [--stall 0] [--fail 0] [--status 503]
+
+DIR의 <이름>.csv 파일을 http://localhost:PORT/<이름>.csv 로 제공합니다. DIR이 비어 있으면
+합성 시트(bench.synthetic)를 만들어 제공합니다. 느린 응답, 멈춘 응답, 일시 오류를 흉내 내어
+시트 수신 계층의 제한 시간/재시도/이전 데이터 유지 동작을 확인할 때 사용합니다.
+
+- --delay: 응답 시작 전 대기(초)
+- --stall: 본문 절반을 보낸 뒤 멈추는 시간(초) — 읽기 제한 시간 확인용
+- --fail: 시트별로 처음 N번의 요청에 --status 응답 — 재시도 확인용 (음수면 항상 실패)
+
+대시보드는 secrets.toml의 [sheet_urls] 표, 명령줄 도구는 --sheet-url NAME=URL로 이 서버를 가리킵니다.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bench.synthetic import make_frames
+from cerasol.sheets import SHEET_URLS
+
+
+def load_bodies(directory, n_rows=1_000):
+    """시트 이름 -> CSV 바이트 (파일이 없는 시트는 합성 데이터)"""
+    bodies = {}
+    synthetic = None
+    for name in SHEET_URLS:
+        path = os.path.join(directory, f"{name}.csv") if directory else None
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                bodies[name] = f.read()
+        else:
+            synthetic = synthetic or make_frames(n_rows)
+            bodies[name] = synthetic[name].to_csv(index=False).encode('utf-8')
+    return bodies
+
+
+def make_handler(bodies, delay=0.0, stall=0.0, fail=0, status=503):
+    requests_seen = Counter()
+    lock = threading.Lock()
+
+    class SheetHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            name = self.path.lstrip('/').split('?')[0].removesuffix('.csv')
+            if name not in bodies:
+                self.send_error(404)
+                return
+            with lock:
+                requests_seen[name] += 1
+                count = requests_seen[name]
+            if delay:
+                time.sleep(delay)
+            if fail < 0 or count <= fail:
+                self.send_error(status, f"test failure (request {count})")
+                return
+
+            body = bodies[name]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            half = len(body) // 2
+            self.wfile.write(body[:half])
+            self.wfile.flush()
+            if stall:
+                time.sleep(stall)
+            self.wfile.write(body[half:])
+
+        def log_message(self, fmt, *args):
+            sys.stderr.write(f"[sheet_server] {self.address_string()} {fmt % args}\n")
+
+    return SheetHandler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench.sheet_server', description='개발용 로컬 시트 서버')
+    parser.add_argument('--dir', help='<이름>.csv 파일 위치 (없으면 합성 데이터)')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rows', type=int, default=1_000, help='합성 시트 행 수')
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--stall', type=float, default=0.0)
+    parser.add_argument('--fail', type=int, default=0)
+    parser.add_argument('--status', type=int, default=503)
+    args = parser.parse_args(argv)
+
+    bodies = load_bodies(args.dir, args.rows)
+    handler = make_handler(bodies, args.delay, args.stall, args.fail, args.status)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), handler)
+    print(f"시트 서버: http://127.0.0.1:{args.port}/ ({', '.join(f'{n}.csv' for n in bodies)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
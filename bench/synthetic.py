@@ -0,0 +1,103 @@
+"""
+벤치마크용 합성 시트 데이터
+
+실제 구글 시트와 같은 컬럼 구성(설비 대장, 냉각수, 전력, 가동 기록)으로
+원하는 행 수만큼 데이터를 만듭니다. 값은 pd.read_csv(thousands=',')로 읽은 직후의
+원본 시트와 같은 형태입니다 (날짜는 문자열, 가동 시작 일시는 한국어 오전/오후 형식).
+"""
+import numpy as np
+import pandas as pd
+
+EQUIPMENT_NAMES = ['고온진공소결로', '소형진공소결로', '탈지로1', '탈지로2']
+
+PERIOD_START = pd.Timestamp('2023-01-01')
+PERIOD_DAYS = 3 * 365
+
+
+def make_korean_timestamps(n_rows, seed=0):
+    """
+    '2023. 6. 28 오후 4:00:00' 형식의 가동 시작 일시 n_rows개 생성
+
+    5년 범위의 초 단위 시각이라 값 대부분이 서로 다름 (고유값 중복 제거의 이점이 거의 없는 조건)
+    """
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp('2021-01-01')
+    seconds = rng.integers(0, 5 * 365 * 86400, n_rows)
+    ts = base + pd.to_timedelta(seconds, unit='s')
+    return format_korean_timestamps(ts, name='가동 시작 일시')
+
+
+def format_korean_timestamps(ts, name=None):
+    """DatetimeIndex -> 'YYYY. M. D 오전/오후 h:mm:ss' 문자열 Series"""
+    hour = ts.hour.to_numpy()
+    ampm = np.where(hour >= 12, '오후', '오전')
+    hour12 = hour % 12
+    hour12[hour12 == 0] = 12
+
+    return pd.Series(
+        pd.Series(ts.year.astype(str)) + '. ' + pd.Series(ts.month.astype(str)) + '. '
+        + pd.Series(ts.day.astype(str)) + ' ' + ampm + ' ' + pd.Series(hour12.astype(str)) + ':'
+        + pd.Series(ts.minute).map('{:02d}'.format) + ':' + pd.Series(ts.second).map('{:02d}'.format),
+        name=name
+    )
+
+
+def equipment_count(n_rows):
+    """행 수에 비례한 설비 수 (최소 실제 설비 4대, 최대 1,000대)"""
+    return int(min(max(len(EQUIPMENT_NAMES), n_rows // 10_000), 1_000))
+
+
+def make_equipment(n_equipment, seed=0):
+    """설비 대장: 설비코드, 설비명, 구입일자, 취득원가 (구입일자 일부는 빈 값)"""
+    rng = np.random.default_rng(seed)
+    names = EQUIPMENT_NAMES + [f"설비{i + 1}" for i in range(len(EQUIPMENT_NAMES), n_equipment)]
+    purchase = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 10 * 365, n_equipment), unit='D')
+    purchase = pd.Series(purchase.strftime('%Y-%m-%d'))
+    purchase[rng.random(n_equipment) < 0.05] = None
+    return pd.DataFrame({
+        '설비코드': [f"E{i + 1}" for i in range(n_equipment)],
+        '설비명': names[:n_equipment],
+        '구입일자': purchase,
+        '취득원가': rng.integers(10, 500, n_equipment) * 1_000_000,
+    })
+
+
+def make_daily_usage(n_rows, low, high, seed=0):
+    """냉각수/전력 사용량: 날짜(YYYY-MM-DD), 사용량 — 날짜순으로 쌓이는 누적형 로그"""
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, PERIOD_DAYS, n_rows))
+    dates = PERIOD_START + pd.to_timedelta(days, unit='D')
+    return pd.DataFrame({
+        '날짜': dates.strftime('%Y-%m-%d'),
+        '사용량': rng.integers(low, high, n_rows),
+    })
+
+
+def make_runtime(n_rows, equipment, seed=0):
+    """가동 기록: 설비명, 설비코드, 가동 시작 일시, 가동 시간 (시작 일시순)"""
+    rng = np.random.default_rng(seed)
+    eq = rng.integers(0, len(equipment), n_rows)
+    minutes = np.sort(rng.integers(0, PERIOD_DAYS * 24 * 60, n_rows))
+    start = PERIOD_START + pd.to_timedelta(minutes, unit='m')
+    return pd.DataFrame({
+        '설비명': equipment['설비명'].to_numpy()[eq],
+        '설비코드': equipment['설비코드'].to_numpy()[eq],
+        '가동 시작 일시': format_korean_timestamps(start).to_numpy(),
+        '가동 시간': rng.integers(5, 300, n_rows),
+    })
+
+
+def make_frames(n_rows, seed=0):
+    """
+    네 개 시트 묶음 생성
+
+    n_rows: 냉각수/전력/가동 기록 각각의 행 수 (설비 수는 equipment_count 참고)
+    반환: {'equipment', 'cooling', 'power', 'runtime': DataFrame}
+    """
+    equipment = make_equipment(equipment_count(n_rows), seed)
+    return {
+        'equipment': equipment,
+        'cooling': make_daily_usage(n_rows, 5, 50, seed + 1),
+        'power': make_daily_usage(n_rows, 1, 20, seed + 2),
+        'runtime': make_runtime(n_rows, equipment, seed + 3),
+    }
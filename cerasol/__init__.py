@@ -0,0 +1,5 @@
+"""
+공장 운영 관리 시스템 계산 모듈
+
+Streamlit 화면(app.py)과 분리된 데이터 로드/계산 함수들을 모아둔 패키지입니다.
+"""
@@ -0,0 +1,125 @@
+"""
+대시보드 없이 계산만 실행하는 명령줄 도구
+
+사용법: python -m cerasol [--data-dir DIR] [--offline] [--out DIR] [--monthly-hours 600] ...
+
+시트를 내려받거나(또는 로컬 저장소에서 읽어) 대시보드와 같은 계산을 수행하고,
+시간당 비용/감가상각/월별 가동시간/시간당 전력 표를 CSV로 저장합니다.
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from cerasol.costs import cost_basis, hourly_cost_breakdown
+from cerasol.depreciation import depreciation_table
+from cerasol.power import hourly_power_table
+from cerasol.prepare import prepare_all
+from cerasol.sheets import SHEET_URLS, FetchPolicy
+from cerasol.sources import SOURCE_KINDS, make_source
+from cerasol.store import SheetCache, SheetStore
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cerasol', description='공장 운영 지표 일괄 계산')
+    parser.add_argument('--data-dir', help='시트 Parquet 저장소 위치 (지정하지 않으면 구글 시트에서 직접 받음)')
+    parser.add_argument('--offline', action='store_true', help='네트워크 없이 --data-dir 저장소만 사용')
+    parser.add_argument('--source', choices=SOURCE_KINDS, default='sheets', help='데이터 소스 (기본: sheets)')
+    parser.add_argument('--source-path', help='csv/parquet 디렉터리 또는 SQLite 파일 경로')
+    parser.add_argument('--sheet-url', action='append', default=[], metavar='NAME=URL',
+                        help='시트 주소 변경 (예: power=http://localhost:8765/power.csv, 여러 번 지정 가능)')
+    parser.add_argument('--timeout', type=float, default=FetchPolicy.read_timeout, help='시트 읽기 제한 시간 (초)')
+    parser.add_argument('--retries', type=int, default=FetchPolicy.retries, help='시트별 재시도 횟수')
+    parser.add_argument('--out', default='out', help='CSV 저장 위치 (기본: out)')
+    parser.add_argument('--monthly-hours', type=float, default=600, help='월간 가동시간 (시간)')
+    parser.add_argument('--elec-price', type=float, default=120.0, help='전력 단가 (원/kWh)')
+    parser.add_argument('--water-price', type=float, default=800.0, help='수도 단가 (원/톤)')
+    parser.add_argument('--gas-cost-monthly', type=float, default=0.0, help='월간 가스비 (원)')
+    parser.add_argument('--maintenance-rate', type=float, default=3.0, help='연간 유지보수율 (%%)')
+    parser.add_argument('--split-by-month', action='store_true', help='월 경계에서 가동시간 분할')
+    args = parser.parse_args(argv)
+    if args.offline and not args.data_dir:
+        parser.error('--offline에는 --data-dir이 필요합니다.')
+    if args.source != 'sheets' and not args.source_path:
+        parser.error(f"--source {args.source}에는 --source-path가 필요합니다.")
+    args.urls = dict(SHEET_URLS)
+    for item in args.sheet_url:
+        name, sep, url = item.partition('=')
+        if not sep or name not in SHEET_URLS:
+            parser.error(f"--sheet-url 형식: NAME=URL (NAME: {', '.join(SHEET_URLS)})")
+        args.urls[name] = url
+    return args
+
+
+def load_batch(args):
+    """저장소 지정 시 대시보드와 같은 캐시 경로로, 아니면 데이터 소스에서 직접 읽기"""
+    policy = FetchPolicy(read_timeout=args.timeout, retries=args.retries)
+    source = make_source({'kind': args.source, 'path': args.source_path}, urls=args.urls, policy=policy)
+    if args.data_dir:
+        return SheetCache(SheetStore(args.data_dir), source.locations, offline=args.offline,
+                          fetch=source.fetch).snapshot()
+    return source.fetch()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    batch = load_batch(args)
+    for name, error in batch.errors.items():
+        print(f"⚠️ {name} 시트 로드 실패: {error}", file=sys.stderr)
+
+    data = prepare_all(batch.frames)
+    os.makedirs(args.out, exist_ok=True)
+
+    def save(df, filename):
+        path = os.path.join(args.out, filename)
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        print(f"  {path} ({len(df):,}행)")
+
+    print(f"데이터 시각: {batch.fetched_at:%Y-%m-%d %H:%M:%S}")
+    print("저장:")
+
+    # 시간당 비용
+    basis = cost_basis(data, args.maintenance_rate)
+    cost_breakdown = hourly_cost_breakdown(basis, args.monthly_hours, args.elec_price,
+                                           args.water_price, args.gas_cost_monthly)
+    total_hourly_cost = sum(cost_breakdown.values())
+    save(pd.DataFrame({'비용항목': list(cost_breakdown), '시간당 (원)': list(cost_breakdown.values())}),
+         'hourly_cost.csv')
+
+    # 감가상각
+    if data.equipment is not None:
+        save(depreciation_table(data.equipment, args.maintenance_rate), 'depreciation.csv')
+
+    # 월별 가동시간 / 시간당 전력
+    runtime_cube = data.monthly.get('runtime_split' if args.split_by_month else 'runtime')
+    if runtime_cube is not None:
+        save(runtime_cube, 'runtime_monthly.csv')
+    hourly_power = None
+    if runtime_cube is not None and data.monthly.get('power') is not None:
+        _, _, hourly_power = hourly_power_table(data.monthly['power'], runtime_cube)
+        save(hourly_power, 'hourly_power.csv')
+
+    # 소성 회차별 전력량
+    if data.run_energy is not None:
+        save(data.run_energy.runs, 'run_energy.csv')
+
+    # 스키마 검사에서 제외/빈 값 처리한 행
+    if len(data.rejected):
+        save(data.rejected, 'rejected_rows.csv')
+        print(f"⚠️ 스키마 검사에서 제외/빈 값 처리한 행 {len(data.rejected):,}건 (rejected_rows.csv)", file=sys.stderr)
+
+    print("\n시간당 소성 비용:")
+    for item, cost in cost_breakdown.items():
+        print(f"  {item}: {cost:,.0f} 원/시간")
+    print(f"  합계: {total_hourly_cost:,.0f} 원/시간")
+    if hourly_power is not None:
+        valid = hourly_power[hourly_power['월간가동시간'] > 0]
+        if len(valid):
+            overall = valid['월간전력량'].sum() / valid['월간가동시간'].sum()
+            print(f"시간당 전력 (전체 평균): {overall:,.1f} kWh/h")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
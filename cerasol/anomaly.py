@@ -0,0 +1,121 @@
+"""
+일별 사용량 이상치 탐지 (냉각수, 전력)
+
+월별 합계에서는 한 달 안의 급증/급감이 보이지 않으므로, 날짜별 사용량 합계를
+지수가중 이동평균(EWMA)과 이동분산으로 추적하고 그날 값이 전날까지의 기준선에서
+몇 표준편차 벗어났는지(z)를 기록합니다. 화면에서는 |z|가 기준 이상인 날을 이상일로 표시합니다.
+
+EWMA는 adjust=False 점화식(m_t = (1-a)·m_(t-1) + a·x_t)이라 마지막 행의 평균/제곱평균만
+있으면 이어서 계산할 수 있습니다. 새로고침마다 전체 이력을 다시 계산하지 않고,
+새로 들어온 행의 가장 이른 날짜부터만 다시 계산합니다 (update_anomalies).
+모든 계산은 pandas ewm/NumPy 벡터 연산이며 날짜 수에 비례합니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# 시트 이름 -> 이상치를 탐지할 값 컬럼 (전력은 단위 변환한 실제 전력소비량)
+VALUE_COLUMNS = {'cooling': '사용량', 'power': '실제전력소비량'}
+
+ANOMALY_COLUMNS = ['날짜', '값', '기준선', '표준편차', 'z']
+# 이어서 계산할 때 쓰는 상태 (그날까지 반영한 EWMA 평균, 제곱 평균, 관측 일수)
+STATE_COLUMNS = ['_평균', '_제곱평균', '_일수']
+
+
+@dataclass(frozen=True)
+class AnomalyParams:
+    """
+    span: EWMA 기간 (일) — alpha = 2 / (span + 1)
+    min_periods: 기준선을 믿기 위한 최소 관측 일수 (이전 일수가 이보다 적으면 z를 계산하지 않음)
+    std_floor: 표준편차 하한 (기준선 대비 비율) — 거의 일정한 구간에서 작은 변동이 이상으로 잡히지 않도록
+    """
+    span: int = 28
+    min_periods: int = 14
+    std_floor: float = 0.05
+
+    @property
+    def alpha(self):
+        return 2 / (self.span + 1)
+
+
+DEFAULT_PARAMS = AnomalyParams()
+DEFAULT_THRESHOLD = 3.0   # 화면의 기본 이상 기준 (|z|)
+
+
+def daily_totals(prepared, value_col):
+    """전처리된 일별 사용량 -> 날짜별 합계 (같은 날 여러 행은 합산, 날짜순)"""
+    days = prepared['날짜'].dt.normalize()
+    totals = prepared[value_col].astype('float64').groupby(days, sort=True).sum()
+    return pd.DataFrame({'날짜': totals.index, '값': totals.to_numpy()})
+
+
+def _ewm(values, alpha, start=None):
+    """adjust=False EWMA (start: 앞 구간 마지막 EWMA 값 — 있으면 그 값에서 이어서 계산)"""
+    series = pd.Series(values if start is None else np.concatenate([[start], values]))
+    result = series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return result if start is None else result[1:]
+
+
+def detect_anomalies(daily, params=DEFAULT_PARAMS, prior=None):
+    """
+    날짜별 합계의 z 점수 계산
+
+    daily: daily_totals 결과 (날짜순)
+    prior: 이 구간 바로 앞까지의 탐지 결과 (있으면 마지막 행의 상태에서 이어서 계산)
+    반환: DataFrame[ANOMALY_COLUMNS + STATE_COLUMNS]
+    """
+    values = daily['값'].to_numpy(dtype='float64')
+    if len(values) == 0:
+        return pd.DataFrame({col: pd.Series(dtype='datetime64[ns]' if col == '날짜' else 'float64')
+                             for col in ANOMALY_COLUMNS + STATE_COLUMNS})
+    last = prior.iloc[-1] if prior is not None and len(prior) else None
+    start_mean, start_sq, start_n = (None, None, 0) if last is None else \
+        (last['_평균'], last['_제곱평균'], int(last['_일수']))
+
+    mean = _ewm(values, params.alpha, start_mean)
+    mean_sq = _ewm(values ** 2, params.alpha, start_sq)
+    days = start_n + np.arange(1, len(values) + 1)
+
+    # 그날 값은 자기 기준선에 넣지 않음: 전날까지의 평균/분산과 비교
+    base = np.concatenate([[np.nan if last is None else start_mean], mean[:-1]])
+    base_sq = np.concatenate([[np.nan if last is None else start_sq], mean_sq[:-1]])
+    std = np.sqrt(np.clip(base_sq - base ** 2, 0, None))
+    std = np.maximum(std, params.std_floor * np.abs(base))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where((days - 1 >= params.min_periods) & (std > 0), (values - base) / std, np.nan)
+
+    return pd.DataFrame({
+        '날짜': daily['날짜'].to_numpy(), '값': values, '기준선': base, '표준편차': std, 'z': z,
+        '_평균': mean, '_제곱평균': mean_sq, '_일수': days,
+    })
+
+
+def anomaly_table(name, prepared, params=DEFAULT_PARAMS):
+    """시트 전체 이력의 탐지 결과"""
+    return detect_anomalies(daily_totals(prepared, VALUE_COLUMNS[name]), params)
+
+
+def update_anomalies(name, previous, prepared, since, params=DEFAULT_PARAMS):
+    """
+    새 행이 추가된 뒤의 탐지 결과
+
+    previous: 이전 탐지 결과, prepared: 새 행까지 포함한 전처리 전체 행
+    since: 새 행의 가장 이른 날짜 — 그 전 날짜의 결과는 그대로 두고 since부터만 다시 계산
+           (같은 날 행이 늘어도, 과거 날짜 행이 뒤늦게 들어와도 결과는 전체 재계산과 같음)
+    """
+    if previous is None or since is None or pd.isna(since):
+        return previous if previous is not None else anomaly_table(name, prepared, params)
+    since = pd.Timestamp(since).normalize()
+    kept = previous[previous['날짜'] < since]
+    tail = daily_totals(prepared[prepared['날짜'] >= since], VALUE_COLUMNS[name])
+    return pd.concat([kept, detect_anomalies(tail, params, prior=kept)], ignore_index=True)
+
+
+def flagged_days(table, threshold=DEFAULT_THRESHOLD):
+    """|z|가 threshold 이상인 날 (최근 날짜부터, 상태 컬럼 제외)"""
+    if table is None or len(table) == 0:
+        return pd.DataFrame(columns=ANOMALY_COLUMNS + ['구분'])
+    flagged = table.loc[table['z'].abs() >= threshold, ANOMALY_COLUMNS]
+    flagged = flagged.assign(구분=np.where(flagged['z'] > 0, '급증', '급감'))
+    return flagged.sort_values('날짜', ascending=False, ignore_index=True)
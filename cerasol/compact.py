@@ -0,0 +1,72 @@
+"""
+전처리 결과의 메모리 절약형 자료형
+
+서버 전체가 공유하는 전처리 결과를 작은 자료형으로 보관합니다.
+- 설비코드/설비명: category (설비 수만큼의 문자열 + 행별 정수 코드)
+- 연/월: int16 / int8 (결측이 있는 컬럼은 그대로 둠)
+- 실수 컬럼: float32로 바꿔도 값이 그대로인 경우에만 float32
+
+정수 측정값(사용량, 실제전력소비량 등)은 합계가 넘치지 않도록 int64를 유지합니다.
+월별 집계는 압축 전 값으로 계산하므로 집계 결과는 압축 여부와 관계없이 같습니다.
+"""
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ['설비코드', '설비명']
+SMALL_INT_COLUMNS = {'연': 'int16', '월': 'int8'}
+
+
+def _is_lossless_float32(values):
+    as32 = values.astype(np.float32)
+    return np.array_equal(as32.astype(values.dtype), values, equal_nan=True)
+
+
+def compact_frame(df):
+    """자료형을 줄인 새 DataFrame 반환 (None이면 None, 이미 압축된 컬럼은 그대로)"""
+    if df is None:
+        return None
+    changes = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if col in CATEGORY_COLUMNS:
+            if not isinstance(dtype, pd.CategoricalDtype):
+                changes[col] = 'category'
+        elif col in SMALL_INT_COLUMNS and pd.api.types.is_integer_dtype(dtype):
+            changes[col] = SMALL_INT_COLUMNS[col]
+        elif dtype == np.float64 and _is_lossless_float32(df[col].to_numpy()):
+            changes[col] = 'float32'
+    return df.astype(changes) if changes else df
+
+
+def concat_compact(frames):
+    """
+    압축된 표 이어 붙이기
+
+    범주형 컬럼은 범주를 합친 뒤 붙여 범주형을 유지합니다
+    (그대로 pd.concat하면 범주가 다른 컬럼은 문자열(object)로 풀림).
+    """
+    frames = [df for df in frames if df is not None]
+    if not frames:
+        return None
+    frames = [df.copy(deep=False) for df in frames]
+    for col in frames[0].columns:
+        if not all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames if col in df):
+            continue
+        categories = frames[0][col].cat.categories
+        for df in frames[1:]:
+            categories = categories.union(df[col].cat.categories, sort=False)
+        for df in frames:
+            df[col] = df[col].cat.set_categories(categories)
+    return pd.concat(frames)
+
+
+def memory_report(frames):
+    """
+    표별 메모리 사용량
+
+    frames: {이름: DataFrame 또는 None}
+    반환: 항목, 행 수, 메모리 (MB) 컬럼의 표
+    """
+    rows = [{'항목': name, '행 수': len(df), '메모리 (MB)': df.memory_usage(deep=True).sum() / 2**20}
+            for name, df in frames.items() if df is not None]
+    return pd.DataFrame(rows, columns=['항목', '행 수', '메모리 (MB)'])
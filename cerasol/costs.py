@@ -0,0 +1,155 @@
+"""
+시간당 소성 비용 계산
+
+감가상각비, 전력비, 냉각수비, 가스비를 월간 가동시간으로 나누어 시간당 비용을 구합니다.
+데이터에서 뽑는 월간 기준량(cost_basis)과 단가/가동시간을 곱하는 단계(hourly_cost_breakdown)를
+나누어, 같은 기준량으로 여러 조건을 빠르게 다시 계산할 수 있습니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from cerasol.depreciation import FIXED_LIFE, depreciation_table, monthly_depreciation_history
+from cerasol.prepare import monthly_series
+
+COST_ITEMS = ['감가상각비', '전력비', '냉각수비', '가스비']
+
+
+@dataclass
+class CostBasis:
+    """시간당 비용 계산에 쓰는 월간 기준량 (해당 데이터가 없으면 None)"""
+    monthly_depreciation: float = None   # 월간 감가상각비 (원, 월별 추이에서는 월별 배열)
+    monthly_power_kwh: float = None      # 최근 월 전력소비량 (kWh)
+    monthly_water_ton: float = None      # 최근 월 냉각수 사용량 (톤)
+    power_month: str = None              # 전력 기준 월 (YYYY-MM)
+    water_month: str = None              # 냉각수 기준 월 (YYYY-MM)
+
+
+def _latest_month(monthly, value_col):
+    """월별 집계에서 가장 최근 월의 값과 'YYYY-MM' 라벨"""
+    if monthly is None or len(monthly) == 0:
+        return 0.0, None
+    last = monthly.sort_values(['연', '월']).iloc[-1]
+    return float(last[value_col]), f"{int(last['연'])}-{int(last['월']):02d}"
+
+
+def cost_basis(data, maintenance_rate=0.0):
+    """전처리된 데이터(PreparedData)에서 월간 기준량 추출 (전력/냉각수는 최근 월 기준)"""
+    basis = CostBasis()
+    if data.equipment is not None:
+        yearly_dep = depreciation_table(data.equipment, maintenance_rate)['연간적립액'].sum()
+        basis.monthly_depreciation = float(yearly_dep) / 12
+    if data.power is not None:
+        basis.monthly_power_kwh, basis.power_month = _latest_month(data.monthly.get('power'), '실제전력소비량')
+    if data.cooling is not None:
+        basis.monthly_water_ton, basis.water_month = _latest_month(data.monthly.get('cooling'), '사용량')
+    return basis
+
+
+def monthly_costs(basis, elec_price, water_price, gas_cost_monthly):
+    """
+    항목별 월간 비용 (원/월) — 단가에 배열을 넘기면 배열끼리 브로드캐스트
+
+    반환: {비용항목: 월간 비용} — 데이터가 없는 항목은 제외
+    """
+    costs = {}
+    if basis.monthly_depreciation is not None:
+        costs['감가상각비'] = basis.monthly_depreciation
+    if basis.monthly_power_kwh is not None:
+        costs['전력비'] = basis.monthly_power_kwh * elec_price
+    if basis.monthly_water_ton is not None:
+        costs['냉각수비'] = basis.monthly_water_ton * water_price
+    costs['가스비'] = gas_cost_monthly
+    return costs
+
+
+def hourly_cost_breakdown(basis, monthly_hours, elec_price, water_price, gas_cost_monthly=0.0):
+    """
+    항목별 시간당 비용 (원/시간)
+
+    반환: {비용항목: 시간당 비용} — 데이터가 없는 항목과 입력되지 않은 가스비는 제외
+    """
+    costs = monthly_costs(basis, elec_price, water_price, gas_cost_monthly)
+    if gas_cost_monthly <= 0:
+        del costs['가스비']
+    return {item: cost / monthly_hours for item, cost in costs.items()}
+
+
+SCENARIO_PARAMS = ['월간가동시간', '전력단가', '수도단가', '월간가스비']
+
+
+def parameter_range(start, stop, step):
+    """start부터 stop까지(포함) step 간격의 값 (step이 0 이하이거나 범위가 한 점이면 start 하나)"""
+    if step <= 0 or stop <= start:
+        return np.array([float(start)])
+    n = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return start + step * np.arange(n)
+
+
+def scenario_grid(basis, monthly_hours, elec_prices, water_prices, gas_costs):
+    """
+    운영 파라미터 조합 전체의 시간당 비용 (한 번의 배열 연산)
+
+    각 인자는 값 목록이며, 모든 조합(곱집합)에 대해 monthly_costs를 브로드캐스트로 계산합니다.
+    반환: 월간가동시간, 전력단가, 수도단가, 월간가스비, 항목별 시간당 비용, 합계 컬럼의 표
+    """
+    axes = [np.asarray(v, dtype=float) for v in (monthly_hours, elec_prices, water_prices, gas_costs)]
+    hours, elec, water, gas = np.meshgrid(*axes, indexing='ij')
+    hours, elec, water, gas = hours.ravel(), elec.ravel(), water.ravel(), gas.ravel()
+
+    grid = pd.DataFrame(dict(zip(SCENARIO_PARAMS, [hours, elec, water, gas])))
+    total = np.zeros(len(grid))
+    for item, cost in monthly_costs(basis, elec, water, gas).items():
+        grid[item] = np.broadcast_to(cost, hours.shape) / hours
+        total += grid[item].to_numpy()
+    grid['합계'] = total
+    return grid
+
+
+def monthly_quantities(power_monthly, cooling_monthly, runtime_cube):
+    """
+    월별 비용 기준량 (연월 PeriodIndex)
+
+    power_monthly / cooling_monthly: 연/월별 전력(실제전력소비량) / 냉각수(사용량) 집계
+    runtime_cube: 설비/연/월별 가동시간 큐브 — 설비를 합산한 실제 월간 가동시간으로 사용
+    반환: 월간전력량, 냉각수사용량, 월간가동시간 컬럼 (해당 월 데이터가 없으면 0)
+    """
+    quantities = pd.concat({
+        '월간전력량': monthly_series(power_monthly, '실제전력소비량'),
+        '냉각수사용량': monthly_series(cooling_monthly, '사용량'),
+        '월간가동시간': monthly_series(runtime_cube, '가동시간'),
+    }, axis=1).fillna(0.0)
+    return quantities.sort_index()
+
+
+def cost_history(quantities, equipment, elec_price, water_price, gas_cost_monthly=0.0, fixed_life=FIXED_LIFE):
+    """
+    월별 실제 가동시간 기준 시간당 비용 (모든 월을 한 번에 계산)
+
+    quantities: monthly_quantities 결과
+    equipment: 전처리된 설비 대장 (None이면 감가상각비 제외) — 감가상각비는 달마다 그 달 말일에
+               구입했고 내용연수가 남은 설비만으로 계산 (monthly_depreciation_history)
+    반환: 항목별 시간당 비용(원/시간), 합계, 월간가동시간 컬럼 — 가동시간이 0인 달의 비용은 NaN
+    """
+    hours = quantities['월간가동시간'].to_numpy()
+    hours = np.where(hours > 0, hours, np.nan)
+    monthly_depreciation = None
+    if equipment is not None:
+        month_ends = quantities.index.to_timestamp(how='end').normalize()
+        monthly_depreciation = monthly_depreciation_history(
+            equipment['취득원가'], equipment['구입일자'], month_ends, fixed_life)
+    basis = CostBasis(
+        monthly_depreciation=monthly_depreciation,
+        monthly_power_kwh=quantities['월간전력량'].to_numpy(),
+        monthly_water_ton=quantities['냉각수사용량'].to_numpy(),
+    )
+    costs = monthly_costs(basis, elec_price, water_price, gas_cost_monthly)
+    if gas_cost_monthly <= 0:
+        del costs['가스비']
+
+    history = pd.DataFrame({item: np.broadcast_to(cost, hours.shape) / hours for item, cost in costs.items()},
+                           index=quantities.index)
+    history['합계'] = history.sum(axis=1, min_count=1)
+    history['월간가동시간'] = quantities['월간가동시간']
+    return history
@@ -0,0 +1,116 @@
+"""
+설비 감가상각 / 유지보수 충당금 계산
+
+설비 대장 전체를 컬럼 단위로 한 번에 계산합니다. 유지보수 비율과 내용연수는
+단일 값 또는 배열로 받을 수 있어, 민감도 표 전체를 한 번의 연산으로 만들 수 있습니다.
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 내용연수 (년, 정액법)
+FIXED_LIFE = 10
+
+METRIC_COLUMNS = ['현재잔액', '올해말잔가', '연간적립액', '월간감가상각비', '월간유지보수충당금']
+
+
+def _days_since(dates, when):
+    """구입일자부터 기준 시점까지 경과 일수 (timedelta.days와 같은 내림, NaT는 NaN)"""
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy(dtype='datetime64[ns]')
+    delta = np.datetime64(pd.Timestamp(when).to_datetime64(), 'ns') - dates
+    days = np.floor_divide(delta.astype('int64'), 86_400 * 10**9).astype('float64')
+    days[np.isnat(dates)] = np.nan
+    return days
+
+
+def depreciation_arrays(cost, purchase_dates, maintenance_rate, fixed_life=FIXED_LIFE, today=None):
+    """
+    감가상각 지표를 배열로 계산하는 함수
+
+    cost, purchase_dates: 설비별 취득원가 / 구입일자 (길이 n)
+    maintenance_rate: 연간 유지보수 비율(%) — 단일 값 또는 길이 R 배열
+    fixed_life: 내용연수(년) — 단일 값 또는 길이 L 배열
+
+    반환: {지표명: 배열} — 배열 모양은 (n,) 뒤에 maintenance_rate, fixed_life 배열의
+    차원이 차례로 붙습니다. 구입일자가 없는 설비는 모든 지표가 0입니다.
+    """
+    today = today or datetime.now()
+    end_of_year = datetime(today.year, 12, 31)
+
+    rate = np.asarray(maintenance_rate, dtype='float64')
+    life = np.asarray(fixed_life, dtype='float64')
+    # (n, R, L) 브로드캐스트를 위한 축 정렬
+    rate_axes = rate.reshape(rate.shape + (1,) * life.ndim)
+    n_extra = rate.ndim + life.ndim
+
+    cost = np.asarray(cost, dtype='float64').reshape((-1,) + (1,) * n_extra)
+    days_passed = _days_since(purchase_dates, today).reshape(cost.shape)
+    days_eoy = _days_since(purchase_dates, end_of_year).reshape(cost.shape)
+    has_date = ~np.isnan(days_passed)
+
+    dep_yearly = cost / life
+    curr_val = np.maximum(cost - dep_yearly * (days_passed / 365.0), 0)
+    eoy_val = np.maximum(cost - dep_yearly * (days_eoy / 365.0), 0)
+    maintenance_monthly = cost * (rate_axes / 100) / 12
+
+    shape = np.broadcast_shapes(cost.shape, rate_axes.shape, life.shape)
+
+    def finish(values):
+        return np.where(has_date, np.broadcast_to(values, shape), 0.0)
+
+    return {
+        '현재잔액': finish(curr_val),
+        '올해말잔가': finish(eoy_val),
+        '연간적립액': finish(dep_yearly),
+        '월간감가상각비': finish(dep_yearly / 12),
+        '월간유지보수충당금': finish(maintenance_monthly),
+    }
+
+
+def monthly_depreciation_history(cost, purchase_dates, month_ends, fixed_life=FIXED_LIFE):
+    """
+    월말 시점별 설비 전체 월간 감가상각비
+
+    cost, purchase_dates: 설비별 취득원가 / 구입일자 (길이 n)
+    month_ends: 기준 월말 시점 (길이 m)
+    각 월말에 이미 구입했고 내용연수가 끝나지 않은 설비의 월간감가상각비(취득원가 / 내용연수 / 12)만
+    합산합니다. 경과 일수는 depreciation_arrays와 같은 기준(일 단위 내림, 1년 = 365일)입니다.
+    반환: 길이 m 배열
+    """
+    dates = pd.to_datetime(pd.Series(purchase_dates)).to_numpy(dtype='datetime64[ns]')
+    ends = pd.to_datetime(pd.Series(month_ends)).to_numpy(dtype='datetime64[ns]')
+    # (n, m) 경과 일수 — 구입일자가 없는 설비는 계산에서 제외
+    delta = ends[np.newaxis, :] - dates[:, np.newaxis]
+    days = np.floor_divide(delta.astype('int64'), 86_400 * 10**9)
+    active = (days >= 0) & (days / 365.0 < fixed_life) & ~np.isnat(dates)[:, np.newaxis]
+
+    monthly = np.asarray(cost, dtype='float64') / fixed_life / 12
+    return np.where(active, monthly[:, np.newaxis], 0.0).sum(axis=0)
+
+
+def depreciation_table(df_eq, maintenance_rate, fixed_life=FIXED_LIFE, today=None):
+    """설비 대장에 감가상각 지표 컬럼(METRIC_COLUMNS)을 붙여 반환"""
+    metrics = depreciation_arrays(df_eq['취득원가'], df_eq['구입일자'], maintenance_rate, fixed_life, today)
+    out = df_eq.copy()
+    for col in METRIC_COLUMNS:
+        out[col] = metrics[col]
+    return out
+
+
+def sensitivity_table(df_eq, maintenance_rates, fixed_lives, today=None):
+    """
+    유지보수 비율 × 내용연수 조합별 설비 전체 합계표
+
+    반환: 조합당 한 행 (유지보수비율, 내용연수, 각 지표 합계, 월간합계)
+    """
+    rates = np.atleast_1d(np.asarray(maintenance_rates, dtype='float64'))
+    lives = np.atleast_1d(np.asarray(fixed_lives, dtype='float64'))
+    metrics = depreciation_arrays(df_eq['취득원가'], df_eq['구입일자'], rates, lives, today)
+
+    rate_grid, life_grid = np.meshgrid(rates, lives, indexing='ij')
+    out = pd.DataFrame({'유지보수비율': rate_grid.ravel(), '내용연수': life_grid.ravel()})
+    for col in METRIC_COLUMNS:
+        out[col] = metrics[col].sum(axis=0).ravel()
+    out['월간합계'] = out['월간감가상각비'] + out['월간유지보수충당금']
+    return out
@@ -0,0 +1,208 @@
+"""
+대시보드 표 일괄 내보내기
+
+화면에서 보는 주요 표(설비별 감가상각 상세, 가동시간 피벗, 월별 시간당 전력 상세)를
+전처리 스냅샷의 집계 결과에서 한 번에 만들어 하나의 파일로 씁니다.
+- xlsx: 표마다 시트 하나인 엑셀 통합 문서 (xlsxwriter 또는 openpyxl 필요)
+- parquet / csv: 표마다 파일 하나를 담은 zip 묶음
+
+표는 CHUNK_ROWS행씩 나누어 쓰므로, 큰 표도 파일 형식으로 변환한 사본을 통째로
+메모리에 만들지 않습니다 (xlsxwriter는 constant_memory 모드로 행을 바로 임시 파일에 씀,
+openpyxl만 있으면 시트를 메모리에 만든 뒤 저장).
+"""
+import io
+import tempfile
+import zipfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cerasol import runtime
+from cerasol.depreciation import depreciation_table
+from cerasol.power import hourly_power_table
+
+CHUNK_ROWS = 50_000
+
+# 형식: (화면 표시 이름, 파일 확장자, MIME)
+EXPORT_FORMATS = {
+    'xlsx': ('Excel (시트별)', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'parquet': ('Parquet (zip)', 'zip', 'application/zip'),
+    'csv': ('CSV (zip)', 'zip', 'application/zip'),
+}
+
+DEPRECIATION_COLUMNS = ['설비명', '구입일자', '취득원가', '현재잔액', '올해말잔가',
+                        '월간감가상각비', '월간유지보수충당금', '연간적립액']
+
+
+def excel_engine():
+    """사용 가능한 엑셀 쓰기 엔진 이름 (없으면 None)"""
+    for engine in ['xlsxwriter', 'openpyxl']:
+        try:
+            __import__(engine)
+            return engine
+        except ImportError:
+            continue
+    return None
+
+
+def available_formats():
+    """현재 환경에서 쓸 수 있는 내보내기 형식"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'xlsx' or excel_engine() is not None]
+
+
+def _labelled(table, columns_suffix, index_suffix=None):
+    """숫자 컬럼/인덱스를 '1월', '2024년' 같은 문자열로 바꾼 표 (Parquet은 문자열 컬럼명만 허용)"""
+    table = table.copy()
+    table.columns = [f"{c}{columns_suffix}" for c in table.columns]
+    if index_suffix is not None:
+        table.index = [f"{i}{index_suffix}" for i in table.index]
+    return table
+
+
+def export_tables(data, maintenance_rate=0.0, split_by_month=False):
+    """
+    내보낼 표 묶음
+
+    data: 전처리 결과 (PreparedData) — 월별 집계 큐브를 그대로 사용하므로 다시 파싱/집계하지 않음
+    반환: {시트 이름: DataFrame} (데이터가 없는 표는 제외, 화면 순서)
+    """
+    tables = {}
+
+    # 탭2: 설비별 상세 내역
+    if data.equipment is not None:
+        tables['설비별 상세 내역'] = depreciation_table(data.equipment, maintenance_rate)[DEPRECIATION_COLUMNS]
+
+    # 탭5: 가동시간 피벗
+    cube = data.monthly.get('runtime_split' if split_by_month else 'runtime')
+    if cube is not None and len(cube):
+        year_month = _labelled(runtime.year_month_table(cube), '월', '년')
+        year_month['합계'] = year_month.sum(axis=1)
+        tables['연도별 월간 가동시간'] = year_month.rename_axis('연도').reset_index()
+        tables['설비별 총 가동시간'] = runtime.equipment_totals(cube)
+        equipment_year = _labelled(runtime.equipment_year_table(cube), '년')
+        equipment_year['합계'] = equipment_year.sum(axis=1)
+        tables['설비별 연도별 가동시간'] = equipment_year.reset_index()
+        equipment_month = _labelled(runtime.equipment_month_tables(cube), '월')
+        equipment_month['합계'] = equipment_month.sum(axis=1)
+        tables['설비별 월별 가동시간'] = equipment_month.reset_index()
+
+    # 탭6: 월별 상세 데이터
+    if cube is not None and data.monthly.get('power') is not None:
+        _, _, merged = hourly_power_table(data.monthly['power'], cube)
+        if len(merged):
+            detail = merged.copy()
+            detail.insert(0, '연월', merged.index.strftime('%Y-%m'))
+            tables['월별 시간당 전력'] = detail.reset_index(drop=True)
+
+    # 탭6: 소성 회차별 전력량
+    if data.run_energy is not None:
+        tables['회차별 전력량'] = data.run_energy.runs
+
+    # 스키마 검사에서 제외/빈 값 처리한 행
+    if data.rejected is not None and len(data.rejected):
+        tables['제외된 행'] = data.rejected
+
+    # 날짜/범주 컬럼은 어느 형식에서나 같은 모양이 되도록 정리
+    for name, table in tables.items():
+        table = table.copy()
+        for col in table.columns:
+            if isinstance(table[col].dtype, pd.CategoricalDtype):
+                table[col] = table[col].astype(str)
+            elif isinstance(table[col].dtype, pd.DatetimeTZDtype):
+                table[col] = table[col].dt.tz_localize(None)
+        tables[name] = table
+    return tables
+
+
+def _chunks(df, chunk_rows):
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield start, df.iloc[start:start + chunk_rows]
+
+
+def _sheet_name(name):
+    """엑셀 시트 이름 규칙 (31자, 일부 특수문자 금지)"""
+    for ch in '[]:*?/\\':
+        name = name.replace(ch, '_')
+    return name[:31]
+
+
+def _write_xlsxwriter(tables, fileobj, chunk_rows):
+    """xlsxwriter constant_memory 모드: 행을 순서대로 쓰는 즉시 임시 파일로 내보냄"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True, 'in_memory': False,
+                                             'default_date_format': 'yyyy-mm-dd'})
+    header = workbook.add_format({'bold': True})
+    for name, df in tables.items():
+        sheet = workbook.add_worksheet(_sheet_name(name))
+        sheet.write_row(0, 0, [str(c) for c in df.columns], header)
+        row = 1
+        for _, chunk in _chunks(df, chunk_rows):
+            # 결측은 빈 셀, 날짜는 datetime으로 (조각 단위로 변환)
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for record in values.itertuples(index=False, name=None):
+                sheet.write_row(row, 0, record)
+                row += 1
+    workbook.close()
+
+
+def write_excel(tables, fileobj, chunk_rows=CHUNK_ROWS):
+    engine = excel_engine()
+    if engine is None:
+        raise ImportError("엑셀 내보내기에는 xlsxwriter 또는 openpyxl이 필요합니다.")
+    if engine == 'xlsxwriter':
+        _write_xlsxwriter(tables, fileobj, chunk_rows)
+        return
+    # openpyxl은 시트를 메모리에 만든 뒤 한 번에 저장
+    with pd.ExcelWriter(fileobj, engine=engine) as writer:
+        for name, df in tables.items():
+            df.to_excel(writer, sheet_name=_sheet_name(name), index=False)
+
+
+def write_parquet_zip(tables, fileobj, chunk_rows=CHUNK_ROWS):
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for name, df in tables.items():
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            with zf.open(f"{name}.parquet", 'w') as entry, pq.ParquetWriter(entry, schema) as writer:
+                for _, chunk in _chunks(df, chunk_rows):
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_csv_zip(tables, fileobj, chunk_rows=CHUNK_ROWS):
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, df in tables.items():
+            with zf.open(f"{name}.csv", 'w') as entry:
+                text = io.TextIOWrapper(entry, encoding='utf-8-sig', newline='')
+                for start, chunk in _chunks(df, chunk_rows):
+                    chunk.to_csv(text, index=False, header=start == 0)
+                text.flush()
+                text.detach()
+
+
+WRITERS = {'xlsx': write_excel, 'parquet': write_parquet_zip, 'csv': write_csv_zip}
+
+
+def write_export(tables, fmt, fileobj, chunk_rows=CHUNK_ROWS):
+    """표 묶음을 fmt 형식으로 fileobj에 기록 (fileobj는 쓰기 가능한 바이너리 파일)"""
+    if fmt not in WRITERS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    WRITERS[fmt](tables, fileobj, chunk_rows)
+    return fileobj
+
+
+def export_bytes(tables, fmt, chunk_rows=CHUNK_ROWS):
+    """
+    내려받기용 파일 내용
+
+    임시 파일(디스크)에 조각 단위로 쓴 뒤 완성된 파일만 읽어 반환하므로,
+    변환 중에는 원본 표 외에 한 조각 분량만 메모리에 둡니다.
+
+    반환값은 완성된 파일 전체(bytes)라서 최대 메모리 사용량은 원본 표 + 파일 크기입니다
+    (openpyxl로 쓰면 통합 문서 전체가 추가됨). st.download_button은 파일 내용을 bytes로 받아
+    내려받을 때까지 미디어 파일 저장소(메모리)에 보관하므로 스트리밍으로 반환해도 이 한도는 같습니다.
+    """
+    with tempfile.TemporaryFile() as f:
+        write_export(tables, fmt, f, chunk_rows)
+        f.seek(0)
+        return f.read()
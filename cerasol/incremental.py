@@ -0,0 +1,166 @@
+"""
+누적형 로그(냉각수, 전력, 가동시간)의 증분 수집
+
+세 시트는 아래로 행이 추가되기만 하므로, 시트별로 지금까지 반영한 행의 지문(행 해시)을
+기억해 두고 새로 추가된 행만 전처리하여 월별 집계에 더합니다. 이미 반영한 행이
+수정되거나 삭제된 경우에는 전체를 다시 계산합니다.
+
+행 해시 비교는 전체 행에 대해 수행하지만 C 수준 연산이라 매우 가볍고,
+날짜 파싱과 집계처럼 비싼 작업은 변경된 행 수에 비례합니다.
+"""
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cerasol.anomaly import VALUE_COLUMNS, anomaly_table, update_anomalies
+from cerasol.compact import compact_frame, concat_compact
+from cerasol.prepare import AGGREGATE_KEYS, monthly_aggregates, prepare_sheet
+
+
+def _combine(old, new, keys):
+    """기존 집계와 신규 행 집계를 더하기 (집계 하나)"""
+    if old is None or len(old) == 0:
+        return new.reset_index(drop=True)
+    if len(new) == 0:
+        return old
+    combined = pd.concat([old, new], ignore_index=True)
+    return combined.groupby(keys, as_index=False, observed=True).sum()
+
+
+@dataclass
+class SheetState:
+    """시트 하나의 증분 수집 상태"""
+    row_hashes: np.ndarray = None     # 반영한 원본 행의 해시 (행 순서대로)
+    columns: list = None              # 원본 컬럼 구성
+    prepared: pd.DataFrame = None     # 전처리된 전체 행
+    valid: pd.DataFrame = None        # (가동시간) 유효 기록
+    monthly: dict = None              # 집계 이름 -> 월별 집계
+    rejected: pd.DataFrame = None     # 스키마 적용 시 제외/빈 값 처리한 행 (누적)
+    anomalies: pd.DataFrame = None    # (냉각수/전력) 일별 이상치 탐지 결과
+    last_date: object = None          # 마지막으로 반영한 날짜
+    mode: str = ''                    # 'full' | 'append' | 'unchanged'
+    new_rows: int = 0                 # 이번 수집에서 처리한 행 수
+    reason: str = ''                  # 전체 재계산 사유
+    updated_at: datetime = None
+
+
+@dataclass
+class _SheetSpec:
+    date_col: str
+    is_runtime: bool = False
+
+
+SHEET_SPECS = {
+    'cooling': _SheetSpec('날짜'),
+    'power': _SheetSpec('날짜'),
+    'runtime': _SheetSpec('가동시작_parsed', is_runtime=True),
+}
+
+
+def row_hashes(raw):
+    """원본 행별 해시 (인덱스 제외, 값과 컬럼 순서 기준)"""
+    return pd.util.hash_pandas_object(raw, index=False).to_numpy()
+
+
+class IncrementalIngest:
+    """
+    서버 전체가 공유하는 증분 수집기
+
+    update(name, raw)는 원본 시트를 받아 이전 수집 이후 추가된 행만 반영한
+    SheetState를 반환합니다.
+    """
+
+    def __init__(self):
+        self.states = {}
+        self._lock = threading.Lock()
+
+    def update(self, name, raw):
+        spec = SHEET_SPECS[name]
+        hashes = row_hashes(raw)
+
+        with self._lock:
+            old = self.states.get(name)
+            reason = self._full_reload_reason(old, raw, hashes)
+
+            if reason:
+                state = self._full(name, spec, raw, hashes, reason)
+            elif len(hashes) == len(old.row_hashes):
+                state = replace(old, mode='unchanged', new_rows=0, reason='')
+            else:
+                state = self._append(name, spec, old, raw, hashes)
+
+            state.updated_at = datetime.now()
+            self.states[name] = state
+            return state
+
+    @staticmethod
+    def _full_reload_reason(old, raw, hashes):
+        if old is None or old.row_hashes is None:
+            return '최초 수집'
+        if list(raw.columns) != old.columns:
+            return '컬럼 구성 변경'
+        n_old = len(old.row_hashes)
+        if len(hashes) < n_old:
+            return f'행 삭제 ({n_old:,} → {len(hashes):,}행)'
+        changed = np.flatnonzero(hashes[:n_old] != old.row_hashes)
+        if len(changed):
+            return f'기존 행 수정 ({changed[0] + 1:,}번째 행부터 {len(changed):,}행)'
+        return ''
+
+    def _prepare(self, name, raw, row_offset=0):
+        """스키마 적용 + 전처리 + 월별 집계 (집계 후 행 단위 표는 작은 자료형으로 보관)"""
+        prepared, valid, rejected = prepare_sheet(name, raw, row_offset)
+        monthly = monthly_aggregates(name, prepared, valid)
+        return compact_frame(prepared), compact_frame(valid), monthly, rejected
+
+    def _full(self, name, spec, raw, hashes, reason):
+        prepared, valid, monthly, rejected = self._prepare(name, raw)
+        return SheetState(
+            row_hashes=hashes, columns=list(raw.columns), prepared=prepared, valid=valid, monthly=monthly,
+            rejected=rejected,
+            anomalies=anomaly_table(name, prepared) if name in VALUE_COLUMNS else None,
+            last_date=prepared[spec.date_col].max() if len(prepared) else None,
+            mode='full', new_rows=len(raw), reason=reason,
+        )
+
+    def _append(self, name, spec, old, raw, hashes):
+        n_old = len(old.row_hashes)
+        new_raw = raw.iloc[n_old:]
+        prepared, valid, monthly, rejected = self._prepare(name, new_raw, row_offset=n_old)
+
+        state = SheetState(
+            row_hashes=hashes,
+            columns=old.columns,
+            prepared=concat_compact([old.prepared, prepared]),
+            valid=concat_compact([old.valid, valid]) if spec.is_runtime else None,
+            monthly={key: _combine(old.monthly.get(key), frame, AGGREGATE_KEYS[key])
+                     for key, frame in monthly.items()},
+            rejected=pd.concat([old.rejected, rejected], ignore_index=True) if len(rejected) else old.rejected,
+            mode='append', new_rows=len(new_raw),
+        )
+        if name in VALUE_COLUMNS:
+            # 새 행의 가장 이른 날짜부터만 다시 계산
+            since = prepared[spec.date_col].min() if len(prepared) else None
+            state.anomalies = update_anomalies(name, old.anomalies, state.prepared, since)
+        new_last = prepared[spec.date_col].max() if len(prepared) else None
+        dates = [d for d in (old.last_date, new_last) if pd.notna(d)]
+        state.last_date = max(dates) if dates else None
+        return state
+
+    def report(self):
+        """시트별 최근 수집 결과 표"""
+        labels = {'full': '전체 재계산', 'append': '증분 반영', 'unchanged': '변경 없음'}
+        rows = []
+        for name, state in self.states.items():
+            rows.append({
+                '시트': name,
+                '방식': labels.get(state.mode, state.mode),
+                '처리 행 수': state.new_rows,
+                '누적 행 수': len(state.row_hashes),
+                '마지막 날짜': f"{state.last_date:%Y-%m-%d}" if pd.notna(state.last_date) else '-',
+                '사유': state.reason,
+            })
+        return pd.DataFrame(rows)
@@ -0,0 +1,120 @@
+"""
+가동시간 월 경계 분할
+
+월말을 넘겨 이어지는 소성 가동을 월별로 나누어 배분합니다. 가동 시작 월에 전체
+가동시간을 몰아 넣으면 한 달은 부풀고 다음 달은 비게 되므로, 각 달에 실제로 걸친
+시간만큼 나눕니다.
+
+split_runtime_by_month는 기존 행 단위 기준 구현이고, split_runs_by_month는 같은 규칙을
+전체 가동 기록에 한 번에 적용하는 벡터화 구현입니다. 기존 구현과 동일하게 각 달의
+끝은 말일 23:59:59로 잡습니다.
+"""
+import calendar
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+_NS_PER_SEC = 1_000_000_000
+
+
+def split_runtime_by_month(start_dt, end_dt, total_hours):
+    """
+    가동시간을 월별로 분할하는 함수
+    
+    예: 10월 25일 ~ 11월 5일, 총 264시간
+    -> 10월: 144시간 (6일 * 24h)
+    -> 11월: 120시간 (5일 * 24h)
+    """
+    if pd.isna(start_dt) or pd.isna(end_dt) or total_hours <= 0:
+        return []
+    
+    # 시간을 초 단위로 변환
+    total_seconds = total_hours * 3600
+    
+    # 시작일과 종료일 사이의 전체 초
+    duration_seconds = (end_dt - start_dt).total_seconds()
+    
+    if duration_seconds <= 0:
+        return []
+    
+    # 시간당 배분 비율
+    seconds_per_hour = duration_seconds / total_hours if total_hours > 0 else 0
+    
+    results = []
+    current_date = start_dt
+    
+    while current_date < end_dt:
+        # 현재 월의 마지막 날
+        year = current_date.year
+        month = current_date.month
+        last_day = calendar.monthrange(year, month)[1]
+        month_end = datetime(year, month, last_day, 23, 59, 59)
+        
+        # 이 달에서의 종료 시점
+        period_end = min(end_dt, month_end)
+        
+        # 이 달의 가동 시간 계산 (초 단위)
+        period_seconds = (period_end - current_date).total_seconds()
+        period_hours = period_seconds / seconds_per_hour if seconds_per_hour > 0 else 0
+        
+        if period_hours > 0:
+            results.append({
+                '연': year,
+                '월': month,
+                '가동 시간': period_hours
+            })
+        
+        # 다음 달 1일로 이동
+        if month == 12:
+            current_date = datetime(year + 1, 1, 1, 0, 0, 0)
+        else:
+            current_date = datetime(year, month + 1, 1, 0, 0, 0)
+    
+    return results
+
+
+def split_runs_by_month(starts, ends, total_hours):
+    """
+    가동 기록 전체를 월별로 분할하는 함수 (split_runtime_by_month와 동일한 규칙)
+
+    starts, ends: 가동 시작/종료 시각 배열, total_hours: 가동시간 배열 (길이 n)
+    반환: 분할 결과 DataFrame — 원본 행 위치(run), 연, 월, 가동 시간, 시작월 여부
+    """
+    start = pd.to_datetime(pd.Series(starts)).to_numpy(dtype='datetime64[ns]')
+    end = pd.to_datetime(pd.Series(ends)).to_numpy(dtype='datetime64[ns]')
+    hours = np.asarray(total_hours, dtype='float64')
+
+    duration = (end - start).astype('int64').astype('float64') / _NS_PER_SEC
+    valid = ~np.isnat(start) & ~np.isnat(end) & (hours > 0) & (duration > 0)
+    runs = np.flatnonzero(valid)
+    start, end, hours, duration = start[runs], end[runs], hours[runs], duration[runs]
+
+    # 시작 월부터 종료 시각 직전이 속한 월까지 (종료 시각이 월초 0시면 그 달은 제외)
+    first_month = start.astype('datetime64[M]')
+    last_month = (end - np.timedelta64(1, 'ns')).astype('datetime64[M]')
+    n_months = (last_month - first_month).astype('int64') + 1
+
+    # 가동 하나를 걸친 월 수만큼 펼치기
+    run_pos = np.repeat(np.arange(len(runs)), n_months)
+    offset = np.arange(len(run_pos)) - np.repeat(np.cumsum(n_months) - n_months, n_months)
+    month = first_month[run_pos] + offset.astype('timedelta64[M]')
+
+    month_start = month.astype('datetime64[ns]')
+    month_end = (month + np.timedelta64(1, 'M')).astype('datetime64[ns]') - np.timedelta64(1, 's')
+    period_start = np.where(offset == 0, start[run_pos], month_start)
+    period_end = np.minimum(end[run_pos], month_end)
+
+    period_seconds = (period_end - period_start).astype('int64').astype('float64') / _NS_PER_SEC
+    seconds_per_hour = duration[run_pos] / hours[run_pos]
+    period_hours = period_seconds / seconds_per_hour
+
+    months = month.astype('int64')
+    out = pd.DataFrame({
+        'run': runs[run_pos],
+        '연': months // 12 + 1970,
+        '월': months % 12 + 1,
+        '가동 시간': period_hours,
+        '시작월': offset == 0,
+    })
+    return out[out['가동 시간'] > 0].reset_index(drop=True)
@@ -0,0 +1,56 @@
+"""
+월별 시간당 전력 사용량 (kWh/h)
+
+월간 전력량(kWh) ÷ 월간 가동시간(h)으로 설비 가동 1시간당 전력 사용량을 구합니다.
+월 단위 PeriodIndex 위에서 배열 연산으로만 계산하므로, 데이터에 있는 연도 수와
+관계없이 행 단위 Python 연산이 없습니다.
+"""
+import numpy as np
+import pandas as pd
+
+from cerasol.prepare import monthly_series
+
+
+def available_years(*monthly_frames):
+    """월별 집계들에 들어 있는 연도 목록 (오름차순)"""
+    years = set()
+    for df in monthly_frames:
+        if df is not None and len(df):
+            years.update(pd.unique(df['연']).tolist())
+    return sorted(int(y) for y in years)
+
+
+def _with_year_month(series, name):
+    frame = series.rename(name).to_frame()
+    frame.insert(0, '연', frame.index.year)
+    frame.insert(1, '월', frame.index.month)
+    return frame.reset_index(drop=True)
+
+
+def hourly_power_table(power_monthly, runtime_cube, years=None):
+    """
+    월별 전력량 / 가동시간 / 시간당 전력 표
+
+    power_monthly: 연/월별 전력 집계 (실제전력소비량 컬럼)
+    runtime_cube: 설비/연/월별 가동시간 큐브 (가동시간 컬럼)
+    years: 대상 연도 목록 (None이면 데이터에 있는 모든 연도)
+
+    반환: (월별 전력량, 월별 가동시간, 병합 결과) — 모두 연월 순서이며, 병합 결과는
+    연월 PeriodIndex에 연, 월, 월간전력량, 월간가동시간, 시간당전력 컬럼을 가지고
+    가동시간이 0인 달의 시간당전력은 0
+    """
+    power = monthly_series(power_monthly, '실제전력소비량')
+    hours = monthly_series(runtime_cube, '가동시간')
+    if years is not None:
+        years = list(years)
+        power = power[power.index.year.isin(years)]
+        hours = hours[hours.index.year.isin(years)]
+
+    # 한쪽에만 있는 달은 0으로 채워 병합
+    merged = pd.concat({'월간전력량': power, '월간가동시간': hours}, axis=1).fillna(0.0).sort_index()
+    kwh = merged['월간전력량'].to_numpy()
+    runtime_hours = merged['월간가동시간'].to_numpy()
+    merged['시간당전력'] = np.divide(kwh, runtime_hours, out=np.zeros_like(kwh), where=runtime_hours > 0)
+    merged.insert(0, '연', merged.index.year)
+    merged.insert(1, '월', merged.index.month)
+    return _with_year_month(power, '월간전력량'), _with_year_month(hours, '월간가동시간'), merged
@@ -0,0 +1,259 @@
+"""
+데이터 전처리 (시트 새로고침마다 한 번만 실행)
+
+시트별 선언 스키마(schema.SCHEMAS)로 자료형을 한 번 정리한 뒤, 전력 단위 변환과
+연/월 추출, 월별 집계를 한곳에서 수행합니다. 탭에서는 이 결과를 읽기만 합니다.
+"""
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from cerasol.anomaly import VALUE_COLUMNS, anomaly_table
+from cerasol.compact import compact_frame, memory_report
+from cerasol.monthsplit import split_runs_by_month
+from cerasol.profiling import NULL_PROFILER
+from cerasol.runenergy import run_energy
+from cerasol.schema import REJECTED_COLUMNS, SCHEMAS, apply_schema, normalize_columns
+
+# 전력 계량기 출력치 -> 실제 전력소비량(kWh) 배율
+POWER_UNIT = 80
+
+# 월별 집계 키
+MONTH_KEYS = ['연', '월']
+RUNTIME_KEYS = ['설비코드', '설비명', '연', '월']
+
+REQUIRED_COLUMNS = {name: schema.required for name, schema in SCHEMAS.items()}
+
+
+@dataclass
+class PreparedData:
+    """전처리가 끝난 데이터 묶음 (로드 실패 또는 컬럼 누락 시 해당 항목은 None)"""
+    equipment: pd.DataFrame = None
+    cooling: pd.DataFrame = None
+    power: pd.DataFrame = None
+    runtime: pd.DataFrame = None         # 파싱 결과를 덧붙인 전체 가동 기록
+    runtime_valid: pd.DataFrame = None   # 연/월이 있고 가동 시간 > 0인 기록
+    monthly: dict = field(default_factory=dict)   # 집계 이름 -> 월별 집계 (monthly_aggregates 참고)
+    ingest_report: pd.DataFrame = None            # 증분 수집 결과 (증분 모드일 때)
+    memory: pd.DataFrame = None                   # 표별 메모리 사용량 (memory_report 참고)
+    loaded: dict = field(default_factory=dict)    # 시트 이름 -> 원본 로드 성공 여부
+    missing: dict = field(default_factory=dict)   # 시트 이름 -> 누락된 필수 컬럼
+    columns: dict = field(default_factory=dict)   # 시트 이름 -> 원본 컬럼 목록
+    rejected: pd.DataFrame = None                 # 스키마 적용 시 제외/빈 값 처리한 행 (schema.REJECTED_COLUMNS)
+    anomalies: dict = field(default_factory=dict) # 시트 이름 -> 일별 이상치 탐지 결과 (anomaly.detect_anomalies)
+    run_energy: object = None                     # 소성 회차별 전력량 (runenergy.RunEnergy, 전력/가동시간이 모두 있을 때)
+
+
+def month_period(df):
+    """연/월 컬럼 -> 월 단위 PeriodIndex ('연월')"""
+    dates = pd.to_datetime(pd.DataFrame({'year': df['연'], 'month': df['월'], 'day': 1}))
+    return pd.PeriodIndex(dates, freq='M', name='연월')
+
+
+def monthly_series(monthly, value_col):
+    """연/월 집계 -> 연월(PeriodIndex)별 합계 Series (집계가 없으면 빈 Series)"""
+    if monthly is None or len(monthly) == 0:
+        return pd.Series(dtype=float, index=pd.PeriodIndex([], freq='M', name='연월'))
+    values = pd.Series(monthly[value_col].to_numpy(dtype=float), index=month_period(monthly))
+    return values.groupby(level=0).sum()
+
+
+def _add_year_month(df):
+    df['연'] = df['날짜'].dt.year.astype(int)
+    df['월'] = df['날짜'].dt.month.astype(int)
+    df['연월'] = df['날짜'].dt.to_period('M')
+    return df
+
+
+def prepare_equipment(df):
+    """설비 대장 (스키마 적용 결과 그대로)"""
+    return df.copy()
+
+
+def prepare_daily_usage(df):
+    """냉각수/전력 일별 사용량: 연/월/연월 추출 (날짜는 스키마에서 변환, 빈 날짜 행은 제외됨)"""
+    return _add_year_month(df.copy())
+
+
+def prepare_power(df):
+    """전력 사용량: 일별 전처리 + 실제전력소비량(kWh) 계산"""
+    df = prepare_daily_usage(df)
+    df['실제전력소비량'] = df['사용량'] * POWER_UNIT
+    return df
+
+
+def prepare_runtime(df):
+    """
+    가동 기록: 연/월 추출 (가동 시작 일시는 스키마에서 가동시작_parsed로 변환됨)
+
+    반환: (전체 기록, 유효 기록) — 유효 기록은 연/월이 있고 가동 시간 > 0인 행
+    """
+    df = df.copy()
+    df['연'] = df['가동시작_parsed'].dt.year
+    df['월'] = df['가동시작_parsed'].dt.month
+
+    valid = df.dropna(subset=['연', '월'])
+    valid = valid[valid['가동 시간'] > 0].copy()
+    valid['연'] = valid['연'].astype(int)
+    valid['월'] = valid['월'].astype(int)
+    return df, valid
+
+
+def prepare_sheet(name, raw, row_offset=0):
+    """
+    시트 하나: 스키마 적용 + 전처리
+
+    raw: 컬럼명 공백을 제거한 원본 표, row_offset: raw 첫 행의 원본 위치 (증분 수집용)
+    반환: (전처리 결과, 유효 기록 (가동시간만, 나머지 시트는 None), 제외 목록)
+    """
+    typed, rejected = apply_schema(name, raw, row_offset)
+    if name == 'equipment':
+        return prepare_equipment(typed), None, rejected
+    if name == 'runtime':
+        prepared, valid = prepare_runtime(typed)
+        return prepared, valid, rejected
+    prepare = prepare_power if name == 'power' else prepare_daily_usage
+    return prepare(typed), None, rejected
+
+
+def aggregate_daily_usage(df, value_cols):
+    """일별 사용량 -> 연/월별 합계"""
+    return df.groupby(MONTH_KEYS, as_index=False)[value_cols].sum()
+
+
+def aggregate_runtime(valid):
+    """유효 가동 기록 -> 설비/연/월별 가동시간 합계와 가동 횟수"""
+    return valid.groupby(RUNTIME_KEYS, as_index=False, observed=True).agg(
+        가동시간=('가동 시간', 'sum'),
+        가동횟수=('가동 시간', 'size'),
+    )
+
+
+def aggregate_runtime_split(valid):
+    """
+    유효 가동 기록 -> 월 경계에서 분할한 설비/연/월별 가동시간
+
+    월말을 넘기는 가동은 각 달에 걸친 시간만큼 나누어 배분하고,
+    가동 횟수는 시작 월 기준으로 셉니다.
+    """
+    start = valid['가동시작_parsed']
+    hours = valid['가동 시간']
+    parts = split_runs_by_month(start, start + pd.to_timedelta(hours, unit='h'), hours)
+
+    keys = valid[['설비코드', '설비명']].iloc[parts['run'].to_numpy()].reset_index(drop=True)
+    split = pd.concat([keys, parts[['연', '월', '가동 시간']]], axis=1)
+    hours_cube = split.groupby(RUNTIME_KEYS, as_index=False, observed=True)['가동 시간'].sum()
+    hours_cube = hours_cube.rename(columns={'가동 시간': '가동시간'})
+
+    counts = aggregate_runtime(valid)[RUNTIME_KEYS + ['가동횟수']]
+    cube = hours_cube.merge(counts, on=RUNTIME_KEYS, how='outer')
+    return cube.fillna({'가동시간': 0.0, '가동횟수': 0}).astype({'가동횟수': 'int64'})
+
+
+# 월별 집계 이름 -> 집계 키 (증분 수집 시 기존 집계와 더할 때 사용)
+AGGREGATE_KEYS = {
+    'cooling': MONTH_KEYS,
+    'power': MONTH_KEYS,
+    'runtime': RUNTIME_KEYS,
+    'runtime_split': RUNTIME_KEYS,
+}
+
+
+def monthly_aggregates(name, prepared, valid=None):
+    """
+    시트별 월별 집계 묶음
+
+    반환: {집계 이름: DataFrame}
+    - cooling / power: 연/월별 사용량 합계
+    - runtime: 시작 월 기준 설비/연/월별 가동시간 큐브
+    - runtime_split: 월 경계에서 분할한 설비/연/월별 가동시간 큐브
+    """
+    if name == 'cooling':
+        return {'cooling': aggregate_daily_usage(prepared, ['사용량'])}
+    if name == 'power':
+        return {'power': aggregate_daily_usage(prepared, ['사용량', '실제전력소비량'])}
+    if name == 'runtime':
+        return {'runtime': aggregate_runtime(valid), 'runtime_split': aggregate_runtime_split(valid)}
+    return {}
+
+
+def prepare_all(frames, ingest=None, profiler=NULL_PROFILER):
+    """
+    원본 시트 묶음을 전처리하는 함수
+
+    frames: {시트 이름: 원본 DataFrame 또는 None}
+    ingest: 누적형 로그(냉각수/전력/가동시간)를 증분 처리할 IncrementalIngest (없으면 전체 처리)
+    profiler: 시트별 전처리/집계 시간을 기록할 StageProfiler (선택)
+    """
+    data = PreparedData()
+    rejected = []
+
+    for name, required in REQUIRED_COLUMNS.items():
+        raw = frames.get(name)
+        data.loaded[name] = raw is not None
+        if raw is None:
+            data.missing[name] = []
+            continue
+
+        raw = normalize_columns(raw)
+        data.columns[name] = raw.columns.tolist()
+        data.missing[name] = [col for col in required if col not in raw.columns]
+        if data.missing[name]:
+            continue
+
+        if name == 'equipment':
+            with profiler.stage('load', 'prepare:equipment') as rec:
+                data.equipment, _, sheet_rejected = prepare_sheet(name, raw)
+                rejected.append(sheet_rejected)
+                rec['rows'] = len(raw)
+        elif ingest is not None:
+            with profiler.stage('load', f'ingest:{name}') as rec:
+                state = ingest.update(name, raw)
+                rec['rows'] = state.new_rows
+                rec['cache'] = state.mode
+            setattr(data, name, state.prepared)
+            if name == 'runtime':
+                data.runtime_valid = state.valid
+            data.monthly.update(state.monthly)
+            if state.anomalies is not None:
+                data.anomalies[name] = state.anomalies
+            rejected.append(state.rejected)
+        else:
+            with profiler.stage('load', f'prepare:{name}') as rec:
+                prepared, valid, sheet_rejected = prepare_sheet(name, raw)
+                setattr(data, name, prepared)
+                if name == 'runtime':
+                    data.runtime_valid = valid
+                rejected.append(sheet_rejected)
+                rec['rows'] = len(raw)
+            with profiler.stage('load', f'aggregate:{name}') as rec:
+                aggregates = monthly_aggregates(name, getattr(data, name), data.runtime_valid)
+                data.monthly.update(aggregates)
+                rec['rows'] = sum(len(df) for df in aggregates.values())
+            if name in VALUE_COLUMNS:
+                with profiler.stage('load', f'anomaly:{name}') as rec:
+                    data.anomalies[name] = anomaly_table(name, getattr(data, name))
+                    rec['rows'] = len(data.anomalies[name])
+            # 집계가 끝난 행 단위 표는 작은 자료형으로 보관
+            setattr(data, name, compact_frame(getattr(data, name)))
+            if name == 'runtime':
+                data.runtime_valid = compact_frame(data.runtime_valid)
+
+    if ingest is not None:
+        data.ingest_report = ingest.report()
+    # 회차별 전력량 (전력 기록 ↔ 가동 구간 조인은 스냅샷마다 한 번, 화면/내보내기는 결과만 읽음)
+    if data.power is not None and data.runtime_valid is not None:
+        with profiler.stage('load', 'run_energy') as rec:
+            data.run_energy = run_energy(data.power, data.runtime_valid)
+            rec['rows'] = len(data.run_energy.runs)
+
+    rejected = [df for df in rejected if df is not None and len(df)]
+    data.rejected = pd.concat(rejected, ignore_index=True) if rejected else pd.DataFrame(columns=REJECTED_COLUMNS)
+
+    frames = {name: getattr(data, name) for name in ['equipment', 'cooling', 'power', 'runtime', 'runtime_valid']}
+    frames.update({f"월별 집계: {key}": df for key, df in data.monthly.items()})
+    frames.update({f"이상치 탐지: {key}": df for key, df in data.anomalies.items()})
+    if data.run_energy is not None:
+        frames['회차별 전력량'] = data.run_energy.runs
+    data.memory = memory_report(frames)
+    return data
@@ -0,0 +1,94 @@
+"""
+단계별 소요 시간 계측
+
+시트 수신, 전처리(파싱), 집계, 화면별 계산/렌더링 단계의 소요 시간과 행 수를 기록합니다.
+계측을 켠 경우에만 기록하며(꺼져 있으면 아무 일도 하지 않음), 기록은 진단 패널에 표로
+보여주고 JSON Lines 파일에 덧붙여 재실행 비용 추이를 추적할 수 있게 합니다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+_log_lock = threading.Lock()
+
+
+class StageProfiler:
+    """
+    한 번의 스크립트 실행 동안의 단계별 기록
+
+    with profiler.stage('runtime', 'pivot') as rec:
+        ...
+        rec['rows'] = len(result)   # 선택: 처리 행 수, rec['cache'] = 'hit' / 'miss'
+    """
+
+    def __init__(self, enabled=False, log_path=None, session=None):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.session = session
+        self.run_id = uuid.uuid4().hex[:8]
+        self.records = []
+        self._flushed = 0
+
+    def record(self, tab, stage, seconds, rows=None, cache=None):
+        if not self.enabled:
+            return
+        self.records.append({
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'session': self.session,
+            'run': self.run_id,
+            'tab': tab,
+            'stage': stage,
+            'ms': round(seconds * 1000, 2),
+            'rows': None if rows is None else int(rows),
+            'cache': cache,
+        })
+
+    @contextmanager
+    def stage(self, tab, stage):
+        rec = {'rows': None, 'cache': None}
+        if not self.enabled:
+            yield rec
+            return
+        start = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            self.record(tab, stage, time.perf_counter() - start, rec['rows'], rec['cache'])
+
+    def view(self, tab):
+        """화면 함수 전체(계산 + 렌더링)를 계측하고 끝나면 로그에 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(tab, 'view'):
+                    result = func(*args, **kwargs)
+                self.flush()
+                return result
+            return wrapper
+        return decorator
+
+    def table(self):
+        """기록을 표로 반환 (없으면 빈 표)"""
+        return pd.DataFrame(self.records, columns=['tab', 'stage', 'ms', 'rows', 'cache'])
+
+    def flush(self):
+        """아직 쓰지 않은 기록을 JSON Lines 로그에 덧붙임"""
+        if not self.enabled or not self.log_path or self._flushed >= len(self.records):
+            return
+        pending = self.records[self._flushed:]
+        self._flushed = len(self.records)
+        os.makedirs(os.path.dirname(self.log_path) or '.', exist_ok=True)
+        with _log_lock, open(self.log_path, 'a', encoding='utf-8') as f:
+            for rec in pending:
+                f.write(json.dumps(rec, ensure_ascii=False) + '\n')
+
+
+# 계측을 사용하지 않을 때의 기본값
+NULL_PROFILER = StageProfiler(enabled=False)
@@ -0,0 +1,143 @@
+"""
+서버 전체 백그라운드 새로고침
+
+정해진 주기마다 백그라운드 스레드가 시트를 내려받고 전처리까지 끝낸 뒤,
+(시트 묶음, 전처리 결과) 스냅샷을 한 번에 교체합니다. 화면 실행은 항상 가장 최근
+스냅샷을 읽기만 하므로, 구글 응답 시간이나 전처리 시간을 기다리지 않습니다.
+(로컬 저장소가 비어 있는 최초 실행만 첫 스냅샷이 준비될 때까지 기다림)
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from cerasol.profiling import StageProfiler
+from cerasol.sheets import SheetBatch
+
+
+@dataclass
+class Snapshot:
+    """화면에 제공하는 데이터 한 벌"""
+    version: int = 0                 # 교체될 때마다 1씩 증가
+    batch: SheetBatch = None         # 원본 시트 묶음
+    data: object = None              # prepare(batch) 결과 (PreparedData)
+    prepared_at: datetime = None
+    prepare_seconds: float = 0.0
+    timings: list = field(default_factory=list)   # 전처리 단계별 기록 (StageProfiler.records)
+
+
+class BackgroundRefresher:
+    """
+    시트 캐시(SheetCache)를 주기적으로 새로고침하고 전처리 결과를 함께 교체하는 스레드
+
+    prepare(batch, profiler): 시트 묶음 -> 전처리 결과
+    interval: 새로고침 주기(초) — 시작 시 저장소 데이터가 이보다 오래되었으면 바로 새로고침
+    retry_interval: 새로고침에 실패한 시트가 있을 때 다음 시도까지의 간격(초)
+    """
+
+    def __init__(self, cache, prepare, interval=600, retry_interval=60):
+        self.cache = cache
+        self.prepare = prepare
+        self.interval = interval
+        self.retry_interval = min(retry_interval, interval)
+        self.last_error = None           # 마지막 새로고침 오류 메시지 (성공하면 None)
+        self.last_error_at = None
+        self.last_refresh_at = None      # 마지막 새로고침 시도 시각
+        self.next_refresh_at = None
+        self._snapshot = None
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='sheet-refresher', daemon=True)
+                self._thread.start()
+        return self
+
+    def current(self, timeout=None):
+        """가장 최근 스냅샷 (첫 스냅샷이 준비될 때까지만 대기)"""
+        self._ready.wait(timeout)
+        return self._snapshot
+
+    def refresh_now(self):
+        """다음 주기를 기다리지 않고 바로 새로고침 요청"""
+        self._wake.set()
+
+    def data_age(self):
+        """현재 스냅샷 시트 중 가장 오래된 시트의 나이(초), 스냅샷이 없으면 None"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        times = [t for t in snapshot.batch.sheet_time.values() if t is not None]
+        return (datetime.now() - min(times)).total_seconds() if times else None
+
+    def _publish(self, batch):
+        """전처리까지 끝낸 스냅샷으로 교체 (참조 교체는 원자적)"""
+        profiler = StageProfiler(enabled=True)
+        start = time.perf_counter()
+        data = self.prepare(batch, profiler)
+        previous = self._snapshot
+        self._snapshot = Snapshot(
+            version=(previous.version if previous else 0) + 1, batch=batch, data=data,
+            prepared_at=datetime.now(), prepare_seconds=time.perf_counter() - start,
+            timings=profiler.records,
+        )
+        self._ready.set()
+
+    def _refresh(self):
+        self.last_refresh_at = datetime.now()
+        try:
+            self.cache.refresh()
+            batch = self.cache.local_snapshot()
+            # 한 시트라도 새로 받았을 때만 전처리 후 교체 (모두 실패하면 이전 스냅샷 유지)
+            if any(t == batch.fetched_at for t in batch.sheet_time.values()):
+                self._publish(batch)
+        except Exception as e:
+            self._record_error(f"{type(e).__name__}: {e}")
+            return
+        self._record_batch_errors(batch)
+
+    def _record_batch_errors(self, batch):
+        """시트별 수신 오류를 last_error에 반영 (모두 성공하면 지움)"""
+        errors = [f"{name}: {message}" for name, message in batch.errors.items()]
+        if errors:
+            self._record_error(' / '.join(errors))
+        else:
+            self.last_error = None
+
+    def _record_error(self, message):
+        self.last_error = message
+        self.last_error_at = datetime.now()
+
+    def _run(self):
+        # 첫 스냅샷: 로컬 저장소 (비어 있으면 바로 내려받기)
+        try:
+            batch = self.cache.local_snapshot()
+            if not batch.frames and not self.cache.offline:
+                self.last_refresh_at = datetime.now()
+                self.cache.refresh()
+                batch = self.cache.local_snapshot()
+                self._record_batch_errors(batch)
+            self._publish(batch)
+        except Exception as e:
+            self._record_error(f"{type(e).__name__}: {e}")
+            self._publish(SheetBatch(fetched_at=datetime.now()))
+        finally:
+            self._ready.set()
+
+        if self.cache.offline:
+            return
+
+        # 첫 수신에 실패한 시트가 있으면 주기를 기다리지 않고 retry_interval 뒤 다시 시도
+        wait = self.retry_interval if self.last_error else max(self.interval - self.cache.age(), 0.0)
+        while True:
+            self.next_refresh_at = datetime.fromtimestamp(time.time() + wait)
+            self._wake.wait(wait)
+            self._wake.clear()
+            self._refresh()
+            # 실패한 시트가 있으면 (이전 데이터를 보여주는 동안) 더 짧은 간격으로 다시 시도
+            wait = self.retry_interval if self.last_error else self.interval
@@ -0,0 +1,137 @@
+"""
+소성 회차별 전력량 (전력 기록 ↔ 가동 구간 조인)
+
+월간 전력량 ÷ 월간 가동시간으로는 회차별 차이가 보이지 않으므로, 날짜별 전력 기록을
+각 가동 구간(가동 시작 일시 ~ 시작 + 가동 시간)에 겹친 시간만큼 나누어 회차별
+전력량(kWh)과 시간당 전력(kWh/h)을 구합니다.
+
+- 전력 기록 하나는 [날짜, 다음 기록 날짜) 구간의 사용량으로 보며, 구간은 최대 READING_PERIOD
+  (시트는 일별 기록이므로 하루)입니다.
+- 한 기록 구간에 여러 가동이 겹치면 겹친 가동시간 비율로 나눕니다 (설비별 계량이 없으므로).
+  전력 기록에 설비코드 컬럼이 있으면 같은 설비의 가동에만 배분합니다.
+- 겹치는 가동이 없는 기록(휴지일)의 전력량은 미배분으로 따로 집계합니다.
+
+구간 조인은 정렬된 기록 구간 배열에 searchsorted로 가동마다 겹치는 기록 범위를 찾고,
+np.repeat로 (가동, 기록) 쌍을 펼쳐 계산합니다. Python 반복 없이 가동 수 + 기록 수 +
+겹친 쌍 수에 비례합니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+READING_PERIOD = pd.Timedelta(days=1)
+
+# 설비별로 조인할 때 설비마다 시각(초)을 떼어 놓는 간격 (약 3,000년 — 설비 간 구간이 겹치지 않음)
+_GROUP_SPAN = 10 ** 11
+
+RUN_ENERGY_COLUMNS = ['설비코드', '설비명', '가동 시작', '가동 종료', '가동 시간', '측정 구간 수',
+                      '전력량', '시간당전력']
+
+
+@dataclass
+class RunEnergy:
+    """회차별 전력량 배분 결과"""
+    runs: pd.DataFrame = None          # 가동 회차별 표 (RUN_ENERGY_COLUMNS)
+    total_kwh: float = 0.0             # 전력 기록 전체 전력량
+    unattributed_kwh: float = 0.0      # 겹치는 가동이 없어 배분하지 못한 전력량
+    by_equipment: bool = False         # 설비별 전력 기록으로 배분했는지 여부
+
+
+def _seconds(values):
+    return pd.to_datetime(values).to_numpy(dtype='datetime64[s]').astype('int64')
+
+
+def interval_overlaps(left_start, left_end, right_start, right_end):
+    """
+    구간 조인: 왼쪽 구간 각각과 겹치는 오른쪽 구간 쌍
+
+    right_start/right_end: 시작 기준으로 정렬되고 서로 겹치지 않는 구간 (정수 시각)
+    left_start/left_end: 임의 순서의 구간 (정수 시각)
+    반환: (왼쪽 위치, 오른쪽 위치, 겹친 길이) — 겹친 길이가 0보다 큰 쌍만
+    """
+    # 왼쪽 구간마다 겹칠 수 있는 오른쪽 범위 [lo, hi)
+    lo = np.searchsorted(right_end, left_start, side='right')
+    hi = np.searchsorted(right_start, left_end, side='left')
+    counts = np.clip(hi - lo, 0, None)
+
+    left = np.repeat(np.arange(len(left_start)), counts)
+    offset = np.arange(len(left)) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = lo[left] + offset
+    overlap = np.minimum(left_end[left], right_end[right]) - np.maximum(left_start[left], right_start[right])
+    keep = overlap > 0
+    return left[keep], right[keep], overlap[keep]
+
+
+def _group_codes(runs, readings, by_equipment):
+    """설비별 조인 시 가동/기록에 같은 설비 번호 부여 (아니면 모두 0)"""
+    if not by_equipment:
+        return np.zeros(len(runs), dtype='int64'), np.zeros(len(readings), dtype='int64')
+    categories = pd.Index(pd.unique(pd.concat([runs['설비코드'].astype(str), readings['설비코드'].astype(str)])))
+    return (categories.get_indexer(runs['설비코드'].astype(str)).astype('int64'),
+            categories.get_indexer(readings['설비코드'].astype(str)).astype('int64'))
+
+
+def run_energy(power, valid, period=READING_PERIOD):
+    """
+    가동 회차별 전력량 배분
+
+    power: 전처리된 전력 기록 (날짜, 실제전력소비량, 선택: 설비코드)
+    valid: 유효 가동 기록 (설비코드, 설비명, 가동시작_parsed, 가동 시간)
+    반환: RunEnergy — 회차 표는 가동 시작 순서이며, 겹친 전력 기록이 없는 회차의 시간당전력은 결측
+    """
+    by_equipment = '설비코드' in power.columns
+    keys = ['날짜'] + (['설비코드'] if by_equipment else [])
+    readings = (power.groupby(keys, observed=True)['실제전력소비량'].sum()
+                .astype('float64').reset_index())
+    runs = valid[['설비코드', '설비명', '가동시작_parsed', '가동 시간']].reset_index(drop=True)
+    run_group, reading_group = _group_codes(runs, readings, by_equipment)
+
+    # 기록 구간: 설비 번호별로 떼어 놓은 초 단위 시각, [날짜, min(날짜 + period, 다음 기록))
+    reading_start = reading_group * _GROUP_SPAN + _seconds(readings['날짜'])
+    order = np.argsort(reading_start, kind='stable')
+    reading_start, kwh = reading_start[order], readings['실제전력소비량'].to_numpy()[order]
+    next_start = np.append(reading_start[1:], np.iinfo('int64').max)
+    reading_end = np.minimum(reading_start + int(period.total_seconds()), next_start)
+
+    hours = runs['가동 시간'].to_numpy(dtype='float64')
+    run_start = run_group * _GROUP_SPAN + _seconds(runs['가동시작_parsed'])
+    run_end = run_start + np.round(hours * 3600).astype('int64')
+
+    run_pos, reading_pos, overlap = interval_overlaps(run_start, run_end, reading_start, reading_end)
+
+    # 기록마다 겹친 가동시간 비율로 전력량 배분
+    overlap = overlap.astype('float64')
+    covered = np.bincount(reading_pos, weights=overlap, minlength=len(kwh))
+    share = kwh[reading_pos] * overlap / covered[reading_pos]
+    run_kwh = np.bincount(run_pos, weights=share, minlength=len(runs))
+    n_readings = np.bincount(run_pos, minlength=len(runs))
+
+    start = runs['가동시작_parsed']
+    table = pd.DataFrame({
+        '설비코드': runs['설비코드'],
+        '설비명': runs['설비명'],
+        '가동 시작': start,
+        '가동 종료': start + pd.to_timedelta(hours, unit='h'),
+        '가동 시간': hours,
+        '측정 구간 수': n_readings,
+        '전력량': run_kwh,
+        '시간당전력': np.where(n_readings > 0, run_kwh / np.where(hours > 0, hours, np.nan), np.nan),
+    })
+    return RunEnergy(
+        runs=table.sort_values('가동 시작', kind='stable', ignore_index=True),
+        total_kwh=float(kwh.sum()),
+        unattributed_kwh=float(kwh[covered == 0].sum()),
+        by_equipment=by_equipment,
+    )
+
+
+def equipment_energy(runs):
+    """회차 표 -> 설비별 회차 수, 전력량, 가동시간, 시간당 전력 (전력 기록이 겹친 회차만)"""
+    measured = runs[runs['측정 구간 수'] > 0]
+    summary = measured.groupby('설비명', observed=True, sort=True).agg(
+        회차수=('전력량', 'size'), 전력량=('전력량', 'sum'), 가동시간=('가동 시간', 'sum'),
+        회차당전력량=('전력량', 'mean'),
+    )
+    summary['시간당전력'] = summary['전력량'] / summary['가동시간'].where(summary['가동시간'] > 0)
+    return summary.reset_index()
@@ -0,0 +1,50 @@
+"""
+가동시간 집계 큐브 조회
+
+가동 기록을 설비 × 연 × 월 단위로 한 번 집계한 큐브(prepare.aggregate_runtime)에서
+가동 시간 화면의 모든 표/차트/KPI를 잘라냅니다. 큐브 크기는 설비 수 × 개월 수이므로
+설비가 늘어나도 원본 기록 수와 무관하게 가볍습니다.
+"""
+from cerasol.prepare import RUNTIME_KEYS
+
+MONTHS = list(range(1, 13))
+
+
+def yearly_totals(cube):
+    """연도별 총 가동시간"""
+    return cube.groupby('연')['가동시간'].sum().sort_index()
+
+
+def monthly_totals(cube):
+    """연/월별 총 가동시간 (설비 합산)"""
+    return cube.groupby(['연', '월'])['가동시간'].sum()
+
+
+def year_month_table(cube):
+    """연도(행) × 월(열, 1~12월) 가동시간 표"""
+    table = cube.pivot_table(index='연', columns='월', values='가동시간', aggfunc='sum', fill_value=0)
+    return table.reindex(columns=MONTHS, fill_value=0)
+
+
+def equipment_totals(cube):
+    """설비별 총 가동시간 (가동시간 내림차순)"""
+    totals = cube.groupby(['설비코드', '설비명'], observed=True)[['가동시간', '가동횟수']].sum().reset_index()
+    return totals.sort_values('가동시간', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def equipment_year_table(cube):
+    """설비(행) × 연도(열) 가동시간 표"""
+    return cube.pivot_table(index=['설비코드', '설비명'], columns='연', values='가동시간',
+                            aggfunc='sum', fill_value=0, observed=True)
+
+
+def equipment_month_tables(cube):
+    """
+    설비별 연도(행) × 월(열) 가동시간 표를 한 번에 만드는 함수
+
+    반환: (설비코드, 설비명, 연) 인덱스 × 1~12월 컬럼의 DataFrame.
+    설비 하나의 표는 table.loc[(설비코드, 설비명)]로 잘라냅니다.
+    """
+    table = cube.pivot_table(index=RUNTIME_KEYS[:3], columns='월', values='가동시간',
+                             aggfunc='sum', fill_value=0, observed=True)
+    return table.reindex(columns=MONTHS, fill_value=0)
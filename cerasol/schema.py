@@ -0,0 +1,165 @@
+"""
+시트별 선언 스키마
+
+네 시트(설비/냉각수/전력/가동시간)의 컬럼, 자료형, 날짜 형식, 빈 값 허용 여부를 한곳에
+선언하고, 원본 표에 한 번만 적용해 자료형이 정리된 표를 만듭니다. 이후 전처리와 화면은
+변환 없이 이 표를 그대로 씁니다.
+
+변환할 수 없거나 비어 있으면 안 되는 값이 있는 행은 조용히 버리지 않고 제외 목록
+(시트, 행 번호, 컬럼, 값, 사유)에 남깁니다. 행 번호는 머리글을 1행으로 센 시트 행 번호입니다.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from cerasol.timeparse import parse_korean_datetimes
+
+REJECTED_COLUMNS = ['시트', '행 번호', '컬럼', '값', '사유', '처리']
+
+# 시트의 날짜 컬럼(구입일자, 날짜) 형식 — 다른 형식의 값은 변환 실패로 기록
+SHEET_DATE_FORMAT = '%Y-%m-%d'
+
+
+@dataclass
+class Column:
+    """
+    컬럼 하나의 선언
+
+    kind: 'text' | 'number' | 'date' | 'korean_datetime'
+    nullable: 빈 값 허용 여부 (False면 빈 값인 행은 제외)
+    on_error: 변환할 수 없는 값의 처리 — 'reject'(행 제외) 또는 'null'(빈 값으로 두고 행 유지)
+    date_format: date 컬럼의 형식 (None이면 첫 값으로 형식을 추정)
+    thousands: number 컬럼이 문자열일 때 제거할 천 단위 구분 기호
+    parsed_as: 변환 결과를 원본 대신 새 컬럼에 둘 때의 컬럼 이름 (원본 문자열은 그대로 유지)
+    """
+    name: str
+    kind: str = 'text'
+    nullable: bool = True
+    on_error: str = 'reject'
+    date_format: str = None
+    thousands: str = ','
+    parsed_as: str = None
+
+
+@dataclass
+class SheetSchema:
+    """시트 하나의 선언 (columns 순서대로 검사하며, 한 행의 사유는 처음 걸린 컬럼 하나만 기록)"""
+    name: str
+    columns: list = field(default_factory=list)
+
+    @property
+    def required(self):
+        return [col.name for col in self.columns]
+
+
+SCHEMAS = {
+    'equipment': SheetSchema('equipment', [
+        Column('설비코드', 'text'),
+        Column('설비명', 'text'),
+        # 구입일자가 없거나 잘못된 설비는 제외하지 않고 감가상각 지표 0으로 둠
+        Column('구입일자', 'date', on_error='null', date_format=SHEET_DATE_FORMAT),
+        Column('취득원가', 'number', nullable=False),
+    ]),
+    'cooling': SheetSchema('cooling', [
+        Column('날짜', 'date', nullable=False, date_format=SHEET_DATE_FORMAT),
+        Column('사용량', 'number'),
+    ]),
+    'power': SheetSchema('power', [
+        Column('날짜', 'date', nullable=False, date_format=SHEET_DATE_FORMAT),
+        Column('사용량', 'number'),
+    ]),
+    'runtime': SheetSchema('runtime', [
+        Column('설비명', 'text', nullable=False),
+        Column('설비코드', 'text', nullable=False),
+        Column('가동 시작 일시', 'korean_datetime', nullable=False, parsed_as='가동시작_parsed'),
+        Column('가동 시간', 'number', nullable=False),
+    ]),
+}
+
+
+def normalize_columns(raw):
+    """컬럼명 앞뒤 공백 제거"""
+    return raw.rename(columns=lambda c: c.strip() if isinstance(c, str) else c)
+
+
+def _convert(column, values):
+    """컬럼 값 변환. 반환: 변환된 Series (변환 실패는 결측)"""
+    if column.kind == 'number':
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            return values
+        text = values.astype('string').str.strip()
+        if column.thousands:
+            text = text.str.replace(column.thousands, '', regex=False)
+        return pd.to_numeric(text, errors='coerce')
+    if column.kind == 'date':
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        return pd.to_datetime(values, format=column.date_format, errors='coerce')
+    if column.kind == 'korean_datetime':
+        # 날짜 자료형으로 저장된 소스(Parquet, SQLite)는 그대로, 시트 문자열은 한국어 형식으로 파싱
+        if pd.api.types.is_datetime64_any_dtype(values):
+            if isinstance(values.dtype, pd.DatetimeTZDtype):
+                values = values.dt.tz_localize(None)
+            return values.astype('datetime64[ns]')
+        return parse_korean_datetimes(values)
+    return values
+
+
+def _is_blank(values):
+    blank = values.isna()
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        blank |= (values.astype('string').str.strip() == '').fillna(False)
+    return blank.to_numpy(dtype=bool)
+
+
+def apply_schema(name, raw, row_offset=0):
+    """
+    원본 표에 시트 스키마 적용
+
+    raw: 컬럼명 공백을 제거한 원본 표 (필수 컬럼이 모두 있어야 함)
+    row_offset: raw 첫 행의 원본 위치 (증분 수집에서 이어 붙인 행만 넘길 때)
+    반환: (자료형이 정리된 표, 제외/빈 값 처리 목록 DataFrame[REJECTED_COLUMNS])
+    """
+    schema = SCHEMAS[name]
+    typed = raw.copy()
+    keep = np.ones(len(raw), dtype=bool)
+    issues = []
+
+    for column in schema.columns:
+        values = raw[column.name]
+        converted = _convert(column, values)
+        blank = _is_blank(values)
+        failed = converted.isna().to_numpy() & ~blank
+
+        for mask, reason, action in [
+            (blank & (not column.nullable), '빈 값', '제외'),
+            (failed, f"{column.kind} 변환 실패", '제외' if column.on_error == 'reject' else '빈 값으로 처리'),
+        ]:
+            # 이미 다른 컬럼 때문에 제외된 행은 다시 기록하지 않음
+            mask = mask & keep
+            if mask.any():
+                positions = np.flatnonzero(mask)
+                issues.append(pd.DataFrame({
+                    '시트': name,
+                    '행 번호': positions + row_offset + 2,
+                    '컬럼': column.name,
+                    '값': values.iloc[positions].astype('string').fillna('').to_numpy(),
+                    '사유': reason,
+                    '처리': action,
+                }))
+                if action == '제외':
+                    keep &= ~mask
+
+        typed[column.parsed_as or column.name] = converted
+
+    rejected = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=REJECTED_COLUMNS)
+    return typed[keep], rejected.sort_values('행 번호', kind='stable', ignore_index=True)
+
+
+def rejection_summary(rejected):
+    """제외 목록 요약: 시트/컬럼/사유/처리별 행 수"""
+    if rejected is None or len(rejected) == 0:
+        return pd.DataFrame(columns=['시트', '컬럼', '사유', '처리', '행 수'])
+    return (rejected.groupby(['시트', '컬럼', '사유', '처리'], sort=False).size()
+            .rename('행 수').reset_index())
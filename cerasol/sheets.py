@@ -0,0 +1,173 @@
+"""
+구글 시트 CSV 일괄 로드
+
+여러 시트를 스레드 풀에서 동시에 내려받아 한 번의 새로고침 단위로 묶습니다.
+시트별 소요 시간을 함께 기록하므로, 전체 대기 시간은 가장 느린 시트 하나의
+왕복 시간에 가까워집니다.
+
+시트 하나의 요청에는 연결/읽기 제한 시간과 전체 제한 시간(FetchPolicy)을 두어
+응답이 멈춘 시트가 새로고침 전체를 붙잡지 않게 하고, 일시적인 오류(연결 실패,
+제한 시간 초과, 5xx/429 응답)는 간격을 늘려 가며 정해진 횟수만큼 다시 시도합니다.
+"""
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+# 공장 운영 구글 시트 (CSV 내보내기 URL)
+URL_EQUIPMENT = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=0"
+URL_COOLING = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1052812012"
+URL_POWER = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1442513579"
+URL_RUNTIME = "https://docs.google.com/spreadsheets/d/1AdDEm4r3lOpjCzzeksJMiTG5Z2kjmif-xvrKvE5BmSY/export?format=csv&gid=1281696201"
+
+SHEET_URLS = {
+    'equipment': URL_EQUIPMENT,
+    'cooling': URL_COOLING,
+    'power': URL_POWER,
+    'runtime': URL_RUNTIME,
+}
+
+
+@dataclass
+class FetchPolicy:
+    """시트 하나를 내려받을 때의 제한 시간 / 재시도 설정"""
+    connect_timeout: float = 5.0     # 연결 제한 시간(초)
+    read_timeout: float = 20.0       # 응답 조각 사이 최대 대기(초)
+    total_timeout: float = 60.0      # 한 번의 요청 전체 제한 시간(초, 조금씩 흘려보내는 응답 대비)
+    retries: int = 2                 # 실패 시 추가 시도 횟수
+    backoff: float = 1.0             # 첫 재시도 전 대기(초), 이후 두 배씩
+    max_backoff: float = 8.0
+
+
+DEFAULT_POLICY = FetchPolicy()
+
+# 다시 시도해도 되는 HTTP 상태 (서버 쪽 일시 오류 / 요청 제한)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchTimeout(requests.Timeout):
+    """전체 제한 시간 초과"""
+
+
+def download(url, policy=DEFAULT_POLICY):
+    """URL 내용을 바이트로 받는 함수 (연결/읽기/전체 제한 시간 적용)"""
+    deadline = time.monotonic() + policy.total_timeout
+    with requests.get(url, timeout=(policy.connect_timeout, policy.read_timeout), stream=True) as response:
+        response.raise_for_status()
+        chunks = []
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            if time.monotonic() > deadline:
+                raise FetchTimeout(f"전체 제한 시간 {policy.total_timeout:g}초 초과")
+    return b''.join(chunks)
+
+
+def read_sheet(url, policy=DEFAULT_POLICY):
+    """CSV 내보내기 URL(또는 파일/버퍼) 하나를 DataFrame으로 읽는 함수"""
+    if isinstance(url, str) and url.startswith(('http://', 'https://')):
+        return pd.read_csv(io.BytesIO(download(url, policy)), thousands=',')
+    return pd.read_csv(url, thousands=',')
+
+
+def is_retryable(error):
+    """일시적인 오류인지 (연결 실패, 제한 시간 초과, 5xx/429 응답)"""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRY_STATUS
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError))
+
+
+def backoff_delays(policy, rand=random.random):
+    """재시도 전 대기 시간 목록 (지수 증가 + 최대 50% 무작위 지연)"""
+    return [min(policy.backoff * 2 ** i, policy.max_backoff) * (1 + 0.5 * rand()) for i in range(policy.retries)]
+
+
+# 출처 표시 이름
+ORIGIN_LABELS = {'network': '네트워크', 'disk': '로컬 저장소', 'csv': 'CSV', 'parquet': 'Parquet', 'sqlite': 'SQLite'}
+
+
+@dataclass
+class SheetBatch:
+    """한 번의 새로고침으로 받아온 시트 묶음"""
+    frames: dict = field(default_factory=dict)    # 이름 -> DataFrame (실패 시 None)
+    latency: dict = field(default_factory=dict)   # 이름 -> 소요 시간(초)
+    errors: dict = field(default_factory=dict)    # 이름 -> 오류 메시지
+    attempts: dict = field(default_factory=dict)  # 이름 -> 요청 시도 횟수
+    sources: dict = field(default_factory=dict)   # 이름 -> 'network', 'disk' 또는 로컬 소스('csv' 등)
+    sheet_time: dict = field(default_factory=dict)  # 이름 -> 해당 시트 데이터의 수신 시각
+    elapsed: float = 0.0                          # 전체 소요 시간(초)
+    fetched_at: datetime = None
+
+    def status_table(self):
+        """시트별 로드 결과를 표로 반환"""
+        rows = []
+        for name in self.frames:
+            df = self.frames[name]
+            sheet_time = self.sheet_time.get(name)
+            # 이번 새로고침에 실패했지만 마지막으로 성공한 데이터를 대신 보여주는 경우
+            stale = name in self.errors and sheet_time != self.fetched_at
+            rows.append({
+                '시트': name,
+                '상태': '실패' if df is None else '이전 데이터' if stale else '성공',
+                '출처': ORIGIN_LABELS.get(self.sources.get(name), '-'),
+                '데이터 시각': f"{sheet_time:%m-%d %H:%M}" if sheet_time else '-',
+                '행 수': 0 if df is None else len(df),
+                '소요 시간 (ms)': round(self.latency.get(name, 0) * 1000),
+                '시도': self.attempts.get(name, 0),
+                '오류': self.errors.get(name, ''),
+            })
+        return pd.DataFrame(rows)
+
+
+def _timed_read(reader, url, policy, sleep=time.sleep):
+    """시트 하나 읽기 (일시적 오류는 policy에 따라 재시도). 반환: (DataFrame, 소요 시간, 오류, 시도 횟수)"""
+    start = time.perf_counter()
+    delays = backoff_delays(policy)
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return reader(url), time.perf_counter() - start, None, attempt
+        except Exception as e:
+            if attempt > len(delays) or not is_retryable(e):
+                error = f"{type(e).__name__}: {e}" + (f" ({attempt}회 시도)" if attempt > 1 else "")
+                return None, time.perf_counter() - start, error, attempt
+            sleep(delays[attempt - 1])
+
+
+def fetch_sheets(urls, reader=None, max_workers=None, policy=DEFAULT_POLICY, origin='network'):
+    """
+    여러 시트를 동시에 내려받는 함수
+
+    urls: {시트 이름: CSV URL}
+    reader: URL 하나를 읽어 DataFrame을 돌려주는 함수 (기본: policy의 제한 시간을 적용한 read_sheet)
+    policy: 제한 시간 / 재시도 설정 (FetchPolicy)
+    origin: 성공한 시트의 출처 표시 (SheetBatch.sources)
+
+    한 시트가 실패해도 나머지는 그대로 반환하며, 실패한 시트는 None으로 채웁니다.
+    """
+    batch = SheetBatch(fetched_at=datetime.now())
+    if not urls:
+        return batch
+    if reader is None:
+        reader = lambda url: read_sheet(url, policy)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(urls)) as pool:
+        futures = {name: pool.submit(_timed_read, reader, url, policy) for name, url in urls.items()}
+        for name, future in futures.items():
+            df, seconds, error, attempts = future.result()
+            batch.frames[name] = df
+            batch.latency[name] = seconds
+            batch.attempts[name] = attempts
+            if error:
+                batch.errors[name] = error
+            else:
+                batch.sources[name] = origin
+                batch.sheet_time[name] = batch.fetched_at
+    batch.elapsed = time.perf_counter() - start
+    return batch
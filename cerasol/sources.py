@@ -0,0 +1,134 @@
+"""
+데이터 소스
+
+설비/냉각수/전력/가동시간 네 가지 원본 표를 어디서 읽을지 정합니다.
+- sheets: 구글 시트 CSV 내보내기 URL (기본)
+- csv: 로컬 디렉터리의 <이름>.csv (시트에서 내보낸 CSV와 같은 형식)
+- parquet: 로컬 디렉터리의 <이름>.parquet
+- sqlite: SQLite 데이터베이스의 <이름> 테이블 (테이블 이름은 바꿀 수 있음)
+
+모든 소스는 fetch(locations)로 시트 이름별 원본 표 묶음(SheetBatch)을 돌려주므로,
+로컬 저장소/새로고침/전처리/화면은 소스와 관계없이 그대로 동작합니다.
+원본 표는 시트와 같은 컬럼 이름을 가지면 되고, 날짜 컬럼은 시트와 같은 문자열이거나
+날짜 자료형(Parquet timestamp, SQLite에서 DATE/DATETIME/TIMESTAMP로 선언한 컬럼)이면 됩니다.
+"""
+import os
+import sqlite3
+
+import pandas as pd
+
+from cerasol.sheets import DEFAULT_POLICY, SHEET_URLS, fetch_sheets, read_sheet
+
+SOURCE_KINDS = ['sheets', 'csv', 'parquet', 'sqlite']
+
+# SQLite에서 날짜로 읽을 선언 자료형
+SQLITE_DATE_TYPES = ('DATE', 'DATETIME', 'TIMESTAMP')
+
+
+class DataSource:
+    """
+    구글 시트 CSV 내보내기 소스 (다른 소스의 기본 클래스)
+
+    locations: {시트 이름: 위치} — 소스마다 URL, 파일 경로, 테이블 이름
+    """
+    kind = 'sheets'
+    origin = 'network'   # SheetBatch.sources에 기록할 출처
+
+    def __init__(self, locations, policy=DEFAULT_POLICY):
+        self.locations = dict(locations)
+        self.policy = policy
+
+    def read(self, location):
+        """위치 하나를 원본 DataFrame으로 읽기"""
+        return read_sheet(location, self.policy)
+
+    def fetch(self, locations=None):
+        """여러 표를 동시에 읽어 SheetBatch로 반환 (SheetCache의 fetch로 사용)"""
+        return fetch_sheets(self.locations if locations is None else locations,
+                            reader=self.read, policy=self.policy, origin=self.origin)
+
+    def describe(self):
+        return "구글 시트"
+
+
+class CsvDirSource(DataSource):
+    """디렉터리의 <이름>.csv 파일 (천 단위 쉼표 포함, 시트 CSV 내보내기와 같은 형식)"""
+    kind = origin = 'csv'
+
+    def __init__(self, root, names=SHEET_URLS, policy=DEFAULT_POLICY):
+        super().__init__({name: os.path.join(root, f"{name}.csv") for name in names}, policy)
+        self.root = root
+
+    def read(self, location):
+        return read_sheet(location)
+
+    def describe(self):
+        return f"CSV 디렉터리 ({self.root})"
+
+
+class ParquetSource(DataSource):
+    """디렉터리의 <이름>.parquet 파일"""
+    kind = origin = 'parquet'
+
+    def __init__(self, root, names=SHEET_URLS, policy=DEFAULT_POLICY):
+        super().__init__({name: os.path.join(root, f"{name}.parquet") for name in names}, policy)
+        self.root = root
+
+    def read(self, location):
+        return pd.read_parquet(location)
+
+    def describe(self):
+        return f"Parquet 디렉터리 ({self.root})"
+
+
+class SQLiteSource(DataSource):
+    """
+    SQLite 데이터베이스의 테이블
+
+    tables: {시트 이름: 테이블 이름} — 지정하지 않은 시트는 시트 이름과 같은 테이블
+    """
+    kind = origin = 'sqlite'
+
+    def __init__(self, path, tables=None, names=SHEET_URLS, policy=DEFAULT_POLICY):
+        tables = dict(tables or {})
+        super().__init__({name: tables.get(name, name) for name in names}, policy)
+        self.path = path
+
+    def read(self, location):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        table = '"' + location.replace('"', '""') + '"'
+        # 읽기 전용 연결 (스레드마다 따로 열고 닫음)
+        with sqlite3.connect(f"file:{self.path}?mode=ro", uri=True) as conn:
+            columns = conn.execute(f"PRAGMA table_info({table})").fetchall()
+            if not columns:
+                raise LookupError(f"테이블 없음: {location}")
+            dates = [col[1] for col in columns if col[2].upper().startswith(SQLITE_DATE_TYPES)]
+            return pd.read_sql_query(f"SELECT * FROM {table}", conn, parse_dates=dates or None)
+
+    def describe(self):
+        return f"SQLite ({self.path})"
+
+
+def make_source(config=None, urls=SHEET_URLS, policy=DEFAULT_POLICY):
+    """
+    설정으로 소스 만들기
+
+    config: {'kind': 'sheets' | 'csv' | 'parquet' | 'sqlite', 'path': 경로, 'tables': {...}}
+            (secrets.toml의 [source] 표, 비어 있으면 구글 시트)
+    urls: sheets 소스의 시트 이름별 URL
+    """
+    config = dict(config or {})
+    kind = config.get('kind', 'sheets')
+    if kind not in SOURCE_KINDS:
+        raise ValueError(f"알 수 없는 데이터 소스: {kind} (가능: {', '.join(SOURCE_KINDS)})")
+    if kind == 'sheets':
+        return DataSource(urls, policy)
+    path = config.get('path')
+    if not path:
+        raise ValueError(f"{kind} 소스에는 path가 필요합니다.")
+    if kind == 'csv':
+        return CsvDirSource(path, names=urls, policy=policy)
+    if kind == 'parquet':
+        return ParquetSource(path, names=urls, policy=policy)
+    return SQLiteSource(path, tables=config.get('tables'), names=urls, policy=policy)
@@ -0,0 +1,172 @@
+"""
+시트 로컬 저장소 및 stale-while-revalidate 캐시
+
+내려받은 시트를 Parquet 파일로 보관하여, 서버를 재시작하거나 구글 응답이 느릴 때도
+마지막으로 성공한 데이터를 즉시 보여줍니다. 만료된 데이터는 그대로 제공하면서
+백그라운드에서 새로 받아 교체하며, 오프라인 모드에서는 로컬 저장소만 읽습니다.
+"""
+import os
+import threading
+import time
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cerasol.sheets import SheetBatch, fetch_sheets
+
+_FETCHED_AT_KEY = b'cerasol.fetched_at'
+
+
+class SheetStore:
+    """시트별 Parquet 파일 저장소 (파일 하나에 데이터와 수신 시각을 함께 기록)"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, name):
+        return os.path.join(self.root, f"{name}.parquet")
+
+    def save(self, name, df, fetched_at):
+        """임시 파일에 쓴 뒤 교체하여, 읽는 쪽이 쓰다 만 파일을 보지 않도록 저장"""
+        os.makedirs(self.root, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_FETCHED_AT_KEY] = fetched_at.isoformat().encode()
+        table = table.replace_schema_metadata(metadata)
+
+        tmp_path = f"{self.path(name)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, self.path(name))
+
+    def load(self, name):
+        """저장된 시트 읽기. 반환: (DataFrame, 수신 시각) — 없으면 (None, None)"""
+        try:
+            table = pq.read_table(self.path(name))
+        except (FileNotFoundError, OSError, pa.ArrowInvalid):
+            return None, None
+        raw = (table.schema.metadata or {}).get(_FETCHED_AT_KEY)
+        fetched_at = datetime.fromisoformat(raw.decode()) if raw else None
+        return table.to_pandas(), fetched_at
+
+
+class SheetCache:
+    """
+    서버 전체가 공유하는 시트 캐시
+
+    snapshot()은 항상 즉시 반환합니다.
+    - 메모리 스냅샷이 max_age보다 오래되면 현재 스냅샷을 반환하고 백그라운드에서 새로고침
+    - 메모리에 없으면 로컬 저장소에서 읽고, 저장소도 비어 있을 때만 직접 내려받음
+    - offline=True이면 네트워크를 사용하지 않고 로컬 저장소만 읽음
+    """
+
+    def __init__(self, store, urls, max_age=600, offline=False, fetch=fetch_sheets):
+        self.store = store
+        self.urls = urls
+        self.max_age = max_age
+        self.offline = offline
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()   # 새로고침은 한 번에 하나만
+        self._refreshing = False
+        self._snapshot = None
+        self._loaded_at = 0.0   # 스냅샷 갱신 시각 (time.monotonic)
+
+    def snapshot(self):
+        """현재 시트 묶음 반환 (필요 시 백그라운드 새로고침 시작)"""
+        self.local_snapshot()
+
+        if self.offline:
+            return self._snapshot
+
+        if not self._snapshot.frames:
+            # 로컬 저장소가 비어 있는 최초 실행: 직접 내려받아야 보여줄 것이 있음
+            with self._refresh_lock:
+                if not self._snapshot.frames:
+                    self._refresh()
+        elif time.monotonic() - self._loaded_at > self.max_age:
+            self.refresh_async()
+        return self._snapshot
+
+    def local_snapshot(self):
+        """네트워크 없이 현재 시트 묶음 반환 (메모리에 없으면 로컬 저장소에서 읽음)"""
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load_local()
+                    self._loaded_at = self._local_loaded_at(self._snapshot)
+        return self._snapshot
+
+    def age(self):
+        """현재 스냅샷의 나이(초) — 저장소에서 읽은 데이터는 가장 오래된 시트의 수신 시각 기준"""
+        return time.monotonic() - self._loaded_at
+
+    def _is_complete(self, batch):
+        return batch is not None and all(batch.frames.get(name) is not None for name in self.urls)
+
+    def _local_loaded_at(self, batch):
+        """저장소 데이터의 나이를 반영한 갱신 시각 (가장 오래된 시트 기준, 누락 시 즉시 만료)"""
+        times = [batch.sheet_time.get(name) for name in self.urls]
+        if not self._is_complete(batch) or any(t is None for t in times):
+            return float('-inf')
+        age = (datetime.now() - min(times)).total_seconds()
+        return time.monotonic() - max(age, 0.0)
+
+    def _load_local(self):
+        batch = SheetBatch(fetched_at=datetime.now())
+        for name in self.urls:
+            df, fetched_at = self.store.load(name)
+            if df is not None:
+                batch.frames[name] = df
+                batch.sources[name] = 'disk'
+                batch.sheet_time[name] = fetched_at
+        return batch
+
+    def refresh_async(self):
+        """백그라운드 스레드에서 새로고침 (이미 진행 중이면 무시)"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_worker, name='sheet-refresh', daemon=True).start()
+
+    def _refresh_worker(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh(self):
+        """지금 바로 새로고침 (호출한 스레드에서 실행)"""
+        with self._refresh_lock:
+            self._refresh()
+
+    def _refresh(self):
+        fresh = self._fetch(self.urls)
+        previous = self._snapshot or SheetBatch()
+
+        # 성공한 시트는 저장소에 기록, 실패한 시트는 이전 데이터를 유지
+        merged = SheetBatch(fetched_at=fresh.fetched_at, elapsed=fresh.elapsed,
+                            latency=dict(fresh.latency), errors=dict(fresh.errors),
+                            attempts=dict(fresh.attempts))
+        for name in self.urls:
+            df = fresh.frames.get(name)
+            if df is not None:
+                merged.frames[name] = df
+                merged.sources[name] = fresh.sources.get(name, 'network')
+                merged.sheet_time[name] = fresh.fetched_at
+                try:
+                    self.store.save(name, df, fresh.fetched_at)
+                except Exception as e:
+                    merged.errors[name] = f"로컬 저장 실패 - {type(e).__name__}: {e}"
+            elif previous.frames.get(name) is not None:
+                merged.frames[name] = previous.frames[name]
+                merged.sources[name] = previous.sources.get(name, 'disk')
+                merged.sheet_time[name] = previous.sheet_time.get(name)
+            else:
+                merged.frames[name] = None
+
+        # 참조 교체는 원자적이므로 읽는 쪽은 이전 또는 새 스냅샷 중 하나만 보게 됨
+        self._snapshot = merged
+        self._loaded_at = time.monotonic()
@@ -0,0 +1,186 @@
+"""
+한국어 날짜 파싱
+
+구글 시트에서 내보낸 '2023. 6. 28 오후 4:00:00' 형식의 가동 시작 일시를 파싱합니다.
+행마다 파이썬 함수를 호출하는 대신 정규식 추출과 정수 연산으로 컬럼 전체를 한 번에
+변환하며, 결과는 행 단위 파서(parse_korean_datetime)와 동일합니다.
+
+시트 CSV 내보내기의 기본 형식('YYYY. M. D 오전/오후 h:mm:ss')은 pyarrow strptime으로 먼저
+변환하고(빠른 경로), 기본 형식이 아니거나 strptime 결과를 믿을 수 없는 값만 정규식으로 다시
+파싱합니다. 초 단위로 거의 모두 다른 값 1백만 건에 약 0.7~1.1초입니다 (bench/bench_timeparse.py).
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 년. 월. 일 [오전|오후] 시:분[:초]
+KOREAN_DATETIME_PATTERN = (
+    r'^\s*(?P<year>\d+)\s*\.\s*(?P<month>\d+)\s*\.\s*(?P<day>\d+)\s*\.?\s*'
+    r'(?P<ampm>오전|오후)?\s*(?P<hour>\d+):(?P<minute>\d+)(?::(?P<second>\d+))?\s*$'
+)
+
+# 빠른 경로 형식 (오전/오후를 AM/PM으로 바꾼 뒤 적용)
+CANONICAL_FORMAT = '%Y. %m. %d %p %I:%M:%S'
+
+# datetime64[ns]로 표현할 수 있는 연도 범위 (정규식 경로와 같은 기준)
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+
+
+def parse_korean_datetime(date_str):
+    """
+    '2023. 6. 28 오후 4:00:00' 형식의 한국어 날짜를 파싱 (행 단위 기준 구현)
+
+    오전/오후 표기가 없으면 오전으로 간주하며, 해석할 수 없는 값은 NaT를 반환합니다.
+    """
+    if pd.isna(date_str):
+        return pd.NaT
+
+    try:
+        date_str = str(date_str).strip()
+
+        # 오전/오후 처리
+        is_pm = '오후' in date_str
+        date_str = date_str.replace('오전', '').replace('오후', '').strip()
+
+        # "2023. 6. 28  4:00:00" 형태로 변환됨
+        parts = date_str.split()
+        date_parts = ' '.join(parts[:-1])
+        time_part = parts[-1]
+
+        date_nums = date_parts.replace('.', ' ').split()
+        year = int(date_nums[0])
+        month = int(date_nums[1])
+        day = int(date_nums[2])
+
+        time_parts = time_part.split(':')
+        hour = int(time_parts[0])
+        minute = int(time_parts[1])
+        second = int(time_parts[2]) if len(time_parts) > 2 else 0
+
+        # 오후 처리 (12시 제외)
+        if is_pm and hour != 12:
+            hour += 12
+        elif not is_pm and hour == 12:
+            hour = 0
+
+        return datetime(year, month, day, hour, minute, second)
+
+    except Exception:
+        return pd.NaT
+
+
+def _extract_parts(values):
+    """정규식으로 년/월/일/오전오후/시/분/초를 추출해 숫자 배열로 반환 (pyarrow 우선)"""
+    numeric = ['year', 'month', 'day', 'hour', 'minute', 'second']
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        parts = pd.Series(values, dtype=object).str.extract(KOREAN_DATETIME_PATTERN)
+        out = {name: pd.to_numeric(parts[name], errors='coerce').to_numpy(dtype='float64') for name in numeric}
+        out['ampm'] = parts['ampm'].to_numpy(dtype=object)
+        return out
+
+    matched = pc.extract_regex(pa.array(values, type=pa.string()), KOREAN_DATETIME_PATTERN)
+    out = {}
+    for name in numeric:
+        col = pc.struct_field(matched, name)
+        # 선택 그룹(초)이 비어 있으면 빈 문자열이 나오므로 null로 바꾼 뒤 숫자 변환
+        col = pc.if_else(pc.equal(col, ''), pa.scalar(None, pa.string()), col)
+        out[name] = pc.cast(col, pa.float64()).to_numpy(zero_copy_only=False)
+    out['ampm'] = pc.struct_field(matched, 'ampm').to_numpy(zero_copy_only=False)
+    return out
+
+
+def _parse_regex(values):
+    """문자열 배열을 datetime64[ns] 배열로 변환 (정규식 + 정수 연산)"""
+    parts = _extract_parts(values)
+
+    year, month, day = parts['year'], parts['month'], parts['day']
+    hour, minute = parts['hour'], parts['minute']
+    second = np.nan_to_num(parts['second'], nan=0.0)
+
+    # 12시간제 -> 24시간제 (오후 12시는 그대로, 오전 12시는 0시)
+    is_pm = parts['ampm'] == '오후'
+    hour = np.where(is_pm & (hour != 12), hour + 12, hour)
+    hour = np.where(~is_pm & (hour == 12), 0, hour)
+
+    # 월 시작일 + (일 - 1), 말일을 넘는 날짜(2월 30일 등)는 무효 처리
+    valid = (
+        (year >= _MIN_YEAR) & (year <= _MAX_YEAR) & (month >= 1) & (month <= 12) & (day >= 1)
+        & (hour >= 0) & (hour < 24) & (minute >= 0) & (minute < 60) & (second < 60)
+    )
+    months = np.where(valid, (year - 1970) * 12 + (month - 1), 0).astype('int64')
+    month_start = months.astype('datetime64[M]').astype('datetime64[D]')
+    month_days = ((months + 1).astype('datetime64[M]').astype('datetime64[D]') - month_start).astype('int64')
+    valid &= day <= month_days
+
+    days = month_start.astype('int64') + np.where(valid, day - 1, 0).astype('int64')
+    seconds = days * 86400 + np.where(valid, hour * 3600 + minute * 60 + second, 0).astype('int64')
+    result = (seconds * 1_000_000_000).astype('datetime64[ns]')
+    result[~valid] = np.datetime64('NaT')
+    return result
+
+
+def _parse_canonical(values):
+    """
+    기본 형식 빠른 경로 (pyarrow strptime)
+
+    반환: (datetime64[ns] 배열, 정규식으로 다시 파싱할 위치 마스크)
+    - 기본 형식이 아니면(오전/오후 없음, 초 없음, 앞뒤 공백 등) strptime 결과가 null
+    - strptime은 말일을 넘긴 날짜(2월 30일)를 다음 달로 넘기므로 결과가 1~3일이면 재확인
+    - 원본에 AM/PM 글자가 있으면 오전/오후 변환과 섞이므로 재확인
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    text = pc.replace_substring(pc.replace_substring(values, '오후', 'PM'), '오전', 'AM')
+    parsed = pc.strptime(text, format=CANONICAL_FORMAT, unit='s', error_is_null=True)
+    year = pc.year(parsed)
+    recheck = pc.or_kleene(
+        pc.or_kleene(pc.less_equal(pc.day(parsed), 3), pc.match_substring(values, 'M')),
+        pc.or_kleene(pc.less(year, _MIN_YEAR), pc.greater(year, _MAX_YEAR)),
+    )
+    recheck = pc.fill_null(recheck, True)
+    # 재확인 대상(범위 밖 연도 포함)은 0으로 채운 뒤 ns로 변환 — 값은 정규식 결과로 덮어씀
+    parsed = pc.if_else(recheck, pa.scalar(0, parsed.type), parsed)
+    result = parsed.cast(pa.timestamp('ns')).to_numpy(zero_copy_only=False).astype('datetime64[ns]')
+    return result, recheck.to_numpy(zero_copy_only=False)
+
+
+def _parse_unique(values):
+    """고유 문자열 배열을 datetime64[ns] 배열로 변환 (빠른 경로 + 나머지는 정규식)"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return _parse_regex(np.asarray(values, dtype=object))
+
+    array = pa.array(values, type=pa.string(), from_pandas=True)
+    result, recheck = _parse_canonical(array)
+    if recheck.any():
+        positions = np.flatnonzero(recheck)
+        result[positions] = _parse_regex(array.take(positions).to_numpy(zero_copy_only=False))
+    return result
+
+
+def parse_korean_datetimes(values):
+    """
+    한국어 날짜 컬럼 전체를 한 번에 파싱하는 함수
+
+    values: Series 또는 배열
+    반환: 입력과 같은 인덱스의 datetime64[ns] Series
+
+    가동 시작 일시는 같은 문자열이 반복되는 경우가 많으므로 고유값만 파싱한 뒤
+    원래 위치로 되돌립니다.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    codes, uniques = pd.factorize(series, sort=False)
+
+    # 문자열이 아닌 값(숫자 등)은 행 단위 파서와 동일하게 str()로 변환 (벡터화)
+    uniques = pd.Index(uniques).astype(str)
+    parsed = _parse_unique(uniques) if len(uniques) else np.array([], dtype='datetime64[ns]')
+    out = np.full(len(series), np.datetime64('NaT'), dtype='datetime64[ns]')
+    mask = codes >= 0
+    out[mask] = parsed[codes[mask]]
+    return pd.Series(out, index=series.index, name=series.name)
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from cerasol.anomaly import ANOMALY_COLUMNS, STATE_COLUMNS, detect_anomalies, flagged_days
+from cerasol.incremental import IncrementalIngest
+from cerasol.prepare import prepare_all
+
+
+def test_detect_anomalies_empty_series():
+    empty = pd.DataFrame({'날짜': pd.Series(dtype='datetime64[ns]'), '값': pd.Series(dtype='float64')})
+    table = detect_anomalies(empty)
+    assert list(table.columns) == ANOMALY_COLUMNS + STATE_COLUMNS
+    assert len(table) == 0
+    assert len(flagged_days(table)) == 0
+
+
+def test_header_only_usage_sheets():
+    # 머리글만 있거나 모든 행이 제외된 냉각수/전력 시트도 전처리가 끝나야 함
+    frames = {
+        'cooling': pd.DataFrame({'날짜': pd.Series(dtype=str), '사용량': pd.Series(dtype='int64')}),
+        'power': pd.DataFrame({'날짜': ['', '잘못된 날짜'], '사용량': [10, 20]}),
+    }
+    for ingest in [None, IncrementalIngest()]:
+        data = prepare_all(frames, ingest=ingest)
+        assert len(data.anomalies['cooling']) == 0
+        assert len(data.anomalies['power']) == 0
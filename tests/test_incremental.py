@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from bench.synthetic import make_frames
+from cerasol.incremental import IncrementalIngest
+from cerasol.prepare import AGGREGATE_KEYS, prepare_all
+
+
+def _sorted(df, keys):
+    return df.sort_values(keys, ignore_index=True).reset_index(drop=True)
+
+
+def _assert_same(incremental, full):
+    """증분 수집 결과가 전체 재계산과 같은지 (월별 집계, 이상치, 행 수)"""
+    assert set(incremental.monthly) == set(full.monthly)
+    for key, expected in full.monthly.items():
+        keys = AGGREGATE_KEYS[key]
+        pd.testing.assert_frame_equal(_sorted(incremental.monthly[key], keys), _sorted(expected, keys),
+                                      check_dtype=False, check_categorical=False)
+    for name, expected in full.anomalies.items():
+        pd.testing.assert_frame_equal(incremental.anomalies[name].reset_index(drop=True), expected,
+                                      check_dtype=False)
+    assert len(incremental.cooling) == len(full.cooling)
+    assert len(incremental.runtime_valid) == len(full.runtime_valid)
+
+
+@pytest.fixture(scope='module')
+def frames():
+    return make_frames(3_000, seed=7)
+
+
+def _head(frames, n):
+    return {name: df if name == 'equipment' else df.iloc[:n] for name, df in frames.items()}
+
+
+def test_append_matches_full_recompute(frames):
+    ingest = IncrementalIngest()
+    prepare_all(_head(frames, 2_000), ingest=ingest)
+    assert {name: state.mode for name, state in ingest.states.items()} == \
+        {'cooling': 'full', 'power': 'full', 'runtime': 'full'}
+
+    data = prepare_all(frames, ingest=ingest)
+    assert {name: (state.mode, state.new_rows) for name, state in ingest.states.items()} == \
+        {'cooling': ('append', 1_000), 'power': ('append', 1_000), 'runtime': ('append', 1_000)}
+    _assert_same(data, prepare_all(frames))
+
+
+def test_unchanged_sheet_keeps_state(frames):
+    ingest = IncrementalIngest()
+    first = prepare_all(frames, ingest=ingest)
+    states = dict(ingest.states)
+
+    again = prepare_all(frames, ingest=ingest)
+    for name, state in ingest.states.items():
+        assert (state.mode, state.new_rows) == ('unchanged', 0)
+        assert state.prepared is states[name].prepared
+    _assert_same(again, first)
+
+
+def test_edited_rows_trigger_full_recompute(frames):
+    ingest = IncrementalIngest()
+    prepare_all(frames, ingest=ingest)
+
+    edited = dict(frames)
+    edited['cooling'] = frames['cooling'].copy()
+    edited['cooling'].loc[10, '사용량'] += 5
+    edited['power'] = frames['power'].iloc[:-1]
+    data = prepare_all(edited, ingest=ingest)
+
+    assert ingest.states['cooling'].mode == 'full'
+    assert ingest.states['cooling'].reason.startswith('기존 행 수정')
+    assert ingest.states['power'].reason.startswith('행 삭제')
+    assert ingest.states['runtime'].mode == 'unchanged'
+    _assert_same(data, prepare_all(edited))
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cerasol.monthsplit import split_runs_by_month, split_runtime_by_month
+
+
+def _reference(starts, ends, hours):
+    """행 단위 기준 구현을 가동마다 호출한 결과 (run, 연, 월, 가동 시간)"""
+    rows = []
+    for run, (start, end, total) in enumerate(zip(starts, ends, hours)):
+        for part in split_runtime_by_month(start, end, total):
+            rows.append({'run': run, **part})
+    return pd.DataFrame(rows, columns=['run', '연', '월', '가동 시간'])
+
+
+def test_matches_row_wise_reference():
+    rng = np.random.default_rng(3)
+    n = 2_000
+    starts = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 3 * 365 * 24 * 60, n), unit='m')
+    hours = rng.integers(1, 2_000, n).astype('float64')
+    ends = starts + pd.to_timedelta(hours, unit='h')
+    starts, ends = list(starts.to_pydatetime()), list(ends.to_pydatetime())
+    # 경계 사례: 월초 0시 종료, 말일 23:59:59 직후, 윤년 2월, 연말, 가동시간 0, 종료가 시작 이전
+    starts += [datetime(2024, 1, 31, 12), datetime(2024, 3, 31, 23, 59, 59), datetime(2024, 2, 28),
+               datetime(2024, 12, 31, 20), datetime(2024, 5, 1), datetime(2024, 5, 2)]
+    ends += [datetime(2024, 2, 1), datetime(2024, 4, 1, 1), datetime(2024, 3, 2),
+             datetime(2025, 1, 1, 4), datetime(2024, 5, 2), datetime(2024, 5, 1)]
+    hours = list(hours) + [12.0, 1.0, 48.0, 8.0, 0.0, 5.0]
+
+    expected = _reference(starts, ends, hours)
+    result = split_runs_by_month(starts, ends, hours)
+
+    assert result['run'].tolist() == expected['run'].tolist()
+    assert result['연'].tolist() == expected['연'].tolist()
+    assert result['월'].tolist() == expected['월'].tolist()
+    np.testing.assert_allclose(result['가동 시간'], expected['가동 시간'], rtol=1e-9)
+    # 시작월 행은 가동마다 최대 하나 (말일 23:59:59에 시작하면 시작 월 몫이 0이라 없음)
+    assert result.groupby('run')['시작월'].sum().le(1).all()
+
+
+def test_missing_values_are_skipped():
+    result = split_runs_by_month([pd.NaT, datetime(2024, 1, 1)], [datetime(2024, 1, 2), pd.NaT], [5.0, 5.0])
+    assert len(result) == 0
@@ -0,0 +1,33 @@
+import numpy as np
+
+from cerasol.runenergy import interval_overlaps
+
+
+def _brute_force(left_start, left_end, right_start, right_end):
+    pairs = []
+    for i in range(len(left_start)):
+        for j in range(len(right_start)):
+            overlap = min(left_end[i], right_end[j]) - max(left_start[i], right_start[j])
+            if overlap > 0:
+                pairs.append((i, j, overlap))
+    return pairs
+
+
+def test_interval_overlaps_matches_brute_force():
+    rng = np.random.default_rng(5)
+    # 오른쪽: 정렬되고 겹치지 않는 구간 (사이에 빈 구간 포함), 왼쪽: 임의 순서·길이 (길이 0 포함)
+    bounds = np.sort(rng.choice(10_000, 400, replace=False))
+    right_start, right_end = bounds[0::2], bounds[1::2]
+    left_start = rng.integers(-100, 10_100, 300)
+    left_end = left_start + rng.integers(0, 500, 300)
+
+    left, right, overlap = interval_overlaps(left_start, left_end, right_start, right_end)
+    result = sorted(zip(left.tolist(), right.tolist(), overlap.tolist()))
+    assert result == sorted(_brute_force(left_start, left_end, right_start, right_end))
+
+
+def test_interval_overlaps_touching_edges():
+    # 끝점만 맞닿은 구간은 겹치지 않음
+    left, right, overlap = interval_overlaps(np.array([10, 0]), np.array([20, 10]),
+                                             np.array([0, 20]), np.array([10, 30]))
+    assert list(zip(left, right, overlap)) == [(1, 0, 10)]
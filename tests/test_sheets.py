@@ -0,0 +1,88 @@
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer
+
+from bench.sheet_server import make_handler
+from cerasol.sheets import FetchPolicy, fetch_sheets
+from cerasol.store import SheetCache, SheetStore
+
+BODIES = {
+    'cooling': '날짜,사용량\n2024-01-01,"1,200"\n2024-01-02,900\n'.encode('utf-8'),
+    'power': '날짜,사용량\n2024-01-01,300\n'.encode('utf-8'),
+}
+
+# 테스트용 빠른 재시도 (대기 0.01초부터)
+FAST_POLICY = FetchPolicy(connect_timeout=1.0, read_timeout=1.0, total_timeout=5.0, retries=2,
+                          backoff=0.01, max_backoff=0.05)
+
+
+@contextmanager
+def sheet_server(**options):
+    """로컬 시트 서버를 빈 포트에서 실행하고 시트 이름 -> URL 반환"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(BODIES, **options))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        yield {name: f"http://127.0.0.1:{port}/{name}.csv" for name in BODIES}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retries_transient_errors():
+    with sheet_server(fail=2, status=503) as urls:
+        batch = fetch_sheets(urls, policy=FAST_POLICY)
+    assert batch.errors == {}
+    assert batch.attempts == {'cooling': 3, 'power': 3}
+    assert batch.frames['cooling']['사용량'].tolist() == [1200, 900]
+
+
+def test_reports_error_after_retries():
+    with sheet_server(fail=-1, status=503) as urls:
+        batch = fetch_sheets(urls, policy=FAST_POLICY)
+    table = batch.status_table().set_index('시트')
+    assert table.loc['cooling', '상태'] == '실패'
+    assert table.loc['cooling', '시도'] == 3
+    assert '503' in table.loc['cooling', '오류']
+    assert batch.frames['cooling'] is None
+
+
+def test_does_not_retry_client_errors():
+    with sheet_server(fail=-1, status=404) as urls:
+        batch = fetch_sheets(urls, policy=FAST_POLICY)
+    assert batch.attempts == {'cooling': 1, 'power': 1}
+    assert '404' in batch.errors['power']
+
+
+def test_stalled_response_times_out():
+    policy = FetchPolicy(connect_timeout=1.0, read_timeout=0.2, total_timeout=5.0, retries=0)
+    with sheet_server(stall=1.5) as urls:
+        batch = fetch_sheets(urls, policy=policy)
+    assert set(batch.errors) == {'cooling', 'power'}
+    assert all(batch.frames[name] is None for name in urls)
+    assert max(batch.latency.values()) < 1.5
+
+
+def test_cache_keeps_last_good_data(tmp_path):
+    fetch = functools.partial(fetch_sheets, policy=FAST_POLICY)
+    with sheet_server() as urls:
+        cache = SheetCache(SheetStore(str(tmp_path)), urls, fetch=fetch)
+        good = cache.snapshot()
+    assert good.errors == {}
+
+    with sheet_server(fail=-1, status=503) as failing_urls:
+        cache.urls = failing_urls
+        cache.refresh()
+        snapshot = cache.snapshot()
+
+    assert snapshot.frames['cooling'].equals(good.frames['cooling'])
+    assert snapshot.sheet_time['cooling'] == good.fetched_at
+    table = snapshot.status_table().set_index('시트')
+    assert table.loc['cooling', '상태'] == '이전 데이터'
+    assert '503' in table.loc['cooling', '오류']
+
+    # 재시작 후에는 로컬 저장소에서 마지막 데이터를 읽음
+    restarted = SheetCache(SheetStore(str(tmp_path)), failing_urls, offline=True)
+    assert restarted.snapshot().frames['power'].equals(good.frames['power'])